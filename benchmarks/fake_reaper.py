@@ -0,0 +1,198 @@
+# benchmarks/fake_reaper.py
+"""
+Stand-in for REAPER running wrb_command_listener.lua.
+
+Serves the bridge's file-queue command channel from a background thread,
+so the channel (and anything dispatching through it) can be exercised
+without REAPER. Script behaviour is pluggable via `scripts`;
+`render_script` emulates wrb_export_tracks.lua.
+"""
+from __future__ import annotations
+import itertools
+import re
+import sys
+import threading
+import time
+import wave
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "wwise_reaper_bridge"))
+
+from utils.reaper_channel import HEARTBEAT_NAME, format_response, parse_request, write_atomic  # noqa: E402
+from utils.render_request import parse_render_request  # noqa: E402
+from utils.wav_info import expected_from_render_format  # noqa: E402
+
+# script file name -> handler(args) -> (ok, values, error)
+ScriptHandler = Callable[[Dict[str, str]], Tuple[bool, Optional[Dict[str, str]], str]]
+
+
+def manifest_names(manifest_txt: Path) -> list[str]:
+    """Track names wrb_open_wwiseobj_in_reaper.lua creates: render_name, else last path component."""
+    names = []
+    for line in Path(manifest_txt).read_text(encoding="utf-8").splitlines():
+        fields = [f.strip() for f in line.split("|")]
+        wwise_path = fields[0]
+        render_name = fields[2] if len(fields) > 2 else ""
+        if wwise_path:
+            names.append(render_name or re.split(r"[\\/]", wwise_path)[-1])
+    return names
+
+
+def write_wav(path: Path, seconds: float, sample_rate: int = 48000, bits: int = 24,
+              channels: int = 1, seed: int = 0) -> None:
+    frames = max(1, int(seconds * sample_rate))
+    width = bits // 8
+    # Deterministic, seed-dependent content so the render hash changes between runs
+    pattern = bytes((seed + i) & 0xFF for i in range(251))
+    size = frames * width * channels
+    data = (pattern * (size // len(pattern) + 1))[:size]
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(width)
+        w.setframerate(sample_rate)
+        w.writeframes(data)
+
+
+_render_runs = itertools.count(1)
+
+
+def render_script(render_dir: Path,
+                  manifest_txt: Path,
+                  seconds: float = 0.01,
+                  per_file_delay: float = 0.0,
+                  vary: bool = True,
+                  request_path: Optional[Path] = None) -> ScriptHandler:
+    """
+    Handler emulating wrb_export_tracks.lua: answers at once (the real script
+    defers its work too), then writes one WAV per manifest track into
+    `render_dir`, appending to progress.log, and finally success.flag.
+    A render request at `request_path` can name another folder, limit the
+    tracks that are rendered and set the bit depth (render format).
+    """
+    def render(seed: int) -> None:
+        out_dir = render_dir
+        bits = 24
+        names = manifest_names(manifest_txt)
+        if request_path is not None and request_path.exists():
+            request = parse_render_request(request_path.read_text(encoding="utf-8"))
+            if request.render_dir:
+                out_dir = Path(request.render_dir)
+            if request.render_format:
+                bits = expected_from_render_format(request.render_format).bits or bits
+            if request.tracks is not None:
+                wanted = set(request.tracks)
+                names = [n for n in names if n in wanted]
+        out_dir.mkdir(parents=True, exist_ok=True)
+        log_path = out_dir / "progress.log"
+        with open(log_path, "a", encoding="utf-8") as log:
+            log.write(f"total|{len(names)}\n")
+            log.flush()
+            for name in names:
+                write_wav(out_dir / f"{name}.wav", seconds, bits=bits, seed=seed)
+                log.write(f"rendered|{name}\n")
+                log.flush()
+                if per_file_delay:
+                    time.sleep(per_file_delay)
+        (out_dir / "success.flag").touch()
+
+    def handler(args: Dict[str, str]) -> Tuple[bool, Optional[Dict[str, str]], str]:
+        seed = next(_render_runs) if vary else 0
+        threading.Thread(target=render, args=(seed,), name="FakeRender", daemon=True).start()
+        return True, None, ""
+
+    return handler
+
+
+class FakeReaper:
+    def __init__(self,
+                 channel_dir: Path,
+                 render_format: str = "ZXZhdxgAAQ==",
+                 scripts: Optional[Dict[str, ScriptHandler]] = None,
+                 poll_interval: float = 0.01,
+                 ack: bool = True):
+        self.channel_dir = Path(channel_dir)
+        self.inbox = self.channel_dir / "inbox"
+        self.outbox = self.channel_dir / "outbox"
+        self.render_format = render_format
+        self.scripts: Dict[str, ScriptHandler] = dict(scripts or {})
+        self.poll_interval = poll_interval
+        self.ack = ack  # False: behave like a listener from before acks
+        self.handled: list[tuple[str, Dict[str, str]]] = []
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "FakeReaper":
+        self.inbox.mkdir(parents=True, exist_ok=True)
+        self.outbox.mkdir(parents=True, exist_ok=True)
+        self._heartbeat()
+        self._thread = threading.Thread(target=self._run, name="FakeReaper", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        (self.channel_dir / HEARTBEAT_NAME).unlink(missing_ok=True)
+
+    def __enter__(self) -> "FakeReaper":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _heartbeat(self) -> None:
+        write_atomic(self.channel_dir / HEARTBEAT_NAME, f"{int(time.time())}\n")
+
+    def _handle(self, command: str, args: Dict[str, str]) -> Tuple[bool, Optional[Dict[str, str]], str]:
+        if command == "ping":
+            return True, {"version": "fake"}, ""
+        if command == "get_render_format":
+            return True, {"render_format": self.render_format}, ""
+        if command == "run_script":
+            handler = self.scripts.get(Path(args.get("path", "")).name)
+            if handler is None:
+                return True, None, ""  # unknown scripts "run" and do nothing
+            return handler(args)
+        if command == "stop":
+            self._stop.set()
+            return True, None, ""
+        return False, None, f"unknown command: {command}"
+
+    def _run(self) -> None:
+        last_beat = time.monotonic()
+        while not self._stop.is_set():
+            for req in sorted(self.inbox.glob("*.req")):
+                # Take it as the listener does: rename, then ack before running
+                taken = req.with_suffix(".run")
+                try:
+                    req.rename(taken)
+                    command, args = parse_request(taken.read_text(encoding="utf-8"))
+                except OSError:
+                    continue
+                taken.unlink(missing_ok=True)
+                if self.ack:
+                    write_atomic(self.outbox / f"{req.stem}.ack", "")
+                self.handled.append((command, args))
+                try:
+                    ok, values, err = self._handle(command, args)
+                except Exception as e:
+                    ok, values, err = False, None, str(e)
+                write_atomic(self.outbox / f"{req.stem}.res", format_response(ok, values, err))
+            if time.monotonic() - last_beat >= 1.0:
+                self._heartbeat()
+                last_beat = time.monotonic()
+            self._stop.wait(self.poll_interval)
+
+
+if __name__ == "__main__":
+    from utils.app_paths import channel_dir
+    with FakeReaper(channel_dir) as fake:
+        print(f"Fake REAPER listening on {channel_dir} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
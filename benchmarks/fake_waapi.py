@@ -0,0 +1,367 @@
+# benchmarks/fake_waapi.py
+"""
+Stand-in for the Wwise Authoring API.
+
+A minimal WAMP-over-WebSocket router (subprotocol wamp.2.json) written on
+stdlib asyncio, enough for waapi-client: HELLO/WELCOME, CALL/RESULT/ERROR,
+SUBSCRIBE/UNSUBSCRIBE/EVENT, GOODBYE and ping/pong. Calls are answered from a
+synthetic project of `count` Sounds (FakeWwise) after a configurable latency.
+"""
+from __future__ import annotations
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import re
+import shutil
+import struct
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# WAMP message codes
+HELLO, WELCOME, ABORT, GOODBYE, ERROR = 1, 2, 3, 6, 8
+SUBSCRIBE, SUBSCRIBED, UNSUBSCRIBE, UNSUBSCRIBED, EVENT = 32, 33, 34, 35, 36
+CALL, RESULT = 48, 50
+
+BENCH_ROOT = "\\Actor-Mixer Hierarchy\\Bench"
+
+
+class WaapiError(Exception):
+    def __init__(self, uri: str, message: str):
+        super().__init__(message)
+        self.uri = uri
+
+
+@dataclass
+class FakeWwise:
+    """
+    Synthetic project of `count` Sounds, all selected. With `group_size`,
+    the Sounds sit in Random Containers of that size (names repeat per
+    container) and the containers are what is selected.
+    """
+    count: int = 100
+    group_size: int = 0
+    version_year: int = 2023
+    source_root: str = "C:\\Bench\\Originals"
+    latency: float = 0.0            # seconds added to every call
+    import_latency: float = 0.0     # extra seconds per imported file
+    calls: Dict[str, int] = field(default_factory=dict)
+    imported: int = 0
+    reject_imports: Set[str] = field(default_factory=set)  # object paths whose import Wwise skips
+
+    def __post_init__(self):
+        self.objects: List[Dict[str, Any]] = []
+        self.containers: List[Dict[str, Any]] = []
+        self.children: Dict[str, List[Dict[str, Any]]] = {}
+        parent = None
+        # A POSIX source_root (source audit runs against real files) keeps its separator
+        sep = "/" if self.source_root.startswith("/") else "\\"
+        for i in range(self.count):
+            if self.group_size and i % self.group_size == 0:
+                g = i // self.group_size
+                parent = {
+                    "id": "{" + str(uuid.UUID(int=(1 << 64) + g)).upper() + "}",
+                    "name": f"Group_{g:04d}",
+                    "path": f"{BENCH_ROOT}\\Group_{g:04d}",
+                    "type": "RandomSequenceContainer",
+                }
+                self.containers.append(parent)
+                self.children[parent["id"]] = []
+            name = f"Sound_{i % self.group_size:03d}" if self.group_size else f"Sound_{i:05d}"
+            folder = parent["path"] if parent else BENCH_ROOT
+            obj = {
+                "id": "{" + str(uuid.UUID(int=i + 1)).upper() + "}",
+                "name": name,
+                "path": f"{folder}\\{name}",
+                "type": "Sound",
+                "originalFilePath": f"{self.source_root}{sep}{i:05d}_{name}.wav",
+            }
+            self.objects.append(obj)
+            if parent:
+                self.children[parent["id"]].append(obj)
+        everything = self.objects + self.containers
+        self.by_path = {o["path"]: o for o in everything}
+        self.by_id = {o["id"]: o for o in everything}
+        self.selection = list(self.containers or self.objects)
+        self.project = {"id": "{00000000-0000-0000-0000-00000000BEAC}", "name": "Bench", "type": "Project"}
+
+    def _source_key(self) -> str:
+        return "originalFilePath" if self.version_year > 2021 else "sound:originalWavFilePath"
+
+    def _view(self, obj: Dict[str, Any], keys: Optional[List[str]]) -> Dict[str, Any]:
+        keys = keys or ["id", "name"]
+        out = {}
+        for k in keys:
+            if k in ("originalFilePath", "sound:originalWavFilePath"):
+                if k == self._source_key() and "originalFilePath" in obj:
+                    out[k] = obj["originalFilePath"]
+            elif k in obj:
+                out[k] = obj[k]
+        return out
+
+    def handle(self, uri: str, kwargs: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
+        self.calls[uri] = self.calls.get(uri, 0) + 1
+        keys = options.get("return")
+        if uri == "ak.wwise.core.getInfo":
+            return {"displayName": "Wwise (fake)", "version": {"year": self.version_year, "major": 1,
+                                                               "minor": 0, "build": 0}}
+        if uri == "ak.wwise.ui.getSelectedObjects":
+            return {"objects": [self._view(o, keys) for o in self.selection]}
+        if uri == "ak.wwise.core.object.get":
+            return {"return": [self._view(o, keys) for o in self._resolve(kwargs)]}
+        if uri == "ak.wwise.core.audio.import":
+            imports = kwargs.get("imports", [])
+            if self.import_latency:
+                time.sleep(self.import_latency * len(imports))
+            out, log = [], []
+            for item in imports:
+                obj = self.by_path.get(item.get("objectPath"))
+                if obj is None:
+                    raise WaapiError("ak.wwise.query_error", f"Object not found: {item.get('objectPath')}")
+                if obj["path"] in self.reject_imports:
+                    # Wwise skips what it can't import and only says so in the log
+                    log.append({"severity": "Error",
+                                "message": f"Failed to import '{item.get('audioFile')}': unsupported format"})
+                    continue
+                if self.source_root.startswith("/") and item.get("audioFile"):
+                    # Real files: copy into Originals, as Wwise does
+                    os.makedirs(os.path.dirname(obj["originalFilePath"]), exist_ok=True)
+                    shutil.copyfile(item["audioFile"], obj["originalFilePath"])
+                out.append(self._view(obj, keys))
+            self.imported += len(out)
+            return {"objects": out, "log": log}
+        raise WaapiError("ak.wwise.invalid_procedure_uri", f"Unknown procedure: {uri}")
+
+    def _resolve(self, kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if "waql" in kwargs:
+            # Enough for the bridge: '$ "{guid}", ... select descendants ...' and
+            # '$ from type Sound skip N take M'; anything else is every Sound
+            waql = kwargs["waql"]
+            guids = re.findall(r'"(\{[0-9A-Fa-f-]+\})"', waql)
+            if guids and "descendants" in waql:
+                return [c for g in guids for c in self.children.get(g.upper(), [])]
+            skip = re.search(r"\bskip (\d+)", waql)
+            take = re.search(r"\btake (\d+)", waql)
+            start = int(skip.group(1)) if skip else 0
+            return self.objects[start:start + int(take.group(1)) if take else None]
+        src = kwargs.get("from", {})
+        if "path" in src:
+            return [self.by_path[p] for p in src["path"] if p in self.by_path]
+        if "id" in src:
+            return [self.by_id[i] for i in src["id"] if i in self.by_id]
+        if "ofType" in src:
+            types = set(src["ofType"])
+            if "Project" in types:
+                return [self.project]
+            return [o for o in self.objects if o["type"] in types]
+        return []
+
+
+class _Connection:
+    def __init__(self, server: "FakeWaapiServer", reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.subscriptions: Dict[int, str] = {}
+
+    async def handshake(self) -> bool:
+        raw = await self.reader.readuntil(b"\r\n\r\n")
+        headers = {}
+        for line in raw.decode("latin-1").split("\r\n")[1:]:
+            k, _, v = line.partition(":")
+            headers[k.strip().lower()] = v.strip()
+        key = headers.get("sec-websocket-key")
+        if not key:
+            self.writer.write(b"HTTP/1.1 400 Bad Request\r\n\r\n")
+            return False
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+        self.writer.write((
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n"
+            "Sec-WebSocket-Protocol: wamp.2.json\r\n\r\n"
+        ).encode())
+        await self.writer.drain()
+        return True
+
+    async def read_frame(self) -> tuple[int, bytes]:
+        b0, b1 = await self.reader.readexactly(2)
+        opcode = b0 & 0x0F
+        length = b1 & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", await self.reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await self.reader.readexactly(8))
+        mask = await self.reader.readexactly(4) if b1 & 0x80 else b""
+        payload = await self.reader.readexactly(length)
+        if mask and length:
+            # XOR as one big integer; a per-byte loop dominates on large calls
+            key = (mask * (length // 4 + 1))[:length]
+            payload = (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(length, "big")
+        return (b0 & 0x80) | opcode, payload
+
+    async def read_message(self) -> Optional[str]:
+        """Next text message (reassembling fragments), or None on close."""
+        parts: List[bytes] = []
+        while True:
+            head, payload = await self.read_frame()
+            fin, opcode = head & 0x80, head & 0x0F
+            if opcode == 0x8:
+                self.send_frame(0x8, payload[:2])
+                return None
+            if opcode == 0x9:
+                self.send_frame(0xA, payload)
+                continue
+            if opcode == 0xA:
+                continue
+            parts.append(payload)
+            if fin:
+                return b"".join(parts).decode("utf-8")
+
+    def send_frame(self, opcode: int, payload: bytes) -> None:
+        n = len(payload)
+        if n < 126:
+            head = struct.pack("!BB", 0x80 | opcode, n)
+        elif n < 1 << 16:
+            head = struct.pack("!BBH", 0x80 | opcode, 126, n)
+        else:
+            head = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+        self.writer.write(head + payload)
+
+    def send(self, msg: list) -> None:
+        self.send_frame(0x1, json.dumps(msg).encode("utf-8"))
+
+    async def serve(self) -> None:
+        self.server.connections.add(self)
+        try:
+            if not await self.handshake():
+                return
+            while True:
+                text = await self.read_message()
+                if text is None:
+                    break
+                msg = json.loads(text)
+                if not await self.dispatch(msg):
+                    break
+                await self.writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.server.connections.discard(self)
+            self.writer.close()
+
+    def publish(self, topic: str, kwargs: Dict[str, Any]) -> None:
+        for sub_id, t in list(self.subscriptions.items()):
+            if t == topic:
+                self.send([EVENT, sub_id, self.server.next_id(), {}, [], kwargs])
+
+    async def dispatch(self, msg: list) -> bool:
+        code = msg[0]
+        if code == HELLO:
+            self.send([WELCOME, self.server.next_id(), {"roles": {"broker": {}, "dealer": {}}}])
+        elif code == GOODBYE:
+            # Same reason Wwise answers with; the client then closes the socket
+            self.send([GOODBYE, {}, "wamp.error.goodbye_and_out"])
+        elif code == CALL:
+            request, options, uri = msg[1], msg[2], msg[3]
+            kwargs = msg[5] if len(msg) > 5 else {}
+            if self.server.wwise.latency:
+                await asyncio.sleep(self.server.wwise.latency)
+            try:
+                result = self.server.wwise.handle(uri, kwargs, options or {})
+                self.send([RESULT, request, {}, [], result])
+            except WaapiError as e:
+                self.send([ERROR, CALL, request, {}, e.uri, [], {"message": str(e)}])
+        elif code == SUBSCRIBE:
+            sub_id = self.server.next_id()
+            self.subscriptions[sub_id] = msg[3]
+            self.send([SUBSCRIBED, msg[1], sub_id])
+        elif code == UNSUBSCRIBE:
+            self.subscriptions.pop(msg[2], None)
+            self.send([UNSUBSCRIBED, msg[1]])
+        return True
+
+
+class FakeWaapiServer:
+    """Serves a FakeWwise on ws://host:port/waapi from a background event loop."""
+    def __init__(self, wwise: FakeWwise, host: str = "127.0.0.1", port: int = 0):
+        self.wwise = wwise
+        self.host = host
+        self.port = port
+        self._ids = 0
+        self.connections: set = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}/waapi"
+
+    def next_id(self) -> int:
+        self._ids += 1
+        return self._ids
+
+    async def _on_client(self, reader, writer) -> None:
+        await _Connection(self, reader, writer).serve()
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._on_client, self.host, self.port, limit=1 << 26))
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+        self._server.close()
+        self._loop.run_until_complete(self._server.wait_closed())
+        self._loop.close()
+
+    def publish(self, topic: str, **kwargs) -> None:
+        """Send `topic` to every subscribed client, as Wwise does on UI or project changes."""
+        def send_all():
+            for conn in list(self.connections):
+                conn.publish(topic, kwargs)
+        self._loop.call_soon_threadsafe(send_all)
+
+    def start(self) -> "FakeWaapiServer":
+        self._thread = threading.Thread(target=self._run, name="FakeWaapi", daemon=True)
+        self._thread.start()
+        self._ready.wait(5.0)
+        return self
+
+    def stop(self) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+
+    def __enter__(self) -> "FakeWaapiServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Fake WAAPI server for benchmarks")
+    ap.add_argument("--port", type=int, default=8080)
+    ap.add_argument("--count", type=int, default=100)
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    a = ap.parse_args()
+    with FakeWaapiServer(FakeWwise(a.count, latency=a.latency_ms / 1000), port=a.port) as srv:
+        print(f"Fake WAAPI on {srv.url} with {a.count} Sounds (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,173 @@
+# benchmarks/run_bench.py
+"""
+End-to-end benchmark of open_in_reaper and modify_source.
+
+Wwise is replaced by a local WAMP server (fake_waapi.py) and REAPER by the
+command-channel stand-in (fake_reaper.py) which writes real WAVs, progress.log
+and success.flag. Everything runs in a throw-away data directory
+(WRB_CONFIG_DIR / WRB_DATA_DIR); the user's config and data are never touched.
+
+    python benchmarks/run_bench.py                       # 10, 100, 1000, 10000 objects
+    python benchmarks/run_bench.py --sizes 10 100 --repeat 5 --latency-ms 2
+    python benchmarks/run_bench.py --out base.json
+    python benchmarks/run_bench.py --baseline base.json  # exit 1 on regression
+
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+_sandbox = Path(tempfile.mkdtemp(prefix="wrb-bench-"))
+os.environ["WRB_CONFIG_DIR"] = str(_sandbox / "config")
+os.environ["WRB_DATA_DIR"] = str(_sandbox / "data")
+
+from fake_reaper import FakeReaper, render_script  # noqa: E402  (also puts the bridge on sys.path)
+from fake_waapi import FakeWaapiServer, FakeWwise  # noqa: E402
+
+from core.bridge_logic import open_in_reaper, modify_source  # noqa: E402
+from core.models import Settings  # noqa: E402
+from utils.app_paths import (  # noqa: E402
+    appdata_dir, channel_dir, config_json_path, last_selected_jsonl_path, last_selected_txt_path,
+    localdata_dir, log_dir, reaper_import_lua_path, reaper_render_lua_path, render_request_path, temp_render_dir,
+)
+from utils.instrumentation import configure_logging  # noqa: E402
+from utils.process_probe import ProcessInfo, get_process_probe  # noqa: E402
+from utils.settings_store import save_settings  # noqa: E402
+from utils.wwise_waapi import get_waapi_pool  # noqa: E402
+
+
+class BenchUI:
+    def show_error(self, title, msg): print(f"  ! {title}: {msg}", file=sys.stderr)
+    def show_info(self, title, msg): pass
+    def ask_yes_no(self, title, msg): return False
+
+
+class FakeProcesses:
+    """Process backend reporting a responsive REAPER."""
+    def processes(self):
+        return [ProcessInfo(os.getpid(), "reaper")]
+
+    def is_responsive(self, pid):
+        return True
+
+    def exe_path(self, pid):
+        return sys.executable  # the bench's reaper_path
+
+
+def _run_once(fn, *args, **kwargs) -> tuple[float, dict, str]:
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    seconds = time.perf_counter() - t0
+    if result.level == "error":
+        raise RuntimeError(f"{fn.__name__}: {result.message}")
+    return seconds, (result.data or {}).get("timings", {}), result.message
+
+
+def bench_size(n: int, args, reaper: FakeReaper, ui: BenchUI) -> dict:
+    # Sources are real files under the sandbox, so imports land somewhere the
+    # render cache can hash (the first run imports, later runs can skip)
+    wwise = FakeWwise(n, group_size=args.group_size, source_root=str(_sandbox / f"originals-{n}"),
+                      latency=args.latency_ms / 1000, import_latency=args.import_latency_ms / 1000)
+    reaper.scripts = {
+        reaper_import_lua_path.name: lambda a: (True, None, ""),
+        reaper_render_lua_path.name: render_script(temp_render_dir, last_selected_txt_path,
+                                                   seconds=args.wav_seconds, vary=not args.unchanged,
+                                                   request_path=render_request_path),
+    }
+    out = {"objects": n, "open": [], "sync": [], "spans": {}}
+    with FakeWaapiServer(wwise) as server:
+        pool = get_waapi_pool()
+        pool.close()
+        pool.url = server.url
+        pool.stats.reset()
+        for _ in range(args.repeat):
+            seconds, _, _ = _run_once(open_in_reaper, config_json_path, last_selected_jsonl_path, ui)
+            out["open"].append(seconds)
+            seconds, timings, message = _run_once(modify_source, config_json_path, last_selected_jsonl_path, ui)
+            out["sync"].append(seconds)
+            out["message"] = message
+            out["spans"] = {k: v["total"] for k, v in timings.get("spans", {}).items()}
+        pool.close()
+    out["waapi_calls"] = dict(wwise.calls)
+    out["imported"] = wwise.imported
+    return out
+
+
+def _median(xs):
+    return statistics.median(xs) if xs else 0.0
+
+
+def print_row(r: dict) -> None:
+    n, o, s = r["objects"], _median(r["open"]), _median(r["sync"])
+    print(f"{n:>7}  open {o:8.3f}s  sync {s:8.3f}s  {n / s if s else 0:9.1f} obj/s  {r.get('message', '')}")
+    top = sorted(r["spans"].items(), key=lambda kv: kv[1], reverse=True)[:5]
+    if top:
+        print("         " + ", ".join(f"{k} {v:.3f}s" for k, v in top))
+
+
+def compare(results: list[dict], baseline_path: Path, tolerance: float) -> int:
+    base = {r["objects"]: r for r in json.loads(baseline_path.read_text(encoding="utf-8"))["results"]}
+    regressions = 0
+    for r in results:
+        b = base.get(r["objects"])
+        if b is None:
+            continue
+        for key in ("open", "sync"):
+            now, before = _median(r[key]), _median(b[key])
+            if before and now > before * (1 + tolerance):
+                regressions += 1
+                print(f"REGRESSION {key} @ {r['objects']}: {before:.3f}s -> {now:.3f}s")
+    return regressions
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    ap.add_argument("--repeat", type=int, default=1, help="runs per size (median is reported)")
+    ap.add_argument("--latency-ms", type=float, default=1.0, help="WAAPI latency per call")
+    ap.add_argument("--import-latency-ms", type=float, default=0.0, help="extra WAAPI import time per file")
+    ap.add_argument("--wav-seconds", type=float, default=0.01, help="length of each rendered WAV")
+    ap.add_argument("--group-size", type=int, default=0,
+                    help="select Random Containers of this many Sounds (names repeat per container)")
+    ap.add_argument("--unchanged", action="store_true", help="render identical audio every run (hash-skip path)")
+    ap.add_argument("--analyze", action="store_true", help="enable peak/loudness analysis before import")
+    ap.add_argument("--out", type=Path, help="write results as JSON")
+    ap.add_argument("--baseline", type=Path, help="compare against a previous --out file")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs. baseline (0.25 = 25%%)")
+    args = ap.parse_args(argv)
+
+    for folder in (appdata_dir, localdata_dir):
+        if _sandbox.resolve() not in folder.resolve().parents:
+            print(f"Refusing to run: {folder} is outside the sandbox {_sandbox}", file=sys.stderr)
+            return 2
+    configure_logging(log_dir, console=False)
+    config_json_path.parent.mkdir(parents=True, exist_ok=True)
+    save_settings(config_json_path, Settings(reaper_path=sys.executable, analyze_renders=args.analyze))
+    get_process_probe().set_backend(FakeProcesses())
+
+    ui = BenchUI()
+    results = []
+    print(f"sandbox: {_sandbox}")
+    with FakeReaper(channel_dir) as reaper:
+        for n in args.sizes:
+            r = bench_size(n, args, reaper, ui)
+            results.append(r)
+            print_row(r)
+
+    if args.out:
+        args.out.write_text(json.dumps({"args": {k: str(v) for k, v in vars(args).items()},
+                                        "results": results}, indent=2), encoding="utf-8")
+    if args.baseline:
+        return 1 if compare(results, args.baseline, args.tolerance) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,9 @@ datas = [
 ]
 
 hiddenimports = collect_submodules("wwise_reaper_bridge")
+# Imported lazily or behind try/except (render analysis, process probe);
+# list them so the frozen build always bundles them
+hiddenimports += ["numpy", "psutil"]
 
 block_cipher = None
 
@@ -46,7 +49,9 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    # A one-file exe unpacks its binaries on every launch; UPX-compressed
+    # ones must also be decompressed first, which dominates a cold start
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -54,3 +59,25 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+
+# Same program with a console: a windowed exe has no stdout/stderr, so the
+# headless commands (WwReaBridgeCli render-sync ...) need this one
+cli_exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    [],
+    name="WwReaBridgeCli",
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=True,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
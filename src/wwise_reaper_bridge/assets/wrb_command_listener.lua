@@ -0,0 +1,220 @@
+-- ============================================================
+-- WwiseReaperBridge - Command Listener
+--
+-- Stays resident in REAPER (deferred loop) and serves commands from
+-- the bridge through a file queue, so the bridge does not have to
+-- relaunch reaper.exe for every action.
+--
+-- Channel folder (same base as the render folder):
+--   Windows: %LOCALAPPDATA%\WwiseReaperBridge\channel
+--   macOS:   ~/Library/Application Support/WwiseReaperBridge/channel
+--   Linux:   ~/.local/share/WwiseReaperBridge/channel
+-- or <WRB_DATA_DIR>/channel when started through a connection profile's
+-- wrapper script; each profile's listener runs alongside the others.
+--
+-- Request  inbox/<id>.req :  command|<name>  +  arg|<key>=<value> lines
+-- Ack      outbox/<id>.ack:  written once a request is taken, before it runs
+-- Response outbox/<id>.res:  ok|1 or ok|0  +  value|<key>=<value>  +  error|<text>
+-- heartbeat               :  rewritten about once per second
+--
+-- Commands:
+--   ping                  -> ok
+--   run_script path=...   -> runs the ReaScript, ok once its main chunk returned
+--   get_render_format     -> value render_format=<RENDER_FORMAT of active project>
+--   stop                  -> ok, then the listener exits
+-- ============================================================
+
+local WRB = {}
+
+local POLL_SEC = 0.05
+local HEARTBEAT_SEC = 1.0
+
+local running = true
+local last_poll = 0
+local last_heartbeat = 0
+
+function WRB.GetChannelPath()
+    local osname = reaper.GetOS():lower()
+    local sep = package.config:sub(1, 1)
+    local base_path = ""
+
+    if WRB_DATA_DIR and WRB_DATA_DIR ~= "" then
+        local dir = WRB_DATA_DIR .. sep .. "channel"
+        reaper.RecursiveCreateDirectory(dir .. sep .. "inbox", 0)
+        reaper.RecursiveCreateDirectory(dir .. sep .. "outbox", 0)
+        return dir, sep
+    elseif osname:find("win") then
+        base_path = os.getenv("LOCALAPPDATA")
+        if not base_path then base_path = os.getenv("USERPROFILE") .. "\\AppData\\Local" end
+    elseif osname:find("osx") or osname:find("mac") then
+        base_path = os.getenv("HOME") .. "/Library/Application Support"
+    else
+        base_path = os.getenv("HOME") .. "/.local/share"
+    end
+
+    local dir = base_path .. sep .. "WwiseReaperBridge" .. sep .. "channel"
+    reaper.RecursiveCreateDirectory(dir .. sep .. "inbox", 0)
+    reaper.RecursiveCreateDirectory(dir .. sep .. "outbox", 0)
+    return dir, sep
+end
+
+local CHANNEL_DIR, SEP = WRB.GetChannelPath()
+local INBOX = CHANNEL_DIR .. SEP .. "inbox"
+local OUTBOX = CHANNEL_DIR .. SEP .. "outbox"
+
+-- Only the most recently started listener on this channel keeps running
+local TOKEN_KEY = "listener:" .. CHANNEL_DIR
+local token = tostring(reaper.time_precise()) .. tostring(math.random(1, 1000000))
+reaper.SetExtState("WwiseReaperBridge", TOKEN_KEY, token, false)
+
+local function escape(s)
+    return (tostring(s):gsub("\\", "\\\\"):gsub("\r", ""):gsub("\n", "\\n"))
+end
+
+local function unescape(s)
+    return (s:gsub("\\n", "\n"):gsub("\\\\", "\\"))
+end
+
+function WRB.WriteAtomic(path, text)
+    local tmp = path .. ".tmp"
+    local f = io.open(tmp, "w")
+    if not f then return false end
+    f:write(text)
+    f:close()
+    os.remove(path)
+    return os.rename(tmp, path)
+end
+
+function WRB.Heartbeat()
+    WRB.WriteAtomic(CHANNEL_DIR .. SEP .. "heartbeat", tostring(os.time()) .. "\n")
+end
+
+function WRB.ReadRequest(path)
+    local f = io.open(path, "r")
+    if not f then return nil end
+    local command, args = nil, {}
+    for line in f:lines() do
+        local kind, rest = line:match("^(%w+)|(.*)$")
+        if kind == "command" then
+            command = rest
+        elseif kind == "arg" then
+            local k, v = rest:match("^([^=]*)=(.*)$")
+            if k then args[k] = unescape(v) end
+        end
+    end
+    f:close()
+    return command, args
+end
+
+function WRB.WriteResponse(id, ok, values, err)
+    local lines = { "ok|" .. (ok and "1" or "0") }
+    for k, v in pairs(values or {}) do
+        table.insert(lines, "value|" .. k .. "=" .. escape(v))
+    end
+    if err then
+        table.insert(lines, "error|" .. escape(err))
+    end
+    WRB.WriteAtomic(OUTBOX .. SEP .. id .. ".res", table.concat(lines, "\n") .. "\n")
+end
+
+local handlers = {}
+
+function handlers.ping(args)
+    return true, { version = reaper.GetAppVersion() }
+end
+
+function handlers.run_script(args)
+    local path = args.path or ""
+    if path == "" or not reaper.file_exists(path) then
+        return false, nil, "script not found: " .. path
+    end
+    local ok, err = pcall(dofile, path)
+    if not ok then
+        return false, nil, tostring(err)
+    end
+    return true
+end
+
+function handlers.get_render_format(args)
+    local ok, fmt = reaper.GetSetProjectInfo_String(0, "RENDER_FORMAT", "", false)
+    if not ok or fmt == "" then
+        return false, nil, "Could not read RENDER_FORMAT"
+    end
+    return true, { render_format = fmt }
+end
+
+function handlers.stop(args)
+    running = false
+    return true
+end
+
+function WRB.Handle(id, path)
+    -- Take the request by renaming it: the bridge withdraws requests it gave
+    -- up on by deleting them, and only one of the two can succeed
+    local taken = INBOX .. SEP .. id .. ".run"
+    if not os.rename(path, taken) then return end
+    local command, args = WRB.ReadRequest(taken)
+    os.remove(taken)
+    -- Tell the bridge the command will run, so it waits for it instead of
+    -- launching the script another way
+    WRB.WriteAtomic(OUTBOX .. SEP .. id .. ".ack", "")
+    local handler = command and handlers[command]
+    if not handler then
+        WRB.WriteResponse(id, false, nil, "unknown command: " .. tostring(command))
+        return
+    end
+    local ok, okres, values, err = pcall(handler, args)
+    if not ok then
+        WRB.WriteResponse(id, false, nil, tostring(okres))
+    else
+        WRB.WriteResponse(id, okres, values, err)
+    end
+end
+
+function WRB.Poll()
+    -- -1 clears REAPER's directory listing cache so new files show up
+    reaper.EnumerateFiles(INBOX, -1)
+    local pending = {}
+    local i = 0
+    repeat
+        local file = reaper.EnumerateFiles(INBOX, i)
+        if file then
+            local id = file:match("^(.-)%.req$")
+            if id then table.insert(pending, id) end
+        end
+        i = i + 1
+    until not file
+
+    for _, id in ipairs(pending) do
+        WRB.Handle(id, INBOX .. SEP .. id .. ".req")
+    end
+end
+
+-- Local on purpose: scripts run through run_script may define a global Main
+local function ListenerLoop()
+    if reaper.GetExtState("WwiseReaperBridge", TOKEN_KEY) ~= token then
+        return -- replaced by a newer listener
+    end
+
+    local now = reaper.time_precise()
+    if now - last_heartbeat >= HEARTBEAT_SEC then
+        WRB.Heartbeat()
+        last_heartbeat = now
+    end
+    if now - last_poll >= POLL_SEC then
+        WRB.Poll()
+        last_poll = now
+    end
+
+    if running then
+        reaper.defer(ListenerLoop)
+    else
+        os.remove(CHANNEL_DIR .. SEP .. "heartbeat")
+    end
+end
+
+reaper.atexit(function()
+    os.remove(CHANNEL_DIR .. SEP .. "heartbeat")
+end)
+
+ListenerLoop()
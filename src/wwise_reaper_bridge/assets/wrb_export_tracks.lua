@@ -2,7 +2,8 @@
 -- WwiseReaperBridge - Export Root Tracks
 --
 -- Features:
---   1. Cleans target folder completely.
+--   1. Cleans target folder (or, for a resumed sync, renders only the
+--      tracks listed in render_request.txt and keeps existing renders).
 --   2. Forces 48kHz / 24-bit PCM WAV.
 --   3. NO BWF Chunk (Clean WAV).
 --   4. Auto-detects Mono/Stereo per track.
@@ -11,6 +12,8 @@
 
 local WRB = {}
 local DEFAULT_RENDER_SETTINGS = "ZXZhdxgAAQ=="
+-- Set by a connection profile's wrapper script; read now, Main may run deferred
+local DATA_DIR = WRB_DATA_DIR
 
 local function msg(s)
     reaper.ShowConsoleMsg(tostring(s) .. "\n")
@@ -45,6 +48,12 @@ function WRB.FindConfigPath()
     local sep = package.config:sub(1, 1)
     local base = ""
 
+    -- Same override as the bridge (utils/app_paths.py), inherited when it launches REAPER
+    local override = os.getenv("WRB_CONFIG_DIR") or ""
+    if override ~= "" then
+        return override .. sep .. "config.json"
+    end
+
     if osname:find("win") then
         base = os.getenv("APPDATA") or ""
         if base == "" then
@@ -96,12 +105,17 @@ function WRB.GetRenderFormat()
     return DEFAULT_RENDER_SETTINGS
 end
 
--- Get Render Path
-function WRB.GetRenderPath()
+-- Local data folder of the bridge (render folder, render request),
+-- or the connection profile's own folder
+function WRB.GetDataDir()
     local osname = reaper.GetOS():lower()
     local sep = package.config:sub(1,1)
     local base_path = ""
 
+    if DATA_DIR and DATA_DIR ~= "" then
+        return DATA_DIR, sep
+    end
+
     if osname:find("win") then
         base_path = os.getenv("LOCALAPPDATA")
         if not base_path then base_path = os.getenv("USERPROFILE") .. "\\AppData\\Local" end
@@ -111,7 +125,13 @@ function WRB.GetRenderPath()
         base_path = os.getenv("HOME") .. "/.local/share"
     end
 
-    local full_path = base_path .. sep .. "WwiseReaperBridge" .. sep .. "renders"
+    return base_path .. sep .. "WwiseReaperBridge", sep
+end
+
+-- Get Render Path
+function WRB.GetRenderPath()
+    local data_dir, sep = WRB.GetDataDir()
+    local full_path = data_dir .. sep .. "renders"
 
     -- Ensure directory exists
     reaper.RecursiveCreateDirectory(full_path, 0)
@@ -119,19 +139,52 @@ function WRB.GetRenderPath()
     return full_path, sep
 end
 
+-- Render request written by the bridge (render_request.txt), nil if absent:
+--   dir|<path>    render into this folder (per-sync run folder)
+--   keep|1        keep existing renders (resumed sync)
+--   format|<b64>  RENDER_FORMAT of the connection profile (overrides config.json)
+--   track|<name>  render only these root tracks
+function WRB.ReadRenderRequest()
+    local data_dir, sep = WRB.GetDataDir()
+    local text = read_file(data_dir .. sep .. "render_request.txt")
+    if not text then return nil end
+
+    local req = { keep_existing = false, tracks = nil }
+    for line in text:gmatch("[^\r\n]+") do
+        local kind, value = line:match("^([^|]*)|(.*)$")
+        if kind == "dir" and trim(value) ~= "" then
+            req.render_dir = trim(value)
+        elseif kind == "format" and looks_like_b64(value) then
+            req.render_format = trim(value)
+        elseif kind == "keep" then
+            req.keep_existing = (trim(value) == "1")
+        elseif kind == "track" and value ~= "" then
+            req.tracks = req.tracks or {}
+            req.tracks[value] = true
+        end
+    end
+    return req
+end
+
 -- Cleanup Render Folder and init Flag
-function WRB.CleanAndInit(dir, sep)
+-- keep_existing: only remove progress/flag files, keep rendered WAVs
+function WRB.CleanAndInit(dir, sep, keep_existing)
+    -- Collect first: deleting while enumerating shifts the indices
+    local files = {}
     local i = 0
     repeat
         local file = reaper.EnumerateFiles(dir, i)
-        if file then
-            os.remove(dir .. sep .. file)
-            -- Note: When deleting, the index might shift, but simple enumeration usually works
-            -- for bulk delete. If issues arise, we can loop backwards, but this is standard.
-        end
+        if file then table.insert(files, file) end
         i = i + 1
     until not file
 
+    for _, file in ipairs(files) do
+        local is_wav = file:lower():match("%.wav$") ~= nil
+        if not (keep_existing and is_wav) then
+            os.remove(dir .. sep .. file)
+        end
+    end
+
 
     -- Create Timestamp Flag (yyyy_mm_dd_hh_mm_ss.flag)
     local timestamp_name = os.date("%Y_%m_%d_%H_%M_%S") .. ".flag"
@@ -146,6 +199,17 @@ function WRB.CleanAndInit(dir, sep)
     return full_ts_path
 end
 
+-- Progress log read by the bridge (one line per event):
+--   total|<n>        about to render n tracks
+--   rendered|<name>  <name>.wav is written and closed
+function WRB.AppendProgress(dir, sep, line)
+    local f = io.open(dir .. sep .. "progress.log", "a")
+    if f then
+        f:write(line .. "\n")
+        f:close()
+    end
+end
+
 function WRB.MarkSuccess(dir, sep, old_flag_path)
     -- Remove the Timestamp flag
     if old_flag_path then
@@ -205,12 +269,17 @@ end
 
 function WRB.ProcessAndRender()
     local output_dir, sep = WRB.GetRenderPath()
+    local request = WRB.ReadRenderRequest()
+    if request and request.render_dir then
+        output_dir = request.render_dir
+        reaper.RecursiveCreateDirectory(output_dir, 0)
+    end
 
     -- === CLEANUP & SIGNAL START ===
-    local current_flag_path = WRB.CleanAndInit(output_dir, sep)
+    local current_flag_path = WRB.CleanAndInit(output_dir, sep, request and request.keep_existing)
 
     -- === FORMAT CONFIGURATION ===
-    local render_format_settings = WRB.GetRenderFormat()
+    local render_format_settings = (request and request.render_format) or WRB.GetRenderFormat()
 
     -- Set Global Render Params
     reaper.GetSetProjectInfo(0, "RENDER_SETTINGS", 3, true)   -- 3 = Selected Tracks (Stems)
@@ -231,31 +300,45 @@ function WRB.ProcessAndRender()
 
     reaper.Main_OnCommand(40297, 0) -- Unselect all
 
+    -- Collect ROOT tracks with content first so the bridge knows the total
+    local jobs = {}
     for i = 0, track_count - 1 do
         local tr = reaper.GetTrack(0, i)
         local parent = reaper.GetParentTrack(tr)
 
-        -- Only process ROOT tracks
         if parent == nil then
+            local _, name = reaper.GetSetMediaTrackInfo_String(tr, "P_NAME", "", false)
+            -- A request with a track list renders only those tracks
+            local wanted = not (request and request.tracks) or request.tracks[name]
+            if wanted then
+                local end_time, is_stereo = WRB.AnalyzeTrackFamily(i)
+                if end_time > 0 then
+                    table.insert(jobs, { track = tr, name = name, end_time = end_time, is_stereo = is_stereo })
+                end
+            end
+        end
+    end
 
-            local end_time, is_stereo = WRB.AnalyzeTrackFamily(i)
+    WRB.AppendProgress(output_dir, sep, "total|" .. tostring(#jobs))
 
-            if end_time > 0 then
-                reaper.SetTrackSelected(tr, true)
-                reaper.GetSet_LoopTimeRange(true, false, 0, end_time, false)
+    for _, job in ipairs(jobs) do
+        local tr = job.track
+        reaper.SetTrackSelected(tr, true)
+        reaper.GetSet_LoopTimeRange(true, false, 0, job.end_time, false)
 
-                -- Force Mono/Stereo based on content analysis
-                local channels = is_stereo and 2 or 1
-                reaper.GetSetProjectInfo(0, "RENDER_CHANNELS", channels, true)
+        -- Force Mono/Stereo based on content analysis
+        local channels = job.is_stereo and 2 or 1
+        reaper.GetSetProjectInfo(0, "RENDER_CHANNELS", channels, true)
 
-                -- COMMAND 41824: "File: Render project, using the most recent render settings"
-                -- RENDER_CLOSEPROG set to 1 above should ensure the window closes.
-                reaper.Main_OnCommand(41824, 0)
+        -- COMMAND 41824: "File: Render project, using the most recent render settings"
+        -- RENDER_CLOSEPROG set to 1 above should ensure the window closes.
+        reaper.Main_OnCommand(41824, 0)
 
-                render_count = render_count + 1
-                reaper.SetTrackSelected(tr, false)
-            end
-        end
+        render_count = render_count + 1
+        reaper.SetTrackSelected(tr, false)
+
+        -- Render is synchronous, so the file is closed by now
+        WRB.AppendProgress(output_dir, sep, "rendered|" .. job.name)
     end
 
     -- SUCCESS
@@ -5,17 +5,21 @@
 --   Windows: %LOCALAPPDATA%\WwiseReaperBridge\last_selected.txt
 --   macOS:   ~/Library/Application Support/WwiseReaperBridge/last_selected.txt
 --   Linux:   ~/.local/share/WwiseReaperBridge/last_selected.txt
+--   or <WRB_DATA_DIR>/last_selected.txt for a connection profile
 --
 -- Each non-empty line:
---   wwise_path|sourcepath(optional)
+--   wwise_path|sourcepath(optional)|render_name(optional)
 --
 -- For each line:
---   - Track name = last component of wwise_path (supports \ or /)
+--   - Track name = render_name (unique per batch, becomes the rendered file name),
+--     or the last component of wwise_path (supports \ or /) if absent
 --   - Track notes (P_NOTES) = full wwise_path
 --   - If sourcepath exists, insert media at time 0 on this track
 -- ============================================================
 
 local WRB = {}
+-- Set by a connection profile's wrapper script; read now, Run may be deferred
+local DATA_DIR = WRB_DATA_DIR
 
 function WRB.Trim(s)
     if s == nil then
@@ -25,12 +29,12 @@ function WRB.Trim(s)
 end
 
 function WRB.SplitManifestLine(line)
-    -- Format: left|right(optional)
-    local left, right = line:match("^(.-)%|(.*)$")
-    if not left then
-        return WRB.Trim(line), ""
+    -- Format: wwise_path|source(optional)|render_name(optional)
+    local fields = {}
+    for field in (line .. "|"):gmatch("(.-)|") do
+        table.insert(fields, WRB.Trim(field))
     end
-    return WRB.Trim(left), WRB.Trim(right)
+    return fields[1] or "", fields[2] or "", fields[3] or ""
 end
 
 function WRB.GetLastPathComponent(p)
@@ -75,6 +79,10 @@ end
 function WRB.GetManifestPath()
     local osname = reaper.GetOS():lower()
 
+    if DATA_DIR and DATA_DIR ~= "" then
+        return DATA_DIR .. package.config:sub(1, 1) .. "last_selected.txt"
+    end
+
     -- Prefer LOCALAPPDATA on Windows
     local localapp = os.getenv("LOCALAPPDATA")
     if localapp and localapp ~= "" then
@@ -166,14 +174,13 @@ function WRB.ReadManifestLines(manifest_path)
     for line in f:lines() do
         line = WRB.Trim(line)
         if line ~= "" then
-            local wwise_path, source_path = WRB.SplitManifestLine(line)
-            wwise_path = WRB.Trim(wwise_path)
-            source_path = WRB.Trim(source_path)
+            local wwise_path, source_path, render_name = WRB.SplitManifestLine(line)
 
             if wwise_path ~= "" then
                 table.insert(entries, {
                     wwise_path = wwise_path,
                     source_path = source_path,
+                    render_name = render_name,
                 })
             end
         end
@@ -187,7 +194,10 @@ function WRB.ImportOneEntry(entry)
     local wwise_path = entry.wwise_path
     local source_path = entry.source_path
 
-    local objname = WRB.GetLastPathComponent(wwise_path)
+    local objname = entry.render_name
+    if objname == nil or objname == "" then
+        objname = WRB.GetLastPathComponent(wwise_path)
+    end
 
     local tr = WRB.CreateTrackAtEnd()
     WRB.SetTrackNameAndNotes(tr, objname, wwise_path)
@@ -0,0 +1,229 @@
+# cli.py
+from __future__ import annotations
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+
+from core.models import Result, SelectedObj
+from core.render_names import assign_render_names
+from utils import startup_timing
+from utils.app_paths import config_json_path, log_dir
+from utils.instrumentation import PROFILE_ENV, configure_logging
+
+
+class HeadlessUIApi:
+    """UIApi for scripts/CI: messages go to stderr, questions get a fixed answer."""
+    def __init__(self, assume_yes: bool = False, quiet: bool = False):
+        self.assume_yes = assume_yes
+        self.quiet = quiet
+
+    def show_error(self, title, msg):
+        print(f"{title}: {msg}", file=sys.stderr)
+
+    def show_info(self, title, msg):
+        if not self.quiet:
+            print(f"{title}: {msg}", file=sys.stderr)
+
+    def ask_yes_no(self, title, msg):
+        if not self.quiet:
+            print(f"{title}: {msg} -> {'yes' if self.assume_yes else 'no'}", file=sys.stderr)
+        return self.assume_yes
+
+
+class ProgressPrinter:
+    """progress(phase, done, total) callback printing throughput to stderr."""
+    def __init__(self, quiet: bool = False, min_interval: float = 0.5):
+        self.quiet = quiet
+        self.min_interval = min_interval
+        self.started = time.monotonic()
+        self._phase = ""
+        self._phase_started = self.started
+        self._last_print = 0.0
+
+    def __call__(self, phase: str, done: int, total: int) -> None:
+        now = time.monotonic()
+        if phase != self._phase:
+            self._phase, self._phase_started = phase, now
+        if self.quiet or (now - self._last_print < self.min_interval and done != total):
+            return
+        self._last_print = now
+        elapsed = now - self._phase_started
+        rate = done / elapsed if elapsed > 0 else 0.0
+        count = f"{done}/{total}" if total else str(done)  # total 0: not known yet
+        print(f"[{phase}] {count} ({rate:.1f}/s, {now - self.started:.1f}s)", file=sys.stderr)
+
+
+def read_selection_file(path: Path) -> List[SelectedObj] | List[str]:
+    """
+    .jsonl: SelectedObj records (as written by the bridge)
+    other : one Wwise object path per line (resolved through WAAPI)
+    """
+    if path.suffix.lower() == ".jsonl":
+        from utils.manifest_store import read_selected
+        return read_selected(path)
+    lines = [l.strip() for l in path.read_text(encoding="utf-8").splitlines()]
+    # Also accept last_selected.txt lines: wwise_path|source_path|render_name
+    return [l.split("|", 1)[0] for l in lines if l and not l.startswith("#")]
+
+
+def resolve_selection(args, pool=None, manifest=None) -> Optional[List[SelectedObj]]:
+    """
+    Objects named on the command line (resolved through `pool`, default the
+    shared WAAPI pool), or None to use the default source. Objects already
+    in `manifest`'s last selection keep the render name recorded there, so
+    they still match their REAPER tracks.
+    """
+    from utils.wwise_waapi import get_sfx_by_paths, get_sfx_by_query
+
+    paths: List[str] = list(args.path or [])
+    objs: List[SelectedObj] = []
+    if args.from_file:
+        entries = read_selection_file(Path(args.from_file))
+        objs.extend(e for e in entries if isinstance(e, SelectedObj))
+        paths.extend(e for e in entries if isinstance(e, str))
+    if paths:
+        objs.extend(get_sfx_by_paths(paths, pool))
+    if args.query:
+        objs.extend(get_sfx_by_query(args.query, pool))
+
+    if not (args.path or args.from_file or args.query):
+        return None
+    # Same object named twice -> keep the first
+    seen, unique = set(), []
+    for o in objs:
+        if o.id not in seen:
+            seen.add(o.id)
+            unique.append(o)
+    # Render names must be unique across everything that was combined
+    known = {o.id: o.render_name for o in manifest.load() if o.render_name} if manifest else None
+    return assign_render_names(unique, known)
+
+
+def _add_selection_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--path", action="append", metavar="WWISE_PATH",
+                   help="Wwise object path (repeatable); containers expand to their Sounds")
+    p.add_argument("--query", metavar="WAQL", help="WAQL query; matched containers expand to their Sounds")
+    p.add_argument("--from-file", metavar="FILE",
+                   help="selection .jsonl, or a text file with one Wwise path per line")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="WwReaBridge", description="Wwise-REAPER bridge (headless)")
+    parser.add_argument("--config", default=str(config_json_path), help="config.json to use")
+    parser.add_argument("--connection", metavar="PROFILE",
+                        help="connection profile from config.json (default: the active one; '' for none)")
+    parser.add_argument("--json", action="store_true", help="print the result as JSON on stdout")
+    parser.add_argument("--yes", action="store_true",
+                        help="answer yes to prompts (e.g. resume an interrupted render-sync)")
+    parser.add_argument("--quiet", action="store_true", help="no progress output")
+    parser.add_argument("--cprofile", action="store_true",
+                        help=f"run under cProfile; stats go to {log_dir} (same as {PROFILE_ENV}=1)")
+    parser.add_argument(startup_timing.STARTUP_FLAG, action="store_true",
+                        help=f"print start-up phases and import times to stderr (same as {startup_timing.STARTUP_ENV}=1)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_open = sub.add_parser("open", help="write the selection manifest and open it in REAPER")
+    _add_selection_args(p_open)
+
+    p_sync = sub.add_parser("render-sync", help="render in REAPER and import the results into Wwise")
+    _add_selection_args(p_sync)
+
+    sub.add_parser("check-format", help="compare REAPER's render format with the config")
+
+    p_audit = sub.add_parser("audit-sources",
+                             help="check every Sound's original file: missing, changed since the last audit, shared")
+    p_audit.add_argument("--relink", action="store_true",
+                         help="import missing originals found by file name under --search into their Sounds")
+    p_audit.add_argument("--search", action="append", metavar="DIR", default=[],
+                         help="folder to look for missing originals in (repeatable)")
+    p_audit.add_argument("--full", action="store_true",
+                         help="re-list every folder, also those unchanged since the last audit "
+                              "(catches files rewritten in place)")
+    return parser
+
+
+def _emit(result: Result, args, elapsed: float) -> None:
+    if args.json:
+        payload = asdict(result)
+        payload["command"] = args.command
+        payload["elapsed_seconds"] = round(elapsed, 3)
+        items = (result.data or {}).get("items")
+        if items and elapsed > 0:
+            payload["items_per_second"] = round(items / elapsed, 2)
+        print(json.dumps(payload, ensure_ascii=False))
+    else:
+        print(f"[{result.level}] {result.message} ({elapsed:.2f}s)")
+
+
+def _one_line(msg: str) -> str:
+    return " ".join(msg.split())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.cprofile:
+        os.environ[PROFILE_ENV] = "1"
+    configure_logging(log_dir)
+    from utils.reaper_channel import ChannelError
+    from utils.wwise_waapi import CannotConnectToWaapiException, WaapiRequestFailed, close_waapi_pools
+
+    ui = HeadlessUIApi(assume_yes=args.yes, quiet=args.quiet)
+    config = Path(args.config)
+    t0 = time.monotonic()
+
+    # Logs go to stderr already; keep stray output off stdout too, it carries the JSON result
+    quiet_stdout = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+    try:
+        with quiet_stdout:
+            result = _run(args, ui, config)
+    except CannotConnectToWaapiException:
+        result = Result("error", "WAAPI connection failed")
+    except WaapiRequestFailed as e:
+        result = Result("error", _one_line(f"WAAPI request failed: {e}"))
+    except ChannelError as e:
+        result = Result("error", _one_line(f"REAPER command channel: {e}"))
+    finally:
+        close_waapi_pools()
+
+    _emit(result, args, time.monotonic() - t0)
+    return {"info": 0, "warn": 1}.get(result.level, 2)
+
+
+def _run(args, ui: HeadlessUIApi, config: Path) -> Result:
+    from core.bridge_logic import open_in_reaper, modify_source, check_render_format, audit_sources
+    from core.session import open_session
+    from utils.settings_store import ProfileError
+    startup_timing.mark("bridge loaded")
+    if args.startup_report or startup_timing.requested():
+        print(startup_timing.report(), file=sys.stderr)
+
+    profile = args.connection
+    if args.command == "check-format":
+        return check_render_format(ui, config, profile=profile)
+    if args.command == "audit-sources":
+        if args.relink and not args.search:
+            return Result("error", "--relink needs at least one --search folder")
+        return audit_sources(ui, config, relink=args.relink, search_roots=[Path(d) for d in args.search],
+                             progress=ProgressPrinter(quiet=args.quiet), profile=profile, full=args.full)
+
+    try:
+        session = open_session(config, profile)
+    except ProfileError as e:
+        return Result("error", str(e))
+    selection = resolve_selection(args, session.pool, session.manifest)
+    if selection is not None and not selection:
+        return Result("warn", "Selection resolved to no Sound objects")
+    if args.command == "open":
+        return open_in_reaper(config, None, ui, selection=selection, profile=profile)
+    return modify_source(config, None, ui, progress=ProgressPrinter(quiet=args.quiet),
+                         objs=selection, profile=profile)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,135 @@
 # core/bridge_logic.py
 from __future__ import annotations
-import time
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from core.models import Result
-from utils.system import file_exists, open_in_editor, is_reaper_running, launch_reaper_and_run_lua
-from utils.wwise_waapi import get_selected_sfx, import_audio_to_wwise, get_original_sources_by_prop
-from utils.settings_store import load_settings, read_selected
+from core.models import Result, ProgressFn, ImportOutcome, ImportReport, SelectedObj
+from core.render_names import render_key
+from utils.system import file_exists, open_in_editor, is_reaper_running, is_reaper_responsive, launch_reaper_and_run_lua
+from utils.wwise_waapi import (
+    CannotConnectToWaapiException,
+    WaapiConnectionPool,
+    get_selected_sfx,
+    import_audio_to_wwise,
+)
+from utils.settings_store import ProfileError
+from utils.manifest_store import load_selection, export_selection, record_selection
+from utils.render_watch import RenderWatcher, RenderEvent
+from core.streaming_import import StreamingImporter
+from core.source_audit import relink_missing, scan_sources
+from utils.render_cache import RenderHashIndex
+from utils.source_index import SourceIndex
+from utils.wav_info import ExpectedFormat, check_wav, check_wavs, expected_from_render_format
+from core.render_format import RenderFormatError, decode_render_format, validate_render_format
+from utils.reaper_channel import ChannelError, ChannelNotPickedUp
+from utils.render_request import RenderRequest, write_render_request
+from utils.sync_journal import JournalRun, SyncJournal
+from utils.instrumentation import get_logger, instrumented, log_event, span
+from core.session import BridgeSession, open_session
 from utils.app_paths import (
     config_json_path,
     reaper_import_lua_path,
     reaper_render_lua_path,
-    check_render_format_lua_path,
-    temp_render_dir
+    reaper_listener_lua_path,
+    log_dir,
 )
 
+if TYPE_CHECKING:
+    from core.render_analysis import RenderAnalyzer
+
+log = get_logger("bridge")
+
+ANALYSIS_UNAVAILABLE = "Render analysis unavailable: NumPy is not installed."
+
+
+def _cancelled(cancel: threading.Event | None) -> bool:
+    return cancel is not None and cancel.is_set()
+
+def _session(config_path, profile: str | None, ui) -> BridgeSession | Result:
+    try:
+        return open_session(config_path, profile)
+    except ProfileError as e:
+        ui.show_error("Connection profile", str(e))
+        return Result("error", str(e))
+
+def _run_in_reaper(session: BridgeSession, lua_path,
+                   cancel: threading.Event | None = None) -> str | None:
+    """
+    Run a ReaScript in the session's REAPER: through its resident listener
+    when possible, otherwise by launching reaper.exe with the script (which
+    also starts REAPER). Launching is only a fallback for requests the
+    listener never took, so a script never runs twice. Returns an error
+    message if REAPER took the script but could not run it.
+    """
+    settings = session.settings
+    script = session.script(lua_path)
+    with span("reaper.dispatch", script=lua_path.name) as fields:
+        if settings.use_command_channel and is_reaper_running(settings.reaper_path):
+            channel = session.channel
+            if not channel.is_alive():
+                # Start the listener once; later calls skip the relaunch entirely
+                with span("reaper.start_listener"):
+                    launch_reaper_and_run_lua(settings.reaper_path, session.script(reaper_listener_lua_path))
+                    channel.wait_alive(timeout=5.0)
+            if channel.is_alive():
+                fields["via"] = "channel"
+                try:
+                    resp = channel.run_script(script, cancel=cancel)
+                except ChannelNotPickedUp as e:
+                    # Withdrawn unseen, so launching it instead is safe
+                    log.warning("%s", e)
+                except ChannelError as e:
+                    return str(e)
+                else:
+                    if not resp.ok:
+                        return f"REAPER could not run {lua_path.name}: {resp.error}"
+                    return None
+        fields["via"] = "launch"
+        launch_reaper_and_run_lua(settings.reaper_path, script)
+    return None
+
+def _log_waapi_stats(pool: WaapiConnectionPool) -> None:
+    log_event(log, "waapi stats", url=pool.url, **pool.stats.as_dict())
 
-def open_in_reaper(config_path, last_path, ui) -> Result:
-    settings = load_settings(config_path)
+@instrumented("open_in_reaper", profile_dir=log_dir)
+def open_in_reaper(config_path, last_path, ui,
+                   cancel: threading.Event | None = None,
+                   selection: list[SelectedObj] | None = None,
+                   profile: str | None = None) -> Result:
+    """
+    Open the Wwise selection in REAPER. `selection` replaces the Wwise UI
+    selection (headless use: objects resolved by path, query or file).
+    `profile` picks the connection profile (default: the active one);
+    `last_path` None means the profile's last_selected.jsonl.
+    """
+    session = _session(config_path, profile, ui)
+    if isinstance(session, Result):
+        return session
+    settings = session.settings
+    last_path = last_path or session.paths.last_selected_jsonl
     if not file_exists(settings.reaper_path):
         return Result("error", "reaper.exe not found!")
 
-    selection = get_selected_sfx()
+    with span("selection.query", profile=session.profile or None) as fields:
+        if selection is not None:
+            record_selection(session.manifest, selection, session.paths.last_selected_txt)
+        else:
+            # Prefetched (and its manifest already written) when live selection is on
+            watcher = session.watcher
+            if settings.live_selection and watcher.running:
+                selection = watcher.snapshot()
+                fields["via"] = "live" if selection is not None else "query"
+            if selection is None:
+                selection = get_selected_sfx(session.pool, session.manifest, session.paths.last_selected_txt)
+        fields["items"] = len(selection) if selection is not None else None
     if selection is None:
         ui.show_error("Error", "Could not connect to Wwise. Is it running?")
         return Result("error", "WAAPI connection failed")
 
     if not selection:
-        last = read_selected(last_path)
+        manifest = session.manifest
+        last = load_selection(manifest, last_path)
         if not last:
             ui.show_info("Error", "No objects selected and no history found.")
             return Result("warn", "No selection and no history")
@@ -36,96 +139,425 @@ def open_in_reaper(config_path, last_path, ui) -> Result:
             "No object selected. Open last selection file for modification?",
         )
         if choice:
+            export_selection(manifest, last_path)
             open_in_editor(last_path)
 
-    launch_reaper_and_run_lua(settings.reaper_path, reaper_import_lua_path)
-    return Result("info", f"Opening REAPER. Logged {len(selection)} item(s).")
+    if _cancelled(cancel):
+        return Result("warn", "Cancelled")
+    error = _run_in_reaper(session, reaper_import_lua_path, cancel)
+    _log_waapi_stats(session.pool)
+    if error:
+        if _cancelled(cancel):
+            return Result("warn", "Cancelled")
+        ui.show_error("Error", error)
+        return Result("error", error)
+    return Result("info", f"Opening REAPER. Logged {len(selection)} item(s).",
+                  data={"items": len(selection), "profile": session.profile or None,
+                        "waapi": session.pool.stats.as_dict()})
+
+def _report(progress: ProgressFn | None, phase: str, done: int = 0, total: int = 0) -> None:
+    if progress is not None:
+        progress(phase, done, total)
+
+def _resumable_run(journal: SyncJournal, objs: list[SelectedObj], ui) -> JournalRun | None:
+    """The interrupted run for this same selection, if there is one and the user wants it resumed."""
+    run = journal.load()
+    if run is None or not run.matches(objs):
+        return None
+    counts = run.counts()
+    done = counts.get("imported", 0) + counts.get("skipped", 0)
+    rendered = counts.get("rendered", 0) + counts.get("validated", 0)
+    if not done and not rendered:
+        return None
+    resume = ui.ask_yes_no(
+        "Resume sync",
+        f"The last sync of these {len(objs)} object(s) was interrupted "
+        f"({done} imported, {rendered} rendered but not imported).\n"
+        "Resume it? 'No' renders and imports everything again.",
+    )
+    return run if resume else None
+
+@instrumented("modify_source", profile_dir=log_dir)
+def modify_source(config_path, last_path, ui,
+                  progress: ProgressFn | None = None,
+                  cancel: threading.Event | None = None,
+                  objs: list[SelectedObj] | None = None,
+                  profile: str | None = None) -> Result:
+    """
+    Render the REAPER project and import the results back into Wwise.
+    `objs` replaces the last selection history (headless use). `profile`
+    picks the connection profile (default: the active one); `last_path`
+    None means the profile's last_selected.jsonl.
+    """
+    session = _session(config_path, profile, ui)
+    if isinstance(session, Result):
+        return session
+    paths = session.paths
+    last_path = last_path or paths.last_selected_jsonl
 
-def modify_source(config_path, last_path, ui) -> Result:
     # Check if REAPER is running
-    if not is_reaper_running():
+    with span("reaper.probe"):
+        # This profile's REAPER; another profile's instance doesn't count
+        running = is_reaper_running(session.settings.reaper_path)
+        responsive = running and is_reaper_responsive(session.settings.reaper_path)
+    if not running:
         ui.show_error("Error", "REAPER is not running.\nPlease open REAPER and the project first.")
         return Result("error", "REAPER not running")
+    if not responsive:
+        ui.show_error("Error", "REAPER is not responding.\nClose any open dialogs in REAPER and try again.")
+        return Result("error", "REAPER not responding")
 
     # Check History
-    if not last_path.exists():
-        ui.show_error("Error", "No history file found. Use 'Open in REAPER' first.")
-        return Result("error", "No history found")
-
-    objs = read_selected(last_path)
+    if objs is None:
+        manifest = session.manifest
+        if manifest.updated_at() is None and not last_path.exists():
+            ui.show_error("Error", "No history file found. Use 'Open in REAPER' first.")
+            return Result("error", "No history found")
+        with span("selection.load"):
+            objs = load_selection(manifest, last_path)
+    elif objs:
+        # REAPER's render script reads the recorded manifest
+        record_selection(session.manifest, objs, paths.last_selected_txt)
     if not objs:
         return Result("warn", "History is empty")
 
     # Validate Reaper Path
-    settings = load_settings(config_path)
+    settings = session.settings
     if not file_exists(settings.reaper_path):
         return Result("error", "reaper.exe not found!")
+    try:
+        validate_render_format(settings.reaper_render_format)
+    except RenderFormatError as e:
+        ui.show_error("Render format", f"Configured RENDER_FORMAT can't be used:\n{e}")
+        return Result("error", f"Invalid render format: {e}")
 
-    temp_render_dir.mkdir(parents=True, exist_ok=True)
+    analyzer = None
+    if settings.analyze_renders:
+        # Pulls in NumPy; only loaded when analysis is on
+        from core.render_analysis import make_analyzer
+        analyzer = make_analyzer(settings)
+        if analyzer is None and settings.block_outliers:
+            # Outliers are meant to be kept out of Wwise; don't import unscreened renders
+            ui.show_error("Render analysis", ANALYSIS_UNAVAILABLE + "\nDisable 'block outliers' to sync without it.")
+            return Result("error", ANALYSIS_UNAVAILABLE)
 
-    for item in temp_render_dir.iterdir():
-        if item.is_file():
-            try:
-                item.unlink(missing_ok=True)
-            except OSError:
-                print(f"Warning: Could not delete {item}")
+    # Resume an interrupted sync: skip what was imported, reuse intact renders
+    journal = SyncJournal(paths.sync_journal)
+    resumed = _resumable_run(journal, objs, ui)
+    done_ids = resumed.done_ids() if resumed else set()
+    todo = [o for o in objs if o.id not in done_ids]
+
+    # Each sync renders into its own run folder; old runs are removed in the background
+    workspace = session.workspace()
+    with span("render.workspace", profile=session.profile or None) as fields:
+        if resumed and resumed.render_dir and Path(resumed.render_dir).is_dir():
+            render_dir = workspace.reuse_run(Path(resumed.render_dir))
+        else:
+            render_dir = workspace.new_run()
+        fields["dir"] = str(render_dir)
+    reused = {render_key(o) for o in todo
+              if resumed and resumed.reusable_render(o.id, render_dir / f"{render_key(o)}.wav")}
+    to_render = [o for o in todo if render_key(o) not in reused]
+    if resumed:
+        # Only a resumed run folder has leftovers: drop all but the reusable renders
+        keep_files = {f"{k}.wav" for k in reused} | {".last_used"}
+        for item in render_dir.iterdir():
+            if item.is_file() and item.name not in keep_files:
+                try:
+                    item.unlink(missing_ok=True)
+                except OSError:
+                    log.warning("Could not delete %s", item)
+
+    if _cancelled(cancel):
+        workspace.release(render_dir)
+        return Result("warn", "Cancelled")
 
+    if resumed:
+        journal.resume(resumed, objs)
+        log_event(log, "resuming sync", run=resumed.run_id, done=len(done_ids),
+                  reused=len(reused), render=len(to_render))
+        if not todo:
+            journal.complete()
+            workspace.release(render_dir)
+            return Result("info", f"Sync Complete. All {len(objs)} object(s) were imported by the interrupted run.")
+    else:
+        journal.begin(objs, render_dir)
+    # Resumed: only the tracks still missing, existing renders stay
+    write_render_request(paths.render_request, RenderRequest(
+        [render_key(o) for o in to_render] if resumed else None,
+        keep_existing=bool(resumed),
+        render_dir=str(render_dir),
+        render_format=settings.reaper_render_format,
+    ))
 
-    launch_reaper_and_run_lua(settings.reaper_path, reaper_render_lua_path)
+    cache = RenderHashIndex(paths.render_hash_index) if settings.skip_unchanged_renders else None
+    expected = (expected_from_render_format(settings.reaper_render_format)
+                if settings.validate_render_format else None)
 
+    importer = None
+    if settings.streaming_import:
+        importer = StreamingImporter(
+            todo,
+            render_dir,
+            lambda tasks: _import(tasks, session, analyzer, journal),
+            chunk_size=settings.import_chunk_size,
+            on_imported=lambda done, total: _report(progress, "import", done, total),
+            cache=cache,
+            expected=expected,
+            journal=journal,
+        )
+        for name in reused:
+            importer.on_rendered(name)
+
+    def on_render_event(ev: RenderEvent) -> None:
+        if ev.kind == "rendered":
+            journal.mark_rendered(ev.name, render_dir / f"{ev.name}.wav")
+            _report(progress, "render", len(watcher.rendered), watcher.total or len(to_render))
+            if importer is not None:
+                importer.on_rendered(ev.name)
+
+    if to_render:
+        # Watch before launching so no progress line is missed
+        watcher = RenderWatcher(render_dir, on_event=on_render_event)
+        with watcher:
+            _report(progress, "render", 0, len(to_render))
+            error = _run_in_reaper(session, reaper_render_lua_path, cancel)
 
-    # Query Wwise details BY PATH (not by id)
-    obj_paths = [o.path for o in objs if o.path]
-    wwise_details = get_original_sources_by_prop(obj_paths,"path", None)
-    print(f"details:{wwise_details}")
+            timeout_seconds = 60 * (len(to_render) + 1)
+            with span("render.wait", items=len(to_render)) as fields:
+                finished = not error and watcher.wait(timeout_seconds, cancel=cancel)
+                fields.update(finished=finished, rendered=len(watcher.rendered))
+            if not finished:
+                # The journal stays behind so the next sync can resume
+                journal.close()
+                write_render_request(paths.render_request, None)
+                workspace.release(render_dir)
+                if importer is not None:
+                    importer.cancel()
+                if _cancelled(cancel):
+                    return Result("warn", "Cancelled while REAPER was rendering.")
+                if error:
+                    return Result("error", error)
+                if watcher.failed:
+                    return Result("error", f"Lost track of the REAPER render: {watcher.error}")
+                return Result("error", "Timeout: Reaper script did not finish in time.")
 
-    success_flag = temp_render_dir / "success.flag"
-    timeout_seconds = 60 * (len(obj_paths) + 1)
-    start_time = time.time()
+        # Optional: Delete flag immediately after detection
+        try:
+            watcher.success_flag.unlink(missing_ok=True)
+        except OSError:
+            pass
+    write_render_request(paths.render_request, None)
 
-    # Poll for the flag
-    while not success_flag.exists():
-        if time.time() - start_time > timeout_seconds:
-            return Result("error", "Timeout: Reaper script did not finish in time.")
-        time.sleep(0.2)
+    if importer is not None:
+        with span("import.drain"):
+            report = importer.finish()
+    else:
+        with span("render.map", items=len(objs)) as fields:
+            waapi_tasks, report = _map_rendered(todo, render_dir, cache, expected, journal)
+            fields.update(tasks=len(waapi_tasks), skipped=report.skipped, invalid=report.failed)
+        if waapi_tasks:
+            # Import to Wwise
+            _report(progress, "import", 0, len(waapi_tasks))
+            imported = _import(waapi_tasks, session, analyzer, journal)
+            if cache is not None:
+                cache.commit(o.object_id for o in imported.outcomes
+                             if o.status == "imported" and o.object_id)
+            report.extend(imported)
 
+    if cache is not None:
+        with span("cache.save"):
+            cache.save()
+    journal.complete()
+    workspace.release(render_dir)
+
+    if not report.outcomes:
+        return Result("warn", "Reaper finished, but no matching WAV files were found for selected objects.")
+    log_event(log, f"import: {report.summary()}",
+              imported=report.imported, skipped=report.skipped, failed=report.failed)
+    _log_waapi_stats(session.pool)
+
+    attempted = report.imported + report.failed
+    msg = f"Sync Complete. Imported {report.imported}/{attempted} files."
+    if report.skipped:
+        msg += f" Skipped {report.skipped} unchanged."
+    if resumed:
+        msg += f" Resumed: {len(done_ids)} already imported, {len(reused)} render(s) reused."
+    data = {
+        "items": len(objs),
+        "profile": session.profile or None,
+        "resumed": {"done": len(done_ids), "reused": len(reused)} if resumed else None,
+        "imported": report.imported,
+        "skipped": report.skipped,
+        "failed": report.failed,
+        "failures": [{"object_path": o.object_path, "reason": o.reason} for o in report.failures()],
+        "waapi": session.pool.stats.as_dict(),
+    }
+    if settings.analyze_renders and analyzer is None:
+        msg += " " + ANALYSIS_UNAVAILABLE
+        data["analysis"] = "unavailable"
+    if analyzer is not None:
+        data["metrics"] = {o.object_path: o.metrics for o in report.outcomes if o.metrics}
+        outliers = sum(1 for m in data["metrics"].values() if "outlier" in m)
+        if outliers:
+            msg += f" {outliers} loudness/peak outlier(s)."
+    if report.failed:
+        return Result("warn", msg + f" {report.failed} failed (see log).", data=data)
+    if "analysis" in data:
+        return Result("warn", msg, data=data)
+    return Result("info", msg, data=data)
+
+def _import(tasks: list[dict], session: BridgeSession,
+            analyzer: RenderAnalyzer | None = None,
+            journal: SyncJournal | None = None) -> ImportReport:
+    metrics: dict[str, dict] = {}
+    report = ImportReport()
+    if analyzer is not None:
+        tasks, report, metrics = analyzer.screen(tasks)
+    if tasks:
+        settings = session.settings
+        report.extend(import_audio_to_wwise(
+            tasks,
+            session.pool,
+            batch_size=settings.import_batch_size,
+            max_workers=settings.import_concurrency,
+            retries=settings.import_retries,
+        ))
+    for o in report.outcomes:
+        if o.metrics is None:
+            o.metrics = metrics.get(o.audio_file)
+    if journal is not None:
+        journal.record_outcomes(report.outcomes)
+    return report
+
+def _map_rendered(objs, render_dir: Path,
+                  cache: RenderHashIndex | None = None,
+                  expected: ExpectedFormat | None = None,
+                  journal: SyncJournal | None = None) -> tuple[list[dict], ImportReport]:
     # --- Mapping Phase ---
     waapi_tasks = []
+    report = ImportReport()
 
-    for obj in objs:
-        # Logic: If <name>.wav exists, we prepare it for import.
-        # This assumes the Reaper script names files exactly as `obj.name`.
-        expected_wav = temp_render_dir / f"{obj.name}.wav"
+    # REAPER tracks (and so the rendered files) are named after render_key(obj)
+    wavs = {obj: render_dir / f"{render_key(obj)}.wav" for obj in objs}
+    # Header-only check of every render (completeness, format), in parallel
+    checks = check_wavs({w for w in wavs.values() if w.exists()}, expected)
 
-        if expected_wav.exists():
-            waapi_tasks.append({
-                "objectPath": obj.path,
-                "audioFile": str(expected_wav.resolve())
-            })
+    for obj, expected_wav in wavs.items():
+        check = checks.get(expected_wav)
+        if check is None:
+            continue
+        if not check.ok:
+            report.outcomes.append(ImportOutcome(
+                obj.path, str(expected_wav), "failed", f"invalid render: {check.reason}", object_id=obj.id))
+            continue
+        if journal is not None:
+            journal.mark_rendered(render_key(obj), expected_wav, "validated")
+        if cache is not None and not cache.needs_import(obj, expected_wav):
+            report.outcomes.append(ImportOutcome(
+                obj.path, str(expected_wav), "skipped", "unchanged render", object_id=obj.id))
+            continue
+        waapi_tasks.append({
+            "objectPath": obj.path,
+            "audioFile": str(expected_wav.resolve()),
+            "objectId": obj.id,
+        })
+    return waapi_tasks, report
 
-    # Optional: Delete flag immediately after detection
+@instrumented("check_render_format", profile_dir=log_dir)
+def check_render_format(ui, config_path=config_json_path, profile: str | None = None):
+    """
+    Compare the configured render format with the latest renders and, if the
+    command listener is up, the active REAPER project. Nothing is launched.
+    """
+    session = _session(config_path, profile, ui)
+    if isinstance(session, Result):
+        return session
+    settings = session.settings
     try:
-        success_flag.unlink(missing_ok=True)
-    except OSError:
-        pass
+        fmt = decode_render_format(settings.reaper_render_format)
+    except RenderFormatError as e:
+        ui.show_error("Render format", f"Configured RENDER_FORMAT is invalid:\n{e}")
+        return Result("error", f"Invalid render format: {e}")
 
-    if not waapi_tasks:
-        return Result("warn", "Reaper finished, but no matching WAV files were found for selected objects.")
-    print(f"tasks:{waapi_tasks}")
-    # Import to Wwise
-    success_count = import_audio_to_wwise(waapi_tasks)
-
-    return Result("info", f"Sync Complete. Imported {success_count}/{len(waapi_tasks)} files.")
-
-def check_render_format(ui):
-    settings = load_settings(config_json_path)
-    # 1) Check REAPER running
-    if not is_reaper_running():
-        ui.show_error(
-            "Error",
-            "REAPER is not running.\nPlease open REAPER and the project first."
-        )
-        return Result("error", "REAPER not running")
+    lines = [f"Configured: {fmt.describe()}"]
+    problems: list[str] = []
+
+    last_run = session.workspace().latest_run()
+    last_wav = next(iter(sorted(last_run.glob("*.wav"))), None) if last_run is not None else None
+    if last_wav is not None:
+        check = check_wav(last_wav, expected_from_render_format(settings.reaper_render_format))
+        if check.info is not None:
+            lines.append(f"Last render ({last_wav.name}): {check.info.bits}-bit, {check.info.sample_rate} Hz")
+        if check.reason:
+            problems.append(f"last render: {check.reason}")
+
+    if settings.use_command_channel and is_reaper_running(settings.reaper_path):
+        channel = session.channel
+        if channel.is_alive():
+            try:
+                actual = channel.get_render_format()
+            except ChannelError as e:
+                actual = None
+                log.warning("%s", e)
+            if actual:
+                try:
+                    project_fmt = decode_render_format(actual)
+                    lines.append(f"REAPER project: {project_fmt.describe()} (replaced by the configured format on export)")
+                    diffs = fmt.diff(project_fmt)
+                    if diffs:
+                        lines.append("  differs: " + "; ".join(diffs))
+                except RenderFormatError as e:
+                    lines.append(f"REAPER project: unrecognized ({e})")
+
+    if problems:
+        lines.append("")
+        lines.extend(problems)
+    ui.show_info("Render format", "\n".join(lines))
+    if problems:
+        return Result("warn", "Render format: " + "; ".join(problems))
+    return Result("info", f"Render format OK ({fmt.describe()}).")
+
+@instrumented("audit_sources", profile_dir=log_dir)
+def audit_sources(ui, config_path=config_json_path,
+                  relink: bool = False,
+                  search_roots: list[Path] | tuple[Path, ...] = (),
+                  progress: ProgressFn | None = None,
+                  cancel: threading.Event | None = None,
+                  profile: str | None = None,
+                  full: bool = False) -> Result:
+    """
+    Check every Sound's original file (missing, changed since the last
+    audit, shared by several Sounds). With `relink`, missing files found by
+    name under `search_roots` are imported back into their Sounds. `full`
+    re-lists folders that look unchanged since the last audit.
+    """
+    session = _session(config_path, profile, ui)
+    if isinstance(session, Result):
+        return session
+    settings = session.settings
+    index = SourceIndex(session.paths.source_index)
+    try:
+        try:
+            audit = scan_sources(session.pool, index,
+                                 page_size=settings.source_audit_page_size,
+                                 workers=settings.source_audit_workers,
+                                 progress=progress, cancel=cancel, full=full)
+        except CannotConnectToWaapiException:
+            ui.show_error("Error", "Could not connect to Wwise. Is it running?")
+            return Result("error", "WAAPI connection failed")
+    finally:
+        index.close()
+    if audit is None:
+        return Result("warn", "Cancelled")
+    if relink and audit.missing and not _cancelled(cancel):
+        relink_missing(audit, search_roots, lambda tasks: _import(tasks, session), progress)
 
-    launch_reaper_and_run_lua(settings.reaper_path, check_render_format_lua_path)
-    return Result("info", f"Show repear config string in Reaper Console.")
\ No newline at end of file
+    log_event(log, f"source audit: {audit.summary()}",
+              sounds=audit.sounds, missing=len(audit.missing), changed=len(audit.changed))
+    _log_waapi_stats(session.pool)
+    data = {"profile": session.profile or None, **audit.as_dict(), "waapi": session.pool.stats.as_dict()}
+    msg = f"Source audit: {audit.summary()}."
+    if audit.missing or audit.relinked.failed:
+        return Result("warn", msg, data=data)
+    return Result("info", msg, data=data)
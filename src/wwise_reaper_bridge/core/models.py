@@ -1,9 +1,12 @@
 # core/models.py
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Literal, Optional
+from dataclasses import dataclass, field
+from typing import Callable, List, Literal, Optional
 
 Level = Literal["info", "warn", "error"]
+ImportStatus = Literal["imported", "skipped", "failed"]
+# progress(phase, done, total)
+ProgressFn = Callable[[str, int, int], None]
 DEFAULT_RENDER_FORMAT = "ZXZhdxgAAQ=="
 DEFAULT_REAPER_PATH = r"C:\Program Files\REAPER (x64)\reaper.exe"
 
@@ -11,11 +14,67 @@ DEFAULT_REAPER_PATH = r"C:\Program Files\REAPER (x64)\reaper.exe"
 class Result:
     level: Level
     message: str
+    # Machine-readable details for the CLI / logs
+    data: Optional[dict] = None
+
+@dataclass
+class ConnectionProfile:
+    """
+    A named Wwise/REAPER pairing. Empty fields fall back to the top-level
+    settings; each profile keeps its own manifests and render runs.
+    """
+    name: str
+    # ws://host:port/waapi ("" = waapi-client's default, localhost:8080)
+    waapi_url: str = ""
+    reaper_path: str = ""
+    reaper_render_format: str = ""
+    render_root: str = ""
 
 @dataclass
 class Settings:
     reaper_path: str = DEFAULT_REAPER_PATH
     reaper_render_format: str = DEFAULT_RENDER_FORMAT
+    # Import rendered files while REAPER is still rendering the rest
+    streaming_import: bool = True
+    import_chunk_size: int = 16
+    # Skip renders that are bit-identical to the current Wwise source
+    skip_unchanged_renders: bool = True
+    # ak.wwise.core.audio.import batching
+    import_batch_size: int = 100
+    import_concurrency: int = 1
+    import_retries: int = 1
+    # Talk to a resident listener script instead of relaunching reaper.exe
+    use_command_channel: bool = True
+    # Reject renders whose sample rate / bit depth differ from the render format
+    validate_render_format: bool = True
+    # Measure peak / loudness of each render before import (needs NumPy)
+    analyze_renders: bool = False
+    loudness_target_lufs: Optional[float] = None
+    loudness_tolerance_lu: float = 6.0
+    max_peak_dbfs: float = -0.1
+    # Fail outliers instead of importing them with a warning
+    block_outliers: bool = False
+    # Analysis worker processes (0 = one per CPU)
+    analysis_workers: int = 0
+    # Render runs go to per-sync subfolders of this folder ("" = local app data)
+    render_root: str = ""
+    # Prefer a RAM-backed folder (Linux /dev/shm); on Windows set render_root to a RAM disk
+    render_to_ram: bool = False
+    # Old runs are removed beyond this many / this size (0 = no size limit)
+    render_keep_runs: int = 5
+    render_quota_mb: int = 2048
+    # Follow the Wwise selection in the background so "Open in REAPER" needn't query it
+    live_selection: bool = False
+    # Source audit: Sounds per WAAPI query, and folders listed at once
+    source_audit_page_size: int = 2000
+    source_audit_workers: int = 16
+    waapi_url: str = ""
+    # Connection profiles; operations use `active_profile` unless told otherwise ("" = none)
+    profiles: List[ConnectionProfile] = field(default_factory=list)
+    active_profile: str = ""
+
+    def get_profile(self, name: str) -> Optional[ConnectionProfile]:
+        return next((p for p in self.profiles if p.name == name), None)
 
 @dataclass(frozen=True)
 class SelectedObj:
@@ -24,3 +83,45 @@ class SelectedObj:
     path: str
     type: str
     source_path: Optional[str] = None
+    # Collision-free file stem / REAPER track name (core.render_names)
+    render_name: Optional[str] = None
+
+@dataclass
+class ImportOutcome:
+    object_path: str
+    audio_file: str
+    status: ImportStatus
+    reason: str = ""
+    # Wall time of the import call that handled this item
+    seconds: float = 0.0
+    object_id: Optional[str] = None
+    # Peak / RMS / LUFS of the render when analysis is enabled
+    metrics: Optional[dict] = None
+
+@dataclass
+class ImportReport:
+    outcomes: List[ImportOutcome] = field(default_factory=list)
+
+    def count(self, status: ImportStatus) -> int:
+        return sum(1 for o in self.outcomes if o.status == status)
+
+    @property
+    def imported(self) -> int:
+        return self.count("imported")
+
+    @property
+    def skipped(self) -> int:
+        return self.count("skipped")
+
+    @property
+    def failed(self) -> int:
+        return self.count("failed")
+
+    def failures(self) -> List[ImportOutcome]:
+        return [o for o in self.outcomes if o.status == "failed"]
+
+    def extend(self, other: "ImportReport") -> None:
+        self.outcomes.extend(other.outcomes)
+
+    def summary(self) -> str:
+        return f"imported {self.imported}, skipped {self.skipped}, failed {self.failed}"
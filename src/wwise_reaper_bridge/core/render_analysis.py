@@ -0,0 +1,121 @@
+# core/render_analysis.py
+from __future__ import annotations
+import atexit
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from core.models import ImportOutcome, ImportReport, Settings
+from utils import audio_metrics
+from utils.audio_metrics import AudioMetrics
+from utils.instrumentation import get_logger, span
+
+log = get_logger("analysis")
+
+# Below this many files a chunk is analyzed in-process; spawning workers costs more
+_POOL_MIN_FILES = 8
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def get_analysis_executor(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Process-wide worker pool, created on first use and kept for later syncs
+    (worker start-up includes importing NumPy). Recreated if the worker
+    count changes.
+    """
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is not None and _executor_workers != max_workers:
+            _executor.shutdown(wait=False)
+            _executor = None
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=max_workers)
+            _executor_workers = max_workers
+        return _executor
+
+
+def shutdown_analysis_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+
+atexit.register(shutdown_analysis_executor)
+
+
+class RenderAnalyzer:
+    """
+    Optional loudness/peak screen in front of the Wwise import.
+
+    `screen(tasks)` measures every task's audio file (peak, RMS, integrated
+    LUFS) and returns the tasks to import, failed outcomes for blocked
+    outliers and the metrics per audio file. Larger batches are spread
+    over the shared worker processes.
+    """
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.max_workers = settings.analysis_workers or os.cpu_count() or 1
+
+    def outlier_reason(self, m: AudioMetrics) -> str:
+        s = self.settings
+        reasons = []
+        if m.clipped_samples:
+            reasons.append(f"{m.clipped_samples} clipped samples")
+        elif m.peak_dbfs > s.max_peak_dbfs:
+            reasons.append(f"peak {m.peak_dbfs:.1f} dBFS > {s.max_peak_dbfs:.1f}")
+        if s.loudness_target_lufs is not None and abs(m.lufs - s.loudness_target_lufs) > s.loudness_tolerance_lu:
+            reasons.append(f"{m.lufs:.1f} LUFS, target {s.loudness_target_lufs:.1f} "
+                           f"±{s.loudness_tolerance_lu:g}")
+        return "; ".join(reasons)
+
+    def screen(self, tasks: List[dict]) -> Tuple[List[dict], ImportReport, Dict[str, dict]]:
+        files = list(dict.fromkeys(t["audioFile"] for t in tasks))
+        use_pool = len(files) >= _POOL_MIN_FILES and self.max_workers > 1
+        with span("render.analyze", files=len(files), pool=use_pool) as fields:
+            executor = get_analysis_executor(self.max_workers) if use_pool else None
+            results = audio_metrics.analyze_many(files, executor)
+
+            metrics: Dict[str, dict] = {}
+            blocked: Dict[str, str] = {}
+            for path, m in results.items():
+                key = str(path)
+                if isinstance(m, str):
+                    log.warning("Could not analyze %s: %s", Path(key).name, m)
+                    continue
+                metrics[key] = m.as_dict()
+                reason = self.outlier_reason(m)
+                if reason:
+                    metrics[key]["outlier"] = reason
+                    log.warning("%s: %s", Path(key).name, reason)
+                    if self.settings.block_outliers:
+                        blocked[key] = reason
+            fields.update(outliers=sum("outlier" in m for m in metrics.values()), blocked=len(blocked))
+
+        report = ImportReport()
+        keep = []
+        for t in tasks:
+            reason = blocked.get(t["audioFile"])
+            if reason is None:
+                keep.append(t)
+                continue
+            report.outcomes.append(ImportOutcome(
+                t["objectPath"], t["audioFile"], "failed", f"blocked: {reason}",
+                object_id=t.get("objectId"), metrics=metrics.get(t["audioFile"])))
+        return keep, report, metrics
+
+
+def make_analyzer(settings: Settings) -> Optional[RenderAnalyzer]:
+    """A RenderAnalyzer if analysis is enabled and NumPy is available."""
+    if not settings.analyze_renders:
+        return None
+    if not audio_metrics.available():
+        log.warning("Render analysis is enabled but NumPy is not installed; skipping it")
+        return None
+    return RenderAnalyzer(settings)
@@ -0,0 +1,88 @@
+# core/render_format.py
+from __future__ import annotations
+import base64
+import binascii
+from dataclasses import dataclass
+from typing import List, Optional
+
+# REAPER stores RENDER_FORMAT as base64 of a sink config blob. The blob starts
+# with the sink's fourcc written little-endian ("wave" -> b"evaw"), followed by
+# sink-specific bytes. For WAV and AIFF the first of those is the bit depth.
+CONTAINERS = {
+    b"evaw": "wav",
+    b"ffia": "aiff",
+    b"calf": "flac",
+    b"l3pm": "mp3",
+    b"vggo": "ogg",
+    b"SggO": "opus",
+    b"kpvw": "wavpack",
+}
+_FOURCC = {v: k for k, v in CONTAINERS.items()}
+_HAS_BITS = ("wav", "aiff")
+WAV_BITS = (8, 16, 24, 32, 64)
+
+
+class RenderFormatError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class RenderFormat:
+    container: str
+    bits: Optional[int] = None
+    # Remaining sink bytes, kept verbatim so encode() round-trips
+    options: bytes = b""
+
+    def describe(self) -> str:
+        name = self.container.upper()
+        return f"{name} {self.bits}-bit" if self.bits else name
+
+    def diff(self, other: "RenderFormat") -> List[str]:
+        """Differences from `other`, one readable line each."""
+        out = []
+        if self.container != other.container:
+            out.append(f"container {other.container}, expected {self.container}")
+        if self.bits != other.bits:
+            out.append(f"{other.bits}-bit, expected {self.bits}-bit")
+        if self.options != other.options:
+            out.append(f"options {other.options.hex() or '-'}, expected {self.options.hex() or '-'}")
+        return out
+
+
+def decode_render_format(value: str) -> RenderFormat:
+    try:
+        raw = base64.b64decode(value.strip(), validate=True)
+    except (binascii.Error, ValueError) as e:
+        raise RenderFormatError(f"not valid base64: {e}") from None
+    if len(raw) < 4:
+        raise RenderFormatError("too short for a REAPER render format")
+    container = CONTAINERS.get(raw[:4])
+    if container is None:
+        raise RenderFormatError(f"unknown output format {raw[:4][::-1].decode('latin-1')!r}")
+    if container in _HAS_BITS:
+        if len(raw) < 5:
+            raise RenderFormatError(f"{container.upper()} format without bit depth")
+        return RenderFormat(container, raw[4], raw[5:])
+    return RenderFormat(container, None, raw[4:])
+
+
+def encode_render_format(fmt: RenderFormat) -> str:
+    fourcc = _FOURCC.get(fmt.container)
+    if fourcc is None:
+        raise RenderFormatError(f"unknown output format {fmt.container!r}")
+    raw = fourcc
+    if fmt.container in _HAS_BITS:
+        if fmt.bits is None:
+            raise RenderFormatError(f"{fmt.container.upper()} format without bit depth")
+        raw += bytes([fmt.bits])
+    return base64.b64encode(raw + fmt.options).decode("ascii")
+
+
+def validate_render_format(value: str) -> RenderFormat:
+    """Decode and check the format is something the bridge can hand to Wwise (WAV)."""
+    fmt = decode_render_format(value)
+    if fmt.container != "wav":
+        raise RenderFormatError(f"Wwise imports WAV files; render format is {fmt.describe()}")
+    if fmt.bits not in WAV_BITS:
+        raise RenderFormatError(f"unsupported WAV bit depth {fmt.bits}")
+    return fmt
@@ -0,0 +1,63 @@
+# core/render_names.py
+from __future__ import annotations
+import dataclasses
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+from core.models import SelectedObj
+
+# Characters REAPER/Windows can't put in a file name
+_ILLEGAL = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+
+
+def sanitize_file_stem(name: str) -> str:
+    name = _ILLEGAL.sub("_", name.strip())
+    name = name.rstrip(". ")
+    return name or "WwiseItem"
+
+
+def _guid_hex(guid: str) -> str:
+    return re.sub(r"[^0-9A-Fa-f]", "", guid).upper()
+
+
+def render_key(obj: SelectedObj) -> str:
+    """File stem / REAPER track name the render of `obj` is written under."""
+    return obj.render_name or obj.name
+
+
+def assign_render_names(objs: List[SelectedObj],
+                        known: Optional[Dict[str, str]] = None) -> List[SelectedObj]:
+    """
+    Give every object a render file name that is unique in the batch.
+
+    Objects keep their (sanitized) Wwise name when it is unique; names shared
+    by several Sounds get the first 8 hex digits of the GUID appended, or the
+    whole GUID if even that collides. Names are compared case-insensitively
+    (Windows file system). Deterministic, so re-resolving the same selection
+    yields the same file names.
+
+    `known` maps GUIDs to render names already in use (REAPER's tracks are
+    named after them): those objects keep theirs and the others avoid them.
+    """
+    known = known or {}
+    kept = {o.id: known[o.id] for o in objs if known.get(o.id)}
+    taken = Counter(n.lower() for n in kept.values())
+    fresh = [o for o in objs if o.id not in kept]
+    stems = {o.id: sanitize_file_stem(o.name) for o in fresh}
+    stem_counts = Counter(s.lower() for s in stems.values())
+    names = {}
+    for o in fresh:
+        stem = stems[o.id]
+        unique = stem_counts[stem.lower()] == 1 and not taken[stem.lower()]
+        names[o.id] = stem if unique else f"{stem}_{_guid_hex(o.id)[:8]}"
+    name_counts = Counter(n.lower() for n in names.values()) + taken
+    out = []
+    for o in objs:
+        name = kept.get(o.id)
+        if name is None:
+            name = names[o.id]
+            if name_counts[name.lower()] > 1:
+                name = f"{stems[o.id]}_{_guid_hex(o.id)}"
+        out.append(o if o.render_name == name else dataclasses.replace(o, render_name=name))
+    return out
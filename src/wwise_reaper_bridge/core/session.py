@@ -0,0 +1,91 @@
+# core/session.py
+from __future__ import annotations
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.models import Settings
+from utils.app_paths import ProfilePaths, profile_paths
+from utils.manifest_store import SelectionManifest, get_selection_manifest
+from utils.reaper_channel import ReaperChannel, get_reaper_channel, write_atomic
+from utils.render_workspace import RenderWorkspace
+from utils.selection_watch import SelectionWatcher, get_selection_watcher
+from utils.settings_store import apply_profile, load_settings
+from utils.wwise_waapi import WaapiConnectionPool, get_waapi_pool
+
+_scripts_lock = threading.Lock()
+
+
+def _lua_string(s: str) -> str:
+    level = "="
+    while f"]{level}]" in s:
+        level += "="
+    return f"[{level}[{s}]{level}]"
+
+
+@dataclass(frozen=True)
+class BridgeSession:
+    """
+    One connection profile's view of the bridge: its settings (profile
+    values filled in), WAAPI pool, REAPER channel, selection manifest and
+    render folder. Sessions of different profiles share nothing they write
+    to, so their round-trips can run at the same time.
+    """
+    profile: str
+    settings: Settings
+    paths: ProfilePaths
+
+    @property
+    def pool(self) -> WaapiConnectionPool:
+        return get_waapi_pool(self.settings.waapi_url or None)
+
+    @property
+    def channel(self) -> ReaperChannel:
+        return get_reaper_channel(self.paths.channel_dir)
+
+    @property
+    def manifest(self) -> SelectionManifest:
+        return get_selection_manifest(self.paths.selection_db)
+
+    @property
+    def watcher(self) -> SelectionWatcher:
+        return get_selection_watcher(self.pool, self.manifest, self.paths.last_selected_txt)
+
+    def workspace(self) -> RenderWorkspace:
+        return RenderWorkspace.from_settings(self.settings, default_root=self.paths.render_dir)
+
+    def script(self, lua_path: Path) -> Path:
+        """
+        The ReaScript to hand REAPER for `lua_path`. The scripts find the
+        bridge's files through WRB_DATA_DIR, which a profile sets in a small
+        generated wrapper (same file name, in the profile's folder).
+        """
+        if not self.profile:
+            return lua_path
+        wrapper = self.paths.data_dir / "scripts" / lua_path.name
+        text = (
+            "-- Generated by WwiseReaperBridge for connection profile "
+            f"{_lua_string(self.profile)}\n"
+            f"WRB_DATA_DIR = {_lua_string(str(self.paths.data_dir))}\n"
+            f"local ok, err = pcall(dofile, {_lua_string(str(lua_path))})\n"
+            "WRB_DATA_DIR = nil\n"
+            "if not ok then error(err, 0) end\n"
+        )
+        with _scripts_lock:
+            try:
+                current = wrapper.read_text(encoding="utf-8")
+            except OSError:
+                current = None
+            if current != text:
+                wrapper.parent.mkdir(parents=True, exist_ok=True)
+                write_atomic(wrapper, text)
+        return wrapper
+
+
+def open_session(config_path, profile: str | None = None) -> BridgeSession:
+    """
+    Session for `profile` (default: the configured active profile; "" for
+    none). Raises ProfileError for an unknown profile.
+    """
+    settings = apply_profile(load_settings(config_path), profile)
+    return BridgeSession(settings.active_profile, settings, profile_paths(settings.active_profile))
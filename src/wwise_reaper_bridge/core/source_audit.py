@@ -0,0 +1,199 @@
+# core/source_audit.py
+from __future__ import annotations
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from core.models import ImportReport, ProgressFn, SelectedObj
+from utils.instrumentation import get_logger, span
+from utils.source_index import FileState, SourceIndex, find_files, stat_sources
+from utils.wwise_waapi import iter_sounds
+
+log = get_logger("source_audit")
+
+ImportFn = Callable[[List[dict]], ImportReport]
+
+
+@dataclass
+class SourceAudit:
+    """
+    Result of one project-wide audit. Source paths map to the Sounds that
+    use them; "new" and "changed" are relative to the previous audit.
+    """
+    sounds: int = 0
+    files: int = 0
+    previous: Optional[float] = None       # when the previous audit ran, if any
+    missing: Dict[str, List[SelectedObj]] = field(default_factory=dict)
+    newly_missing: List[str] = field(default_factory=list)
+    recovered: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    duplicates: Dict[str, List[SelectedObj]] = field(default_factory=dict)
+    no_source: List[SelectedObj] = field(default_factory=list)
+    # Relinking: missing source -> candidates found under the search roots
+    ambiguous: Dict[str, List[str]] = field(default_factory=dict)
+    relinked: ImportReport = field(default_factory=ImportReport)
+
+    def summary(self) -> str:
+        parts = [f"{self.sounds} Sound(s), {self.files} source file(s)",
+                 f"{len(self.missing)} missing ({len(self.newly_missing)} new)"]
+        if self.recovered:
+            parts.append(f"{len(self.recovered)} back on disk")
+        parts.append(f"{len(self.changed)} changed")
+        parts.append(f"{len(self.duplicates)} shared by several Sounds")
+        if self.relinked.outcomes or self.ambiguous:
+            parts.append(f"{self.relinked.imported} relinked, {self.relinked.failed} failed, "
+                         f"{len(self.ambiguous)} ambiguous")
+        return "; ".join(parts)
+
+    def as_dict(self) -> dict:
+        def objs(items: List[SelectedObj]) -> List[dict]:
+            return [{"id": o.id, "path": o.path} for o in items]
+        return {
+            "sounds": self.sounds,
+            "files": self.files,
+            "previous_audit": self.previous,
+            "missing": {p: objs(v) for p, v in sorted(self.missing.items())},
+            "newly_missing": sorted(self.newly_missing),
+            "recovered": sorted(self.recovered),
+            "changed": sorted(self.changed),
+            "duplicates": {p: objs(v) for p, v in sorted(self.duplicates.items())},
+            "no_source": objs(self.no_source),
+            "ambiguous": self.ambiguous,
+            "relinked": self.relinked.imported,
+            "relink_failures": [{"object_path": o.object_path, "reason": o.reason}
+                                for o in self.relinked.failures()],
+        }
+
+
+def _report(progress: Optional[ProgressFn], phase: str, done: int = 0, total: int = 0) -> None:
+    if progress is not None:
+        progress(phase, done, total)
+
+
+def scan_sources(pool, index: SourceIndex,
+                  page_size: int = 2000,
+                  workers: int = 16,
+                  progress: Optional[ProgressFn] = None,
+                  cancel: Optional[threading.Event] = None,
+                  full: bool = False) -> Optional[SourceAudit]:
+    """
+    Check the original file of every Sound in the project against the disk
+    and against the previous audit recorded in `index`.
+
+    Sounds are paged from WAAPI; the referenced files are checked one folder
+    listing at a time on `workers` threads. The index keeps each file's
+    size and mtime, so a later audit reports only what changed since, and
+    each folder's mtime: folders where no file was added, removed or
+    replaced since are not listed again. A file rewritten in place doesn't
+    touch its folder, so `full` lists every folder. Returns None if
+    cancelled (the index is left as it was).
+    """
+    started = time.time()
+    audit = SourceAudit(previous=index.last_audit())
+    by_source: Dict[str, List[SelectedObj]] = {}
+    sounds: List[SelectedObj] = []
+
+    with span("audit.list_sounds") as fields:
+        for page in iter_sounds(pool, page_size):
+            if cancel is not None and cancel.is_set():
+                return None
+            sounds.extend(page)
+            _report(progress, "Listing Sounds", len(sounds), 0)
+        fields["sounds"] = len(sounds)
+    for o in sounds:
+        if o.source_path:
+            by_source.setdefault(o.source_path, []).append(o)
+        else:
+            audit.no_source.append(o)
+    audit.sounds = len(sounds)
+    audit.files = len(by_source)
+    audit.duplicates = {p: objs for p, objs in by_source.items() if len(objs) > 1}
+
+    known = index.files()
+    dirs = {} if full else index.dirs()
+    for path in by_source:
+        if path not in known:
+            # New to the index: its folder has to be listed
+            dirs.pop(os.path.split(path)[0], None)
+    with span("audit.stat", files=len(by_source), workers=workers) as fields:
+        seen = stat_sources(by_source, workers,
+                            lambda done, total: _report(progress, "Checking files", done, total),
+                            dir_mtimes=dirs)
+        fields["listed"] = len(seen)
+    if cancel is not None and cancel.is_set():
+        return None
+
+    states: Dict[str, FileState] = {}
+    for path in by_source:
+        before = known.get(path)
+        if path in seen:
+            st = seen[path]
+        else:
+            # Folder unchanged since the last audit
+            st = None if before.missing else (before.size, before.mtime_ns)
+        if st is None:
+            if before is not None and before.missing:
+                states[path] = before
+            else:
+                states[path] = FileState(None, None, started)
+                audit.newly_missing.append(path)
+            audit.missing[path] = by_source[path]
+            continue
+        states[path] = FileState(st[0], st[1])
+        if before is None:
+            continue
+        if before.missing:
+            audit.recovered.append(path)
+        elif (before.size, before.mtime_ns) != st:
+            audit.changed.append(path)
+
+    with span("audit.save") as fields:
+        fields["sound_rows"] = index.save_sounds(sounds)
+        fields["file_rows"] = index.save_files(states, known)
+        index.save_dirs(dirs)
+        index.record_audit(started, audit.sounds, audit.files, len(audit.missing), len(audit.changed))
+    return audit
+
+
+def relink_missing(audit: SourceAudit, search_roots: Iterable[Path], import_fn: ImportFn,
+                   progress: Optional[ProgressFn] = None) -> SourceAudit:
+    """
+    Look for each missing source by file name under `search_roots` and
+    re-import it into the Sounds that use it. Only a name that one missing
+    source has and one file under the roots has is relinked; names found
+    more than once, or shared by several missing sources, are left alone
+    and listed in `audit.ambiguous`.
+    """
+    roots = [Path(r) for r in search_roots]
+    if not audit.missing or not roots:
+        return audit
+    # Source paths are the Wwise machine's; match on the file name alone
+    names: Dict[str, List[str]] = {}
+    for source in audit.missing:
+        name = source.replace("\\", "/").rsplit("/", 1)[-1]
+        names.setdefault(os.path.normcase(name), []).append(source)
+    _report(progress, "Searching", 0, len(names))
+    with span("audit.search", names=len(names), roots=len(roots)):
+        found = find_files(roots, names)
+
+    tasks: List[dict] = []
+    for key, sources in names.items():
+        candidates = found.get(key, [])
+        if not candidates:
+            continue
+        if len(candidates) > 1 or len(sources) > 1:
+            for source in sources:
+                audit.ambiguous[source] = sorted(str(c) for c in candidates)
+            continue
+        tasks.extend({"objectPath": o.path, "audioFile": str(candidates[0].resolve()), "objectId": o.id}
+                     for o in audit.missing[sources[0]])
+    if tasks:
+        _report(progress, "Relinking", 0, len(tasks))
+        audit.relinked = import_fn(tasks)
+        _report(progress, "Relinking", len(tasks), len(tasks))
+    for source, paths in audit.ambiguous.items():
+        log.warning("Not relinking %s: ambiguous match (%s)", source, ", ".join(paths))
+    return audit
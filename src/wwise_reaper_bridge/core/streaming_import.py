@@ -0,0 +1,162 @@
+# core/streaming_import.py
+from __future__ import annotations
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from core.models import SelectedObj, ImportOutcome, ImportReport
+from core.render_names import render_key
+from utils.render_cache import RenderHashIndex
+from utils.sync_journal import SyncJournal
+from utils.wav_info import ExpectedFormat, WavCheck, check_wav, check_wavs
+from utils.instrumentation import get_logger
+
+log = get_logger("streaming_import")
+
+
+class StreamingImporter:
+    """
+    Overlaps Wwise import with REAPER rendering.
+
+    Feed it the names of finished renders (`on_rendered`, typically from a
+    RenderWatcher) and it batches the matching `<name>.wav` files into
+    chunks of `chunk_size`, importing each chunk on a background thread
+    while REAPER keeps rendering. `finish()` flushes the remainder, picks up
+    any render that was not announced and returns the combined ImportReport.
+    With a RenderHashIndex, renders identical to the current source are
+    reported as skipped. Each render's WAV header is checked first: files
+    still being written wait for finish(), files in the wrong format are
+    reported as failed without reaching Wwise. Validated renders are
+    recorded in the SyncJournal, if one is given.
+    """
+    def __init__(self,
+                 objs: List[SelectedObj],
+                 render_dir: Path,
+                 import_fn: Callable[[List[dict]], ImportReport],
+                 chunk_size: int = 16,
+                 on_imported: Callable[[int, int], None] | None = None,
+                 cache: RenderHashIndex | None = None,
+                 expected: ExpectedFormat | None = None,
+                 validate_workers: int = 8,
+                 journal: SyncJournal | None = None):
+        self.render_dir = Path(render_dir)
+        self.cache = cache
+        self.expected = expected
+        self.validate_workers = validate_workers
+        self.journal = journal
+        self.import_fn = import_fn
+        self.chunk_size = max(1, chunk_size)
+        self.on_imported = on_imported
+
+        self._by_name: Dict[str, List[SelectedObj]] = {}
+        for o in objs:
+            self._by_name.setdefault(render_key(o), []).append(o)
+
+        self._lock = threading.Lock()
+        self._pending: List[dict] = []
+        self._seen: set[str] = set()
+        self._futures: List[Future] = []
+        self.submitted = 0
+        self.processed = 0
+        self.report = ImportReport()
+        # One worker: WAAPI import calls are serialized per connection anyway
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="WwiseImport")
+
+    def _tasks_for(self, wav: Path, name: str) -> List[dict]:
+        tasks = []
+        for o in self._by_name.get(name, []):
+            if not o.path:
+                continue
+            if self.cache is not None and not self.cache.needs_import(o, wav):
+                with self._lock:
+                    self.report.outcomes.append(ImportOutcome(
+                        o.path, str(wav), "skipped", "unchanged render", object_id=o.id))
+                continue
+            tasks.append({"objectPath": o.path, "audioFile": str(wav.resolve()), "objectId": o.id})
+        return tasks
+
+    def _invalid(self, name: str, check: WavCheck) -> None:
+        with self._lock:
+            for o in self._by_name.get(name, []):
+                if o.path:
+                    self.report.outcomes.append(ImportOutcome(
+                        o.path, str(check.path), "failed", f"invalid render: {check.reason}", object_id=o.id))
+
+    def on_rendered(self, name: str, final: bool = False, check: Optional[WavCheck] = None) -> None:
+        """
+        Queue `<name>.wav`. Unless `final`, an incomplete file is left for
+        finish() to pick up again.
+        """
+        with self._lock:
+            if name in self._seen or name not in self._by_name:
+                return
+            self._seen.add(name)
+        wav = self.render_dir / f"{name}.wav"
+        if check is None:
+            check = check_wav(wav, self.expected)
+        if check.info is None:
+            if final and wav.exists():
+                self._invalid(name, check)
+            else:
+                with self._lock:
+                    self._seen.discard(name)
+            return
+        if not check.ok:
+            self._invalid(name, check)
+            return
+        if self.journal is not None:
+            self.journal.mark_rendered(name, wav, "validated")
+        tasks = self._tasks_for(wav, name)
+        if not tasks:
+            return
+        with self._lock:
+            self._pending.extend(tasks)
+            if len(self._pending) >= self.chunk_size:
+                self._submit_locked()
+
+    def _submit_locked(self) -> None:
+        chunk, self._pending = self._pending, []
+        if not chunk:
+            return
+        self.submitted += len(chunk)
+        self._futures.append(self._executor.submit(self._import_chunk, chunk))
+
+    def _import_chunk(self, chunk: List[dict]) -> ImportReport:
+        report = self.import_fn(chunk)
+        if self.cache is not None:
+            self.cache.commit(o.object_id for o in report.outcomes
+                              if o.status == "imported" and o.object_id)
+        with self._lock:
+            self.report.extend(report)
+            self.processed += len(chunk)
+            done, total = self.processed, self.submitted
+        if self.on_imported is not None:
+            self.on_imported(done, total)
+        return report
+
+    def finish(self) -> ImportReport:
+        """Import everything left over, wait for all chunks, return the combined report."""
+        # REAPER is done at this point, so every file on disk is closed
+        with self._lock:
+            left = [n for n in self._by_name if n not in self._seen]
+        wavs = {n: self.render_dir / f"{n}.wav" for n in left}
+        checks = check_wavs([w for w in wavs.values() if w.exists()], self.expected, self.validate_workers)
+        for name, wav in wavs.items():
+            if wav in checks:
+                self.on_rendered(name, final=True, check=checks[wav])
+        with self._lock:
+            self._submit_locked()
+            futures = list(self._futures)
+        for f in futures:
+            try:
+                f.result()
+            except Exception as e:
+                log.warning("import chunk failed: %s", e)
+        self._executor.shutdown(wait=True)
+        return self.report
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._pending = []
+        self._executor.shutdown(wait=False, cancel_futures=True)
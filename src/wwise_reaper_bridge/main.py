@@ -1,5 +1,24 @@
 # main.py
-from ui.app import run
+import os
+import sys
+
+# First, so start-up phases (and imports, when requested) are timed from here
+from utils import startup_timing
 
 if __name__ == "__main__":
+    if startup_timing.requested():
+        startup_timing.install()
+    console_build = False
+    if getattr(sys, "frozen", False):
+        # Render analysis uses worker processes; required for the frozen exe
+        import multiprocessing
+        multiprocessing.freeze_support()
+        # The console build (WwReaBridgeCli, see main.spec) is headless only
+        console_build = os.path.basename(sys.executable).lower().startswith("wwreabridgecli")
+    if console_build or (len(sys.argv) > 1 and sys.argv[1:] != [startup_timing.STARTUP_FLAG]):
+        # Headless: WwReaBridge <command> ... (see cli.py)
+        from cli import main
+        sys.exit(main())
+
+    from ui.app import run
     run()
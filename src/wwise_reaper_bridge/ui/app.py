@@ -1,10 +1,19 @@
 # ui/app.py
+import sys
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from core.bridge_logic import open_in_reaper, modify_source, check_render_format
 from core.models import DEFAULT_RENDER_FORMAT
-from utils.app_paths import config_json_path, last_selected_jsonl_path
-from utils.settings_store import load_settings, save_settings
+from core.render_format import RenderFormatError, decode_render_format, validate_render_format
+from utils import startup_timing
+from utils.app_paths import config_json_path, log_dir
+from utils.instrumentation import configure_logging, get_logger, log_event
+from utils.settings_store import ProfileError, load_settings, save_settings
+from ui.jobs import JobRunner, JobState, ThreadSafeUIApi
+
+log = get_logger("ui")
+
+NO_PROFILE = "(no profile)"
 
 class UIApi:
     def show_error(self, title, msg): messagebox.showerror(title, msg)
@@ -15,42 +24,92 @@ class WwiseReaperBridge:
     def __init__(self, root):
         self.root = root
         self.root.title("Wwise-Reaper Bridge")
-        self.root.geometry("400x300")
+        self.root.geometry("400x340")
 
         self.config_path = config_json_path
-        self.last_path = last_selected_jsonl_path
         self.ui = UIApi()
+        self.jobs = JobRunner(root)
+        # Bridge operations run on the job thread and reach dialogs through this
+        self.job_ui = ThreadSafeUIApi(self.jobs, self.ui)
 
         self.settings = load_settings(config_json_path)
         self.setup_ui()
 
-    def _cooldown_group(self, buttons: list[tk.Button], seconds: float = 2.0) -> None:
-        """Disable a group of buttons temporarily."""
-        for b in buttons:
-            b.config(state="disabled")
+    def on_window_ready(self) -> None:
+        """First idle moment after the window is drawn."""
+        t = startup_timing.mark("window ready")
+        log_event(log, f"window ready in {t:.3f}s", **startup_timing.phases())
+        if startup_timing.requested():
+            out = startup_timing.write_report(log_dir / "startup.txt")
+            log.info("Start-up report%s:\n%s", f" written to {out}" if out else "", startup_timing.report())
+        threading.Thread(target=self._warm_up, name="WarmUp", daemon=True).start()
+
+    def _warm_up(self) -> None:
+        # core.bridge_logic pulls in waapi (autobahn/asyncio), subprocess and the
+        # sync stack; it loads here, after the window is up, or on first use
+        import core.bridge_logic  # noqa: F401
+        startup_timing.mark("bridge loaded")
+        if self.settings.live_selection:
+            self._apply_live_selection()
 
-        def restore():
-            for b in buttons:
-                b.config(state="normal")
+    def _apply_live_selection(self) -> None:
+        """Follow the selection of the active profile's Wwise only."""
+        from core.session import open_session
+        from utils.selection_watch import all_selection_watchers
+        try:
+            active = open_session(self.config_path, self.settings.active_profile).watcher
+        except ProfileError:
+            active = None
+        for watcher in all_selection_watchers():
+            if watcher is not active and watcher.running:
+                watcher.stop()
+        if active is not None and self.settings.live_selection:
+            active.start()
+        elif active is not None and active.running:
+            active.stop()
 
-        self.root.after(int(seconds * 1000), restore)
+    def _set_busy(self, busy: bool) -> None:
+        """Lock both main buttons while a job runs; only Cancel stays usable."""
+        state = "disabled" if busy else "normal"
+        for b in [self.btn_open, self.btn_modify] + ([self.profile_menu] if self.profile_menu else []):
+            b.config(state=state)
+        self.btn_cancel.config(state=("normal" if busy else "disabled"))
 
-    def _run_with_group_cooldown(self, func, seconds: float = 2.0) -> None:
-        """Lock both main buttons, run func, unlock after cooldown."""
-        self._cooldown_group([self.btn_open, self.btn_modify], seconds)
+    def _run_job(self, name: str, func) -> None:
+        """Run func(cancel, progress) off the Tk thread with live status."""
+        job = self.jobs.submit(name, func, on_done=self._on_job_done, on_progress=self._on_job_progress)
+        if job is None:
+            return
+        self._set_busy(True)
+        self._tick()
 
-        try:
-            func()
-        except Exception:
-            # If immediate error, unlock early
-            for b in [self.btn_open, self.btn_modify]:
-                b.config(state="normal")
-            raise
+    def _tick(self) -> None:
+        job = self.jobs.current
+        if job is None:
+            return
+        self.status_label.config(text=job.describe(), fg="gray")
+        self.root.after(200, self._tick)
+
+    def _on_job_progress(self, job: JobState) -> None:
+        self.status_label.config(text=job.describe(), fg="gray")
+
+    def _on_job_done(self, job: JobState, result) -> None:
+        self._set_busy(False)
+        log.info("%s finished in %s", job.name, job.timing_summary())
+        self.set_status(result)
 
     def setup_ui(self):
         self.gear_btn = tk.Button(self.root, text="⚙", command=self.open_settings)
         self.gear_btn.place(x=10, y=10)
 
+        # Connection profile (only shown once config.json defines some)
+        self.profile_menu = None
+        if self.settings.profiles:
+            names = [NO_PROFILE] + [p.name for p in self.settings.profiles]
+            self.profile_var = tk.StringVar(value=self.settings.active_profile or NO_PROFILE)
+            self.profile_menu = tk.OptionMenu(self.root, self.profile_var, *names, command=self.on_profile_selected)
+            self.profile_menu.place(x=50, y=10)
+
         btn_frame = tk.Frame(self.root)
         btn_frame.pack(expand=True)
 
@@ -59,7 +118,7 @@ class WwiseReaperBridge:
             btn_frame,
             text="Open in REAPER",
             width=25,
-            command=lambda: self._run_with_group_cooldown(self.on_open, seconds=2.0),
+            command=self.on_open,
         )
         self.btn_open.pack(pady=10)
 
@@ -68,22 +127,35 @@ class WwiseReaperBridge:
             btn_frame,
             text="Modify Source in Wwise",
             width=25,
-            command=lambda: self._run_with_group_cooldown(self.on_modify, seconds=2.0),
+            command=self.on_modify,
         )
         self.btn_modify.pack(pady=10)
 
+        self.btn_cancel = tk.Button(btn_frame, text="Cancel", width=25, state="disabled", command=self.jobs.cancel)
+        self.btn_cancel.pack(pady=10)
+
         tk.Button(btn_frame, text="Exit", width=25, command=self.root.quit).pack(pady=10)
 
         self.status_label = tk.Label(self.root, text="", fg="red")
         self.status_label.pack(side="bottom", pady=5)
 
+    def on_profile_selected(self, name: str) -> None:
+        previous = self.settings.active_profile
+        self.settings.active_profile = "" if name == NO_PROFILE else name
+        if not self._save_settings():
+            self.settings.active_profile = previous
+            self.profile_var.set(previous or NO_PROFILE)
+            return
+        if self.settings.live_selection and "core.bridge_logic" in sys.modules:
+            self._apply_live_selection()
+
     def set_status(self, result):
         self.status_label.config(text=result.message, fg=("red" if result.level == "error" else "green"))
 
     def open_settings(self):
         win = tk.Toplevel(self.root)
         win.title("Settings")
-        win.geometry("520x230")  # <-- bigger so you can see everything
+        win.geometry("520x390")  # <-- bigger so you can see everything
         win.resizable(True, False)
 
         # --- REAPER Path ---
@@ -98,7 +170,7 @@ class WwiseReaperBridge:
                 path_var.set(filename)
                 # IMPORTANT: don't overwrite the whole Settings object or you'll lose reaper_render_format
                 self.settings.reaper_path = filename
-                save_settings(self.config_path, self.settings)
+                self._save_settings()
 
         tk.Button(win, text="Browse", command=browse).pack(pady=(0, 10))
 
@@ -107,41 +179,115 @@ class WwiseReaperBridge:
 
         render_var = tk.StringVar(value=getattr(self.settings, "reaper_render_format", "") or "")
         render_entry = tk.Entry(win, textvariable=render_var, width=70)
-        render_entry.pack(pady=(0, 8))
+        render_entry.pack(pady=(0, 2))
+
+        # Decoded locally as you type
+        format_label = tk.Label(win, fg="gray")
+        format_label.pack(pady=(0, 6))
+
+        def on_render_var_changed(*_):
+            try:
+                format_label.config(text=decode_render_format(render_var.get()).describe(), fg="gray")
+            except RenderFormatError as e:
+                format_label.config(text=str(e), fg="red")
+
+        render_var.trace_add("write", on_render_var_changed)
+        on_render_var_changed()
+
+        # --- Render folder (per-sync runs go below it) ---
+        tk.Label(win, text="Render folder (empty = default; a RAM disk or fast SSD speeds up syncs):").pack(pady=(0, 4))
+        root_row = tk.Frame(win)
+        root_row.pack(pady=(0, 4))
+        render_root_var = tk.StringVar(value=self.settings.render_root)
+        tk.Entry(root_row, textvariable=render_root_var, width=58).pack(side="left")
+
+        def browse_render_root():
+            folder = filedialog.askdirectory()
+            if folder:
+                render_root_var.set(folder)
+
+        tk.Button(root_row, text="Browse", command=browse_render_root).pack(side="left", padx=6)
+        ram_var = tk.BooleanVar(value=self.settings.render_to_ram)
+        tk.Checkbutton(win, text="Render to RAM when the system provides it", variable=ram_var).pack(pady=(0, 2))
+        live_var = tk.BooleanVar(value=self.settings.live_selection)
+        tk.Checkbutton(win, text="Follow the Wwise selection in the background (faster Open)",
+                       variable=live_var).pack(pady=(0, 8))
 
         # --- render config buttons ---
         btn_row = tk.Frame(win)
         btn_row.pack(pady=(0, 10))
 
         def on_check_render_format():
-            check_render_format(self.ui)
+            # Reads renders and may ask REAPER; like every bridge call, off the Tk thread
+            def job(cancel, progress):
+                from core.bridge_logic import check_render_format
+                return check_render_format(self.job_ui, self.config_path, profile=self.settings.active_profile)
+            self._run_job("Check format", job)
 
         def on_set_default_render_format():
             render_var.set(DEFAULT_RENDER_FORMAT)
             self.settings.reaper_render_format = DEFAULT_RENDER_FORMAT
-            save_settings(self.config_path, self.settings)
+            self._save_settings()
 
         def on_save_render_config():
+            render_format = render_var.get().strip()
+            try:
+                validate_render_format(render_format)
+            except RenderFormatError as e:
+                messagebox.showerror("Settings", f"Not saved, invalid render format:\n{e}")
+                return
             self.settings.reaper_path = path_var.get().strip()
-            self.settings.reaper_render_format = render_var.get().strip()
-            save_settings(self.config_path, self.settings)
+            self.settings.reaper_render_format = render_format
+            self.settings.render_root = render_root_var.get().strip()
+            self.settings.render_to_ram = ram_var.get()
+            self.settings.live_selection = live_var.get()
+            if self._save_settings():
+                self._apply_live_selection()
 
         tk.Button(btn_row, text="Save Config", command=on_save_render_config).pack(side="left", padx=6)
-        tk.Button(btn_row, text="Check in REAPER", command=on_check_render_format).pack(side="left", padx=6)
+        tk.Button(btn_row, text="Check format", command=on_check_render_format).pack(side="left", padx=6)
         tk.Button(btn_row, text="Set to default", command=on_set_default_render_format).pack(side="left", padx=6)
 
         # --- show config is stored ---
         tk.Label(win, text=f"Config: {self.config_path}", fg="gray").pack(pady=(6, 2))
+        if self.settings.active_profile:
+            tk.Label(win, text=f"Connection profile '{self.settings.active_profile}' overrides these where it sets a value",
+                     fg="gray").pack(pady=(0, 2))
+
+    def _save_settings(self) -> bool:
+        try:
+            save_settings(self.config_path, self.settings)
+            return True
+        except ProfileError as e:
+            messagebox.showerror("Settings", f"Not saved, invalid connection profiles:\n{e}")
+            return False
 
     def on_open(self):
-        r = open_in_reaper(self.config_path, self.last_path, ui=self.ui)
-        self.set_status(r)
+        def job(cancel, progress):
+            from core.bridge_logic import open_in_reaper
+            return open_in_reaper(self.config_path, None, ui=self.job_ui, cancel=cancel,
+                                  profile=self.settings.active_profile)
+        self._run_job("Open in REAPER", job)
 
     def on_modify(self):
-        r = modify_source(self.config_path, self.last_path,  ui=self.ui)
-        self.set_status(r)
+        def job(cancel, progress):
+            from core.bridge_logic import modify_source
+            return modify_source(self.config_path, None, ui=self.job_ui,
+                                 progress=progress, cancel=cancel, profile=self.settings.active_profile)
+        self._run_job("Sync", job)
 
 def run():
+    configure_logging(log_dir)
     root = tk.Tk()
     app = WwiseReaperBridge(root)
+    root.after_idle(app.on_window_ready)
     root.mainloop()
+    if "utils.selection_watch" in sys.modules:
+        from utils.selection_watch import all_selection_watchers
+        for watcher in all_selection_watchers():
+            watcher.stop()
+    app.jobs.shutdown()
+    if "utils.wwise_waapi" in sys.modules:
+        # Open connections keep their (non-daemon) threads and so the process alive
+        from utils.wwise_waapi import close_waapi_pools
+        close_waapi_pools()
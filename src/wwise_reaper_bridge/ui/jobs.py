@@ -0,0 +1,177 @@
+# ui/jobs.py
+from __future__ import annotations
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from core.models import Result, ProgressFn
+from utils.instrumentation import get_logger
+
+log = get_logger("jobs")
+
+
+class ThreadSafeUIApi:
+    """
+    UIApi wrapper usable from worker threads.
+    Dialogs are shown on the Tk thread; the worker blocks until the user
+    answers, or gets the default answer (no) once the window is gone.
+    """
+    def __init__(self, runner: "JobRunner", ui):
+        self._runner = runner
+        self._ui = ui
+
+    def _call(self, fn: Callable[[], Any], default: Any = None) -> Any:
+        if threading.current_thread() is threading.main_thread():
+            return fn()
+        done = threading.Event()
+        abandoned = threading.Event()
+        box: Dict[str, Any] = {}
+
+        def run():
+            if abandoned.is_set():
+                return
+            try:
+                box["value"] = fn()
+            finally:
+                done.set()
+
+        self._runner.call_in_ui(run)
+        # The Tk thread stops draining once the window closes; don't keep the
+        # (non-daemon) worker, and with it the process, waiting forever
+        while not done.wait(0.1):
+            if self._runner.closed:
+                abandoned.set()
+                return default
+        return box.get("value", default)
+
+    def show_error(self, title, msg): self._call(lambda: self._ui.show_error(title, msg))
+    def show_info(self, title, msg): self._call(lambda: self._ui.show_info(title, msg))
+    def ask_yes_no(self, title, msg): return self._call(lambda: self._ui.ask_yes_no(title, msg), False)
+
+
+@dataclass
+class JobState:
+    name: str
+    started: float = field(default_factory=time.monotonic)
+    phase: str = ""
+    phase_started: float = field(default_factory=time.monotonic)
+    done: int = 0
+    total: int = 0
+    phase_times: Dict[str, float] = field(default_factory=dict)
+    cancel: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def enter_phase(self, phase: str) -> None:
+        now = time.monotonic()
+        if self.phase:
+            self.phase_times[self.phase] = self.phase_times.get(self.phase, 0.0) + now - self.phase_started
+        self.phase, self.phase_started = phase, now
+
+    def finish(self) -> None:
+        self.enter_phase("")
+
+    def describe(self) -> str:
+        if not self.phase:
+            return f"{self.name}… {self.elapsed:.1f}s"
+        count = f" {self.done}/{self.total}" if self.total else ""
+        phase_elapsed = time.monotonic() - self.phase_started
+        return f"{self.name}: {self.phase}{count} ({phase_elapsed:.1f}s, total {self.elapsed:.1f}s)"
+
+    def timing_summary(self) -> str:
+        parts = [f"{k} {v:.1f}s" for k, v in self.phase_times.items()]
+        return f"{self.elapsed:.1f}s" + (f" ({', '.join(parts)})" if parts else "")
+
+
+class JobRunner:
+    """
+    Runs bridge operations off the Tk thread, one at a time.
+
+    Worker threads never touch Tk directly: they push callables onto a queue
+    that the Tk thread drains every `poll_ms` via root.after.
+    """
+    def __init__(self, root, poll_ms: int = 50):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.current: Optional[JobState] = None
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="BridgeJob")
+        self._ui_queue: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        self._closed = threading.Event()
+        self.root.after(self.poll_ms, self._drain)
+
+    def call_in_ui(self, fn: Callable[[], None]) -> None:
+        self._ui_queue.put(fn)
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                fn = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn()
+            except Exception as e:
+                log.warning("UI callback failed: %s", e)
+        self.root.after(self.poll_ms, self._drain)
+
+    @property
+    def closed(self) -> bool:
+        """shutdown() was called: nothing queued for the Tk thread will run anymore."""
+        return self._closed.is_set()
+
+    @property
+    def busy(self) -> bool:
+        return self.current is not None
+
+    def submit(self,
+               name: str,
+               fn: Callable[[threading.Event, ProgressFn], Result],
+               on_done: Callable[[JobState, Result], None],
+               on_progress: Optional[Callable[[JobState], None]] = None) -> Optional[JobState]:
+        """
+        Start `fn(cancel, progress)` on the worker thread. `on_progress` / `on_done` are
+        called on the Tk thread. Returns None if a job is already running.
+        """
+        if self.current is not None:
+            return None
+        job = JobState(name)
+        self.current = job
+
+        def report(phase: str, done: int, total: int) -> None:
+            def apply():
+                if phase != job.phase:
+                    job.enter_phase(phase)
+                job.done, job.total = done, total
+                if on_progress is not None:
+                    on_progress(job)
+            self.call_in_ui(apply)
+
+        def work():
+            try:
+                result = fn(job.cancel, report)
+            except Exception as e:
+                result = Result("error", f"{name} failed: {e}")
+
+            def complete():
+                job.finish()
+                self.current = None
+                on_done(job, result)
+            self.call_in_ui(complete)
+
+        self._executor.submit(work)
+        return job
+
+    def cancel(self) -> None:
+        if self.current is not None:
+            self.current.cancel.set()
+
+    def shutdown(self) -> None:
+        self._closed.set()
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
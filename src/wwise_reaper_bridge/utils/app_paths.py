@@ -1,6 +1,7 @@
 # utils/app_paths.py
 from __future__ import annotations
-import os, sys
+import os, re, sys
+from dataclasses import dataclass
 from pathlib import Path
 from platformdirs import user_data_dir
 
@@ -19,31 +20,83 @@ def _dir_from_env(var: str, fallback: Path) -> Path:
         return Path(v)
     return fallback
 
+# The paths below are only computed here; folders are created by whatever
+# writes into them first, so importing this module touches no disk.
+
 def get_appdata_dir() -> Path:
-    p = Path(user_data_dir(APP_NAME, appauthor=False, roaming=True))
+    p = appdata_dir
     p.mkdir(parents=True, exist_ok=True)
     return p
 
 def get_localdata_dir() -> Path:
-    p = Path(user_data_dir(APP_NAME, appauthor=False, roaming=False))
+    p = localdata_dir
     p.mkdir(parents=True, exist_ok=True)
     return p
 
 def get_temp_render_dir():
-    p = localdata_dir / "renders"
+    p = temp_render_dir
     p.mkdir(parents=True, exist_ok=True)
     return p
 
-appdata_dir = get_appdata_dir()
-localdata_dir = get_localdata_dir()
+# Explicit folders (tests, benchmarks, side-by-side installs); read once, at import
+CONFIG_DIR_ENV = "WRB_CONFIG_DIR"
+DATA_DIR_ENV = "WRB_DATA_DIR"
+
+appdata_dir = _dir_from_env(CONFIG_DIR_ENV, Path(user_data_dir(APP_NAME, appauthor=False, roaming=True)))
+localdata_dir = _dir_from_env(DATA_DIR_ENV, Path(user_data_dir(APP_NAME, appauthor=False, roaming=False)))
 
 config_json_path = appdata_dir / "config.json"
 last_selected_jsonl_path = localdata_dir / "last_selected.jsonl"
 last_selected_txt_path = localdata_dir / "last_selected.txt"
+render_hash_index_path = localdata_dir / "render_hashes.json"
+selection_db_path = localdata_dir / "selection.sqlite3"
+channel_dir = localdata_dir / "channel"
+log_dir = localdata_dir / "logs"
+sync_journal_path = localdata_dir / "sync_journal.jsonl"
+render_request_path = localdata_dir / "render_request.txt"
+source_index_path = localdata_dir / "source_index.sqlite3"
 
-temp_render_dir = get_temp_render_dir()
+temp_render_dir = localdata_dir / "renders"
+profiles_dir = localdata_dir / "profiles"
 
 lua_script_dir = get_asset_path("wwise_reaper_bridge/assets")
 reaper_import_lua_path = lua_script_dir / "wrb_open_wwiseobj_in_reaper.lua"
 reaper_render_lua_path = lua_script_dir / "wrb_export_tracks.lua"
-check_render_format_lua_path = lua_script_dir / "wrb_show_render_format.lua"
+reaper_listener_lua_path = lua_script_dir / "wrb_command_listener.lua"
+
+
+@dataclass(frozen=True)
+class ProfilePaths:
+    """Everything a connection profile writes, so profiles can run side by side."""
+    data_dir: Path
+    last_selected_jsonl: Path
+    last_selected_txt: Path
+    selection_db: Path
+    render_hash_index: Path
+    channel_dir: Path
+    sync_journal: Path
+    render_request: Path
+    render_dir: Path
+    source_index: Path
+
+    @classmethod
+    def under(cls, data_dir: Path) -> "ProfilePaths":
+        return cls(data_dir,
+                   data_dir / "last_selected.jsonl",
+                   data_dir / "last_selected.txt",
+                   data_dir / "selection.sqlite3",
+                   data_dir / "render_hashes.json",
+                   data_dir / "channel",
+                   data_dir / "sync_journal.jsonl",
+                   data_dir / "render_request.txt",
+                   data_dir / "renders",
+                   data_dir / "source_index.sqlite3")
+
+def profile_slug(name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", name.strip()).strip("._")
+
+def profile_paths(name: str = "") -> ProfilePaths:
+    """Paths of profile `name`; no profile ("") keeps the original locations."""
+    if not name:
+        return ProfilePaths.under(localdata_dir)
+    return ProfilePaths.under(profiles_dir / profile_slug(name))
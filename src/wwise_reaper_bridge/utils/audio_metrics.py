@@ -0,0 +1,268 @@
+# utils/audio_metrics.py
+from __future__ import annotations
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from utils.wav_info import WAVE_FORMAT_IEEE_FLOAT, WavInfo, read_wav_info
+
+# NumPy is optional: without it the analysis stage is simply unavailable
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+HOP_SECONDS = 0.1          # BS.1770 gating blocks are 4 hops (400 ms, 75 % overlap)
+CHUNK_HOPS = 100           # hops decoded per read (10 s of audio)
+ABSOLUTE_GATE_LUFS = -70.0
+RELATIVE_GATE_LU = -10.0
+CLIP_LEVEL = 0.99997       # within ~0.0003 dB of full scale
+SILENCE_DB = -150.0
+
+
+def available() -> bool:
+    return np is not None
+
+
+@dataclass(frozen=True)
+class AudioMetrics:
+    peak_dbfs: float
+    rms_dbfs: float
+    lufs: float
+    duration: float
+    clipped_samples: int
+
+    def as_dict(self) -> dict:
+        return {k: (round(v, 2) if isinstance(v, float) else v) for k, v in asdict(self).items()}
+
+
+def _db(amplitude: float) -> float:
+    return 20.0 * math.log10(amplitude) if amplitude > 0 else SILENCE_DB
+
+
+def _k_weighting(sample_rate: int):
+    """The two biquads (b, a) of the BS.1770 K-weighting filter: high shelf, then high pass."""
+    # Pre-filter parameters as derived in libebur128; reproduce the
+    # 48 kHz coefficients of the standard exactly and extend to other rates
+    def shelf():
+        f0, g, q = 1681.974450955533, 3.999843853973347, 0.7071752369554196
+        k = math.tan(math.pi * f0 / sample_rate)
+        vh = 10 ** (g / 20)
+        vb = vh ** 0.4996667741545416
+        a0 = 1 + k / q + k * k
+        b = ((vh + vb * k / q + k * k) / a0, 2 * (k * k - vh) / a0, (vh - vb * k / q + k * k) / a0)
+        return b, (1.0, 2 * (k * k - 1) / a0, (1 - k / q + k * k) / a0)
+
+    def highpass():
+        f0, q = 38.13547087602444, 0.5003270373238773
+        k = math.tan(math.pi * f0 / sample_rate)
+        a0 = 1 + k / q + k * k
+        return (1.0, -2.0, 1.0), (1.0, 2 * (k * k - 1) / a0, (1 - k / q + k * k) / a0)
+
+    return shelf(), highpass()
+
+
+@lru_cache(maxsize=32)
+def _biquad_blocks(b: tuple, a: tuple, n: int):
+    """
+    A biquad (transposed direct form II, state z) lifted to blocks of `n`
+    samples, so a block is filtered with array operations and the state
+    still carries over exactly from one block to the next:
+
+        y     = (h * x)[:n] + C @ z      h: first n taps of the impulse response
+        z_out = A @ z + B @ x
+
+    Returns (rfft of h zero-padded to 2n, C, A, B).
+    """
+    b, a = np.asarray(b), np.asarray(a)
+    order = len(a) - 1
+    # Per sample: y = z[0] + b0 x;  z' = F z + g x
+    f = np.zeros((order, order))
+    f[:, 0] = -a[1:]
+    f[np.arange(order - 1), np.arange(1, order)] = 1.0
+    g = b[1:] - a[1:] * b[0]
+
+    h = np.empty(n)
+    h[0] = b[0]
+    c = np.empty((n, order))
+    bm = np.empty((order, n))
+    fk = np.eye(order)  # F^k
+    for k in range(n):
+        c[k] = fk[0]
+        fg = fk @ g
+        bm[:, n - 1 - k] = fg
+        if k + 1 < n:
+            h[k + 1] = fg[0]
+        fk = f @ fk
+    return np.fft.rfft(h, 2 * n), c, fk, bm
+
+
+def _k_filter(blocks, state, sample_rate: int):
+    """
+    K-weight consecutive blocks (blocks, n, channels), starting from `state`
+    (sections, channels, 2). Returns the filtered blocks and the state after them.
+    """
+    n = blocks.shape[1]
+    y = blocks.astype(np.float64)
+    state = state.copy()
+    for i, (b, a) in enumerate(_k_weighting(sample_rate)):
+        spectrum, c, step, drive_of = _biquad_blocks(b, a, n)
+        x = y
+        y = np.fft.irfft(np.fft.rfft(x, 2 * n, axis=1) * spectrum[None, :, None], 2 * n, axis=1)[:, :n]
+        drive = x.transpose(0, 2, 1) @ drive_of.T  # (blocks, channels, 2)
+        starts = np.empty_like(drive)
+        z = state[i]
+        for k in range(len(x)):
+            starts[k] = z
+            z = z @ step.T + drive[k]
+        state[i] = z
+        y += (starts @ c.T).transpose(0, 2, 1)
+    return y, state
+
+
+def _channel_weights(channels: int):
+    # BS.1770: L, R, C weight 1.0; surround channels 1.41 (LFE is not excluded here)
+    w = np.ones(channels)
+    w[3:] = 1.41
+    return w
+
+
+def _decode(raw, info: WavInfo):
+    """Interleaved PCM bytes -> float32 array (frames, channels) in [-1, 1]."""
+    width = info.block_align // info.channels
+    if info.format_tag == WAVE_FORMAT_IEEE_FLOAT:
+        x = np.frombuffer(raw, dtype="<f4" if width == 4 else "<f8").astype(np.float32)
+    elif width == 1:
+        x = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 2:
+        x = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 3:
+        # Widen to int32 by placing each sample in the top 3 bytes
+        b = np.zeros((len(raw) // 3, 4), dtype=np.uint8)
+        b[:, 1:] = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+        x = b.view("<i4").ravel().astype(np.float32) / 2147483648.0
+    elif width == 4:
+        x = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"unsupported sample width {width}")
+    return x.reshape(-1, info.channels)
+
+
+def _read_chunks(path: Path, info: WavInfo, frames_per_chunk: int) -> Iterator:
+    chunk_bytes = frames_per_chunk * info.block_align
+    with open(path, "rb") as f:
+        f.seek(info.data_offset)
+        remaining = info.data_size
+        while remaining > 0:
+            raw = f.read(min(chunk_bytes, remaining))
+            if not raw:
+                break
+            remaining -= len(raw)
+            usable = len(raw) - len(raw) % info.block_align
+            yield _decode(raw[:usable], info)
+
+
+def _gated_loudness(hop_power, weights) -> float:
+    """Integrated loudness from per-hop, per-channel K-weighted mean squares."""
+    hop_power = np.asarray(hop_power)
+    if len(hop_power) < 4:
+        return SILENCE_DB
+    # 400 ms blocks = mean of 4 consecutive 100 ms hops
+    csum = np.cumsum(np.vstack([np.zeros((1, hop_power.shape[1])), hop_power]), axis=0)
+    blocks = (csum[4:] - csum[:-4]) / 4.0
+    block_sum = blocks @ weights
+    with np.errstate(divide="ignore"):
+        block_lufs = -0.691 + 10 * np.log10(block_sum)
+    gated = block_sum[block_lufs > ABSOLUTE_GATE_LUFS]
+    if gated.size == 0:
+        return SILENCE_DB
+    relative = -0.691 + 10 * math.log10(gated.mean()) + RELATIVE_GATE_LU
+    gated = block_sum[(block_lufs > ABSOLUTE_GATE_LUFS) & (block_lufs > relative)]
+    if gated.size == 0:
+        return SILENCE_DB
+    return -0.691 + 10 * math.log10(gated.mean())
+
+
+def analyze_wav(path: Path) -> AudioMetrics:
+    """
+    Peak, RMS and integrated loudness (BS.1770 / LUFS) of a PCM WAV, decoded
+    10 s at a time. The K-weighting IIR filter runs a 100 ms hop at a time
+    (see _k_filter_blocks) with its state carried across hops, so it matches
+    a sample-by-sample filter; files shorter than one 400 ms gating block
+    are measured as a single block.
+    """
+    if np is None:
+        raise RuntimeError("NumPy is not installed")
+    info = read_wav_info(path)
+    hop = max(1, int(info.sample_rate * HOP_SECONDS))
+    weights = _channel_weights(info.channels)
+
+    peak = 0.0
+    sum_sq = 0.0
+    count = 0
+    clipped = 0
+    hop_power: List = []
+    tail = None
+    state = np.zeros((2, info.channels, 2))
+    for x in _read_chunks(path, info, hop * CHUNK_HOPS):
+        mag = np.abs(x)
+        peak = max(peak, float(mag.max(initial=0.0)))
+        clipped += int(np.count_nonzero(mag >= CLIP_LEVEL))
+        flat = x.ravel()
+        sum_sq += float(flat @ flat)
+        count += x.size
+
+        if tail is not None:
+            x = np.concatenate([tail, x])
+        n_hops = len(x) // hop
+        tail = x[n_hops * hop:]
+        if n_hops:
+            y, state = _k_filter(x[:n_hops * hop].reshape(n_hops, hop, info.channels), state, info.sample_rate)
+            hop_power.append((y * y).mean(axis=1))
+
+    powers = np.concatenate(hop_power) if hop_power else np.zeros((0, info.channels))
+    if len(powers) >= 4:
+        lufs = _gated_loudness(powers, weights)
+    elif info.frames:
+        # Shorter than one gating block: measure the whole file as one block
+        x = np.concatenate([c for c in _read_chunks(path, info, info.frames)])
+        y, _ = _k_filter(x[None], np.zeros((2, info.channels, 2)), info.sample_rate)
+        total = float((y[0] * y[0]).mean(axis=0) @ weights)
+        lufs = -0.691 + 10 * math.log10(total) if total > 0 else SILENCE_DB
+    else:
+        lufs = SILENCE_DB
+
+    rms = math.sqrt(sum_sq / count) if count else 0.0
+    return AudioMetrics(
+        peak_dbfs=_db(peak),
+        rms_dbfs=_db(rms),
+        lufs=lufs,
+        duration=info.duration,
+        clipped_samples=clipped,
+    )
+
+
+def _analyze_or_error(path: str):
+    try:
+        return analyze_wav(Path(path))
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def analyze_many(paths: Iterable[Path],
+                 executor: Optional[ProcessPoolExecutor] = None) -> Dict[Path, AudioMetrics | str]:
+    """
+    Metrics per file (or an error string). With an executor the files are
+    spread across its worker processes; NumPy releases the GIL only in parts,
+    so processes scale better than threads here.
+    """
+    paths = [Path(p) for p in paths]
+    if executor is None:
+        return {p: _analyze_or_error(str(p)) for p in paths}
+    chunksize = max(1, len(paths) // (4 * (os.cpu_count() or 1)))
+    results = executor.map(_analyze_or_error, [str(p) for p in paths], chunksize=chunksize)
+    return dict(zip(paths, results))
@@ -0,0 +1,235 @@
+# utils/instrumentation.py
+from __future__ import annotations
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    import cProfile
+
+# WRB_LOG_LEVEL=DEBUG also logs every WAAPI call span
+# WRB_PROFILE=1 runs each bridge operation under cProfile
+LOG_LEVEL_ENV = "WRB_LOG_LEVEL"
+PROFILE_ENV = "WRB_PROFILE"
+
+logger = logging.getLogger("wrb")
+
+
+def get_logger(name: str) -> logging.Logger:
+    return logger.getChild(name)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; extra fields come from record.fields."""
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": round(record.created, 3),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            payload.update(fields)
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+_configured = False
+
+def configure_logging(log_dir: Optional[Path] = None, console: bool = True) -> None:
+    """Console (plain text) + rotating JSON lines file in `log_dir`. Idempotent."""
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    level = getattr(logging, os.environ.get(LOG_LEVEL_ENV, "INFO").upper(), logging.INFO)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    if console:
+        ch = logging.StreamHandler()
+        ch.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+        logger.addHandler(ch)
+
+    if log_dir is not None:
+        from logging.handlers import RotatingFileHandler
+        try:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            fh = RotatingFileHandler(
+                log_dir / "bridge.jsonl", maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8")
+            fh.setFormatter(JsonFormatter())
+            logger.addHandler(fh)
+        except OSError as e:
+            logger.warning("JSON log disabled: %s", e)
+
+
+def log_event(log: logging.Logger, msg: str, level: int = logging.INFO, **fields) -> None:
+    if log.isEnabledFor(level):
+        log.log(level, msg, extra={"fields": fields})
+
+
+@dataclass
+class SpanStats:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+@dataclass
+class RunTimings:
+    """Aggregated span timings of one bridge operation."""
+    name: str
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    started: float = field(default_factory=time.perf_counter)
+    spans: Dict[str, SpanStats] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.spans.setdefault(name, SpanStats()).add(seconds)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            spans = {k: {"count": v.count, "total": round(v.total, 4), "max": round(v.max, 4)}
+                     for k, v in self.spans.items()}
+        return {"run": self.name, "run_id": self.run_id, "elapsed": round(self.elapsed, 4), "spans": spans}
+
+    def summary(self) -> str:
+        d = self.as_dict()
+        rows = sorted(d["spans"].items(), key=lambda kv: kv[1]["total"], reverse=True)
+        lines = [f"{self.name} took {d['elapsed']:.3f}s"]
+        for name, s in rows:
+            lines.append(f"  {name:<28} {s['total']:8.3f}s  x{s['count']:<5} max {s['max']:.3f}s")
+        return "\n".join(lines)
+
+
+# Spans land in the run started on their thread. Helper threads (pools,
+# timers) have none; their spans land in the active run while there is
+# only one (runs of different connection profiles can overlap).
+_active_runs: List[RunTimings] = []
+_active_runs_lock = threading.Lock()
+_thread_run = threading.local()
+
+def active_run() -> Optional[RunTimings]:
+    run = getattr(_thread_run, "run", None)
+    if run is not None:
+        return run
+    with _active_runs_lock:
+        return _active_runs[0] if len(_active_runs) == 1 else None
+
+
+@contextmanager
+def span(name: str, level: int = logging.INFO, **fields) -> Iterator[Dict[str, Any]]:
+    """
+    Time a block. The duration is added to the active run and logged as a
+    JSON record at `level`. Yields a dict the block can add fields to.
+    """
+    extra: Dict[str, Any] = dict(fields)
+    t0 = time.perf_counter()
+    try:
+        yield extra
+    finally:
+        seconds = time.perf_counter() - t0
+        run = active_run()
+        if run is not None:
+            run.add(name, seconds)
+        if logger.isEnabledFor(level):
+            extra.update(span=name, seconds=round(seconds, 6))
+            if run is not None:
+                extra["run_id"] = run.run_id
+            logger.log(level, "%s %.3fs", name, seconds, extra={"fields": extra})
+
+
+@contextmanager
+def run_timer(name: str, profile: Optional[bool] = None,
+              profile_dir: Optional[Path] = None) -> Iterator[RunTimings]:
+    """
+    Collect spans for one operation and log the per-run summary at the end.
+    With profiling on (argument or WRB_PROFILE=1), the run executes under
+    cProfile; stats are dumped to `profile_dir` and the top entries logged.
+    """
+    outer = getattr(_thread_run, "run", None)
+    run = RunTimings(name)
+    concurrent = False
+    if outer is None:
+        _thread_run.run = run
+        with _active_runs_lock:
+            concurrent = bool(_active_runs)
+            _active_runs.append(run)
+
+    if profile is None:
+        profile = os.environ.get(PROFILE_ENV, "") not in ("", "0")
+    profiler = None
+    # cProfile can't run twice at once: only the first of overlapping runs is profiled
+    if profile and outer is None and not concurrent:
+        # Only loaded when profiling; keeps start-up lean
+        import cProfile
+        profiler = cProfile.Profile()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield run
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            _dump_profile(profiler, run, profile_dir)
+        if outer is None:
+            _thread_run.run = None
+            with _active_runs_lock:
+                _active_runs.remove(run)
+            log_event(logger, run.summary(), **run.as_dict())
+        else:
+            # Nested operation: fold into the enclosing run
+            for k, v in run.spans.items():
+                outer.add(k, v.total)
+
+
+def _dump_profile(profiler: cProfile.Profile, run: RunTimings, profile_dir: Optional[Path]) -> None:
+    import io
+    import pstats
+    buf = io.StringIO()
+    stats = pstats.Stats(profiler, stream=buf).sort_stats("cumulative")
+    stats.print_stats(25)
+    if profile_dir is not None:
+        try:
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            out = profile_dir / f"{run.name}-{time.strftime('%Y%m%d-%H%M%S')}-{run.run_id}.prof"
+            stats.dump_stats(str(out))
+            logger.info("cProfile stats written to %s", out)
+        except OSError as e:
+            logger.warning("Could not write profile: %s", e)
+    logger.info("cProfile top entries for %s:\n%s", run.name, buf.getvalue())
+
+
+def instrumented(name: str, profile_dir: Optional[Path] = None):
+    """Decorator: run the function inside run_timer(name); attach timings to a returned Result."""
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with run_timer(name, profile_dir=profile_dir) as run:
+                result = fn(*args, **kwargs)
+            if hasattr(result, "data"):
+                result.data = {**(result.data or {}), "timings": run.as_dict()}
+            return result
+        return wrapper
+    return deco
@@ -0,0 +1,227 @@
+# utils/manifest_store.py
+from __future__ import annotations
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.models import SelectedObj
+from utils.app_paths import selection_db_path
+from utils.instrumentation import get_logger
+
+log = get_logger("manifest")
+
+# History written by "Open in REAPER" and read by "Modify Source"
+LAST_HISTORY = "last"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS histories (
+    name    TEXT PRIMARY KEY,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    history     TEXT NOT NULL,
+    id          TEXT NOT NULL,
+    seq         INTEGER NOT NULL,
+    name        TEXT NOT NULL,
+    path        TEXT NOT NULL,
+    type        TEXT NOT NULL,
+    source_path TEXT,
+    render_name TEXT,
+    PRIMARY KEY (history, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_by_path ON entries (history, path);
+"""
+
+_COLUMNS = "id, name, path, type, source_path, render_name"
+
+
+def _row_to_obj(row) -> SelectedObj:
+    return SelectedObj(id=row[0], name=row[1], path=row[2], type=row[3], source_path=row[4],
+                       render_name=row[5])
+
+
+class SelectionManifest:
+    """
+    Named selection histories in a single SQLite file.
+
+    `save()` only touches rows that changed, lookups by GUID or Wwise path
+    go through an index, and loading is one ordered query.
+    """
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+
+    def _migrate(self) -> None:
+        columns = {r[1] for r in self._conn.execute("PRAGMA table_info(entries)")}
+        if "render_name" not in columns:
+            with self._conn:
+                self._conn.execute("ALTER TABLE entries ADD COLUMN render_name TEXT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def save(self, objs: List[SelectedObj], history: str = LAST_HISTORY) -> int:
+        """Make `history` equal to `objs` (in order). Returns the number of rows written or removed."""
+        with self._lock, self._conn:
+            existing: Dict[str, tuple] = {
+                r[0]: r[1:] for r in self._conn.execute(
+                    "SELECT id, seq, name, path, type, source_path, render_name FROM entries WHERE history = ?",
+                    (history,))
+            }
+            upserts = []
+            keep = set()
+            for seq, o in enumerate(objs):
+                keep.add(o.id)
+                row = (seq, o.name, o.path, o.type, o.source_path, o.render_name)
+                if existing.get(o.id) != row:
+                    upserts.append((history, o.id, *row))
+            removed = [(history, guid) for guid in existing if guid not in keep]
+
+            if removed:
+                self._conn.executemany("DELETE FROM entries WHERE history = ? AND id = ?", removed)
+            if upserts:
+                self._conn.executemany(
+                    "INSERT INTO entries (history, id, seq, name, path, type, source_path, render_name) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (history, id) DO UPDATE SET "
+                    "seq = excluded.seq, name = excluded.name, path = excluded.path, "
+                    "type = excluded.type, source_path = excluded.source_path, "
+                    "render_name = excluded.render_name",
+                    upserts)
+            self._conn.execute(
+                "INSERT INTO histories (name, updated) VALUES (?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET updated = excluded.updated",
+                (history, time.time()))
+            return len(upserts) + len(removed)
+
+    def load(self, history: str = LAST_HISTORY) -> List[SelectedObj]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM entries WHERE history = ? ORDER BY seq", (history,)).fetchall()
+        return [_row_to_obj(r) for r in rows]
+
+    def get_by_id(self, guid: str, history: str = LAST_HISTORY) -> Optional[SelectedObj]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM entries WHERE history = ? AND id = ?", (history, guid)).fetchone()
+        return _row_to_obj(row) if row else None
+
+    def get_by_path(self, path: str, history: str = LAST_HISTORY) -> Optional[SelectedObj]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM entries WHERE history = ? AND path = ?", (history, path)).fetchone()
+        return _row_to_obj(row) if row else None
+
+    def histories(self) -> List[str]:
+        with self._lock:
+            return [r[0] for r in self._conn.execute("SELECT name FROM histories ORDER BY updated DESC")]
+
+    def updated_at(self, history: str = LAST_HISTORY) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute("SELECT updated FROM histories WHERE name = ?", (history,)).fetchone()
+        return row[0] if row else None
+
+    def delete(self, history: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries WHERE history = ?", (history,))
+            self._conn.execute("DELETE FROM histories WHERE name = ?", (history,))
+
+
+def write_selected(jsonlpath: Path, objs: List[SelectedObj]) -> None:
+    """The user-editable JSONL view of a selection: one SelectedObj per line."""
+    jsonlpath.parent.mkdir(parents=True, exist_ok=True)
+    with jsonlpath.open("w", encoding="utf-8") as f:
+        for o in objs:
+            f.write(json.dumps(o.__dict__, ensure_ascii=False) + "\n")
+
+
+def read_selected(path: Path) -> List[SelectedObj]:
+    if not path.exists():
+        return []
+    out: List[SelectedObj] = []
+    decode = json.JSONDecoder().decode
+    with path.open("r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                out.append(SelectedObj(**decode(line)))
+            except Exception as e:
+                # Skip malformed lines, but say which
+                log.warning("%s:%d ignored (%s)", path.name, lineno, e)
+    return out
+
+
+def write_reaper_manifest(objs: List[SelectedObj], txt_path: Path) -> None:
+    """The plain-text list read by wrb_open_wwiseobj_in_reaper.lua."""
+    txt_path.parent.mkdir(parents=True, exist_ok=True)
+    with txt_path.open("w", encoding="utf-8") as ft:
+        for o in objs:
+            # txt: wwise_path|sourcepath(optional)|render_name(optional)
+            ft.write(f"{o.path}|{o.source_path or ''}|{o.render_name or ''}\n")
+
+
+def record_selection(manifest: SelectionManifest,
+                     objs: List[SelectedObj],
+                     txt_path: Path,
+                     history: str = LAST_HISTORY) -> None:
+    """Store a new selection and refresh REAPER's text manifest if anything changed."""
+    changed = manifest.save(objs, history)
+    if changed or not txt_path.exists():
+        write_reaper_manifest(objs, txt_path)
+
+
+def load_selection(manifest: SelectionManifest,
+                   jsonl_path: Path,
+                   history: str = LAST_HISTORY) -> List[SelectedObj]:
+    """
+    Selection for `history`. The JSONL export is only a user-editable view:
+    if it was edited after the manifest was last updated, the edits win and
+    are folded back into the manifest.
+    """
+    updated = manifest.updated_at(history)
+    try:
+        edited = jsonl_path.stat().st_mtime > (updated or 0)
+    except OSError:
+        edited = False
+    if edited:
+        objs = read_selected(jsonl_path)
+        manifest.save(objs, history)
+        return objs
+    return manifest.load(history)
+
+
+def export_selection(manifest: SelectionManifest,
+                     jsonl_path: Path,
+                     history: str = LAST_HISTORY) -> None:
+    """Write `history` as JSONL for editing; the export is stamped older than the manifest."""
+    write_selected(jsonl_path, manifest.load(history))
+    updated = manifest.updated_at(history)
+    if updated is not None:
+        # Back-date by a second to stay clear of float/ns rounding
+        os.utime(jsonl_path, (updated - 1.0, updated - 1.0))
+
+
+_manifests: Dict[Path, SelectionManifest] = {}
+_manifests_lock = threading.Lock()
+
+def get_selection_manifest(db_path: Optional[Path] = None) -> SelectionManifest:
+    """Process-wide manifest at `db_path` (default location if None), opened on first use."""
+    db_path = Path(db_path or selection_db_path)
+    with _manifests_lock:
+        manifest = _manifests.get(db_path)
+        if manifest is None:
+            manifest = _manifests[db_path] = SelectionManifest(db_path)
+        return manifest
@@ -0,0 +1,266 @@
+# utils/process_probe.py
+from __future__ import annotations
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Protocol, Sequence
+
+# Lower-cased process names REAPER runs under (Windows / Linux / macOS)
+REAPER_PROCESS_NAMES = ("reaper.exe", "reaper")
+
+@dataclass(frozen=True)
+class ProcessInfo:
+    pid: int
+    name: str
+
+
+class ProcessBackend(Protocol):
+    def processes(self) -> Iterable[ProcessInfo]: ...
+    def is_responsive(self, pid: int) -> Optional[bool]: ...
+    def exe_path(self, pid: int) -> Optional[str]: ...
+
+
+class PsutilBackend:
+    """Preferred when psutil is installed (optional dependency)."""
+    def __init__(self):
+        import psutil
+        self._psutil = psutil
+
+    def processes(self) -> Iterable[ProcessInfo]:
+        for p in self._psutil.process_iter(["pid", "name"]):
+            name = p.info.get("name")
+            if name:
+                yield ProcessInfo(p.info["pid"], name)
+
+    def is_responsive(self, pid: int) -> Optional[bool]:
+        try:
+            status = self._psutil.Process(pid).status()
+        except self._psutil.Error:
+            return False
+        return status not in (self._psutil.STATUS_ZOMBIE, self._psutil.STATUS_STOPPED)
+
+    def exe_path(self, pid: int) -> Optional[str]:
+        try:
+            return self._psutil.Process(pid).exe() or None
+        except self._psutil.Error:
+            return None
+
+
+class ProcfsBackend:
+    """Linux /proc enumeration."""
+    def __init__(self, root: str = "/proc"):
+        self.root = Path(root)
+        if not self.root.is_dir():
+            raise OSError(f"{root} not available")
+
+    def processes(self) -> Iterable[ProcessInfo]:
+        for entry in os.scandir(self.root):
+            if not entry.name.isdigit():
+                continue
+            try:
+                name = (self.root / entry.name / "comm").read_text().strip()
+            except OSError:
+                continue  # process exited meanwhile
+            yield ProcessInfo(int(entry.name), name)
+
+    def is_responsive(self, pid: int) -> Optional[bool]:
+        try:
+            stat = (self.root / str(pid) / "stat").read_text()
+        except OSError:
+            return False
+        # state is the first field after "(comm)"
+        state = stat.rsplit(")", 1)[-1].split()[0]
+        return state not in ("Z", "T", "X")
+
+    def exe_path(self, pid: int) -> Optional[str]:
+        try:
+            return os.readlink(self.root / str(pid) / "exe")
+        except OSError:
+            return None
+
+
+class WindowsBackend:
+    """Toolhelp32 snapshot through ctypes; no tasklist shell-out."""
+    TH32CS_SNAPPROCESS = 0x00000002
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESSENTRY32W(ctypes.Structure):
+            _fields_ = [
+                ("dwSize", wintypes.DWORD),
+                ("cntUsage", wintypes.DWORD),
+                ("th32ProcessID", wintypes.DWORD),
+                ("th32DefaultHeapID", ctypes.c_void_p),
+                ("th32ModuleID", wintypes.DWORD),
+                ("cntThreads", wintypes.DWORD),
+                ("th32ParentProcessID", wintypes.DWORD),
+                ("pcPriClassBase", ctypes.c_long),
+                ("dwFlags", wintypes.DWORD),
+                ("szExeFile", wintypes.WCHAR * 260),
+            ]
+
+        self._ctypes = ctypes
+        self._wintypes = wintypes
+        self._entry_type = PROCESSENTRY32W
+        self._kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        self._user32 = ctypes.WinDLL("user32", use_last_error=True)
+        self._kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+        self._kernel32.OpenProcess.restype = wintypes.HANDLE
+
+    def processes(self) -> Iterable[ProcessInfo]:
+        k32 = self._kernel32
+        snap = k32.CreateToolhelp32Snapshot(self.TH32CS_SNAPPROCESS, 0)
+        if not snap or snap == self._wintypes.HANDLE(-1).value:
+            return []
+        out: List[ProcessInfo] = []
+        try:
+            entry = self._entry_type()
+            entry.dwSize = self._ctypes.sizeof(entry)
+            ok = k32.Process32FirstW(snap, self._ctypes.byref(entry))
+            while ok:
+                out.append(ProcessInfo(entry.th32ProcessID, entry.szExeFile))
+                ok = k32.Process32NextW(snap, self._ctypes.byref(entry))
+        finally:
+            k32.CloseHandle(snap)
+        return out
+
+    def is_responsive(self, pid: int) -> Optional[bool]:
+        """False if any visible top-level window of `pid` is hung."""
+        ctypes, wintypes, user32 = self._ctypes, self._wintypes, self._user32
+        hung = []
+        seen = []
+
+        @ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+        def on_window(hwnd, _):
+            owner = wintypes.DWORD()
+            user32.GetWindowThreadProcessId(hwnd, ctypes.byref(owner))
+            if owner.value == pid and user32.IsWindowVisible(hwnd):
+                seen.append(hwnd)
+                if user32.IsHungAppWindow(hwnd):
+                    hung.append(hwnd)
+            return True
+
+        user32.EnumWindows(on_window, 0)
+        if not seen:
+            return None  # no window yet (starting up); can't tell
+        return not hung
+
+    def exe_path(self, pid: int) -> Optional[str]:
+        ctypes, wintypes, k32 = self._ctypes, self._wintypes, self._kernel32
+        handle = k32.OpenProcess(self.PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return None
+        try:
+            buf = ctypes.create_unicode_buffer(32768)
+            size = wintypes.DWORD(len(buf))
+            if not k32.QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(size)):
+                return None
+            return buf.value
+        finally:
+            k32.CloseHandle(handle)
+
+
+def default_backend() -> ProcessBackend:
+    candidates = [PsutilBackend]
+    if sys.platform == "win32":
+        candidates.append(WindowsBackend)
+    elif sys.platform.startswith("linux"):
+        candidates.append(ProcfsBackend)
+    for backend in candidates:
+        try:
+            return backend()
+        except Exception:
+            continue
+    raise RuntimeError("No process enumeration backend available on this platform")
+
+
+class ProcessProbe:
+    """
+    Finds processes by name through a pluggable backend.
+    Results are cached for `ttl` seconds so repeated checks within one
+    operation cost a single enumeration.
+    """
+    def __init__(self, backend: Optional[ProcessBackend] = None, ttl: float = 2.0):
+        self._backend = backend
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._cache: List[ProcessInfo] = []
+        self._cache_time = float("-inf")
+
+    @property
+    def backend(self) -> ProcessBackend:
+        if self._backend is None:
+            self._backend = default_backend()
+        return self._backend
+
+    def set_backend(self, backend: ProcessBackend) -> None:
+        with self._lock:
+            self._backend = backend
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        self._cache_time = float("-inf")
+
+    def _snapshot(self) -> List[ProcessInfo]:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._cache_time > self.ttl:
+                self._cache = list(self.backend.processes())
+                self._cache_time = now
+            return self._cache
+
+    def find(self, names: Sequence[str]) -> List[ProcessInfo]:
+        wanted = {n.lower() for n in names}
+        return [p for p in self._snapshot() if p.name.lower() in wanted]
+
+    def is_responsive(self, pid: int) -> Optional[bool]:
+        """True/False, or None if the backend can't tell."""
+        try:
+            return self.backend.is_responsive(pid)
+        except Exception:
+            return None
+
+    def exe_path(self, pid: int) -> Optional[str]:
+        """Full path of the process's executable, or None if the backend can't tell."""
+        try:
+            return self.backend.exe_path(pid)
+        except Exception:
+            return None
+
+
+_probe = ProcessProbe()
+
+def get_process_probe() -> ProcessProbe:
+    return _probe
+
+def _same_exe(running: str, configured: str) -> bool:
+    """`running` is `configured`, or inside it (macOS: REAPER.app/Contents/MacOS/REAPER)."""
+    def norm(p: str) -> str:
+        return os.path.normcase(os.path.realpath(p))
+    running, configured = norm(running), norm(configured)
+    return running == configured or running.startswith(configured.rstrip(os.sep) + os.sep)
+
+def find_reaper(exe_path: Optional[str] = None) -> Optional[ProcessInfo]:
+    """
+    First running REAPER process, or None. With `exe_path` (a profile's
+    reaper.exe), only a REAPER started from that executable counts; one
+    whose path can't be read is given the benefit of the doubt, and so is
+    any REAPER if `exe_path` doesn't exist.
+    """
+    try:
+        found = _probe.find(REAPER_PROCESS_NAMES)
+    except Exception:
+        return None
+    if not exe_path or not os.path.exists(exe_path):
+        return found[0] if found else None
+    for proc in found:
+        running = _probe.exe_path(proc.pid)
+        if running is None or _same_exe(running, exe_path):
+            return proc
+    return None
@@ -0,0 +1,223 @@
+# utils/reaper_channel.py
+from __future__ import annotations
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils.render_watch import make_dir_notifier
+from utils.app_paths import channel_dir
+
+# Served by assets/wrb_command_listener.lua running inside REAPER.
+#
+# Request  inbox/<id>.req :  command|<name>  followed by  arg|<key>=<value>  lines
+# Ack      outbox/<id>.ack:  written once the listener took the request, before running it
+# Response outbox/<id>.res:  ok|1 or ok|0, then  value|<key>=<value>  and  error|<text>  lines
+# heartbeat              :  rewritten by the listener about once per second
+#
+# Both sides write to a .tmp file and rename it, so a reader never sees a partial file.
+# The listener takes a request by renaming it and the sender withdraws it by
+# deleting it; only one of the two can succeed, so a withdrawn request never runs.
+
+HEARTBEAT_NAME = "heartbeat"
+
+
+class ChannelError(Exception):
+    pass
+
+
+class ChannelTimeout(ChannelError):
+    pass
+
+
+class ChannelNotPickedUp(ChannelTimeout):
+    """The listener never took the request; it was withdrawn and will not run."""
+
+
+@dataclass
+class ChannelResponse:
+    ok: bool
+    values: Dict[str, str] = field(default_factory=dict)
+    error: str = ""
+    seconds: float = 0.0
+
+
+def _escape(v: str) -> str:
+    return v.replace("\\", "\\\\").replace("\n", "\\n").replace("\r", "")
+
+def _unescape(v: str) -> str:
+    return v.replace("\\n", "\n").replace("\\\\", "\\")
+
+def format_request(command: str, args: Optional[Dict[str, str]] = None) -> str:
+    lines = [f"command|{command}"]
+    for k, v in (args or {}).items():
+        lines.append(f"arg|{k}={_escape(str(v))}")
+    return "\n".join(lines) + "\n"
+
+def parse_request(text: str) -> tuple[str, Dict[str, str]]:
+    command, args = "", {}
+    for line in text.splitlines():
+        kind, _, rest = line.partition("|")
+        if kind == "command":
+            command = rest.strip()
+        elif kind == "arg":
+            k, _, v = rest.partition("=")
+            args[k] = _unescape(v)
+    return command, args
+
+def format_response(ok: bool, values: Optional[Dict[str, str]] = None, error: str = "") -> str:
+    lines = [f"ok|{1 if ok else 0}"]
+    for k, v in (values or {}).items():
+        lines.append(f"value|{k}={_escape(str(v))}")
+    if error:
+        lines.append(f"error|{_escape(error)}")
+    return "\n".join(lines) + "\n"
+
+def parse_response(text: str) -> ChannelResponse:
+    resp = ChannelResponse(ok=False)
+    for line in text.splitlines():
+        kind, _, rest = line.partition("|")
+        if kind == "ok":
+            resp.ok = rest.strip() == "1"
+        elif kind == "value":
+            k, _, v = rest.partition("=")
+            resp.values[k] = _unescape(v)
+        elif kind == "error":
+            resp.error = _unescape(rest)
+    return resp
+
+def write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class ReaperChannel:
+    """
+    Client side of the file-queue command channel to a running REAPER.
+
+    Lua scripts in REAPER have no sockets, so commands travel as small files
+    in `channel_dir`; waiting for a response blocks on directory change
+    notifications, so a round-trip costs a few milliseconds plus REAPER's
+    defer tick.
+    """
+    def __init__(self, channel_dir: Path, heartbeat_timeout: float = 3.0):
+        self.channel_dir = Path(channel_dir)
+        self.inbox = self.channel_dir / "inbox"
+        self.outbox = self.channel_dir / "outbox"
+        self.heartbeat_timeout = heartbeat_timeout
+
+    def _ensure_dirs(self) -> None:
+        self.inbox.mkdir(parents=True, exist_ok=True)
+        self.outbox.mkdir(parents=True, exist_ok=True)
+
+    def is_alive(self) -> bool:
+        """A listener refreshed the heartbeat recently."""
+        try:
+            age = time.time() - (self.channel_dir / HEARTBEAT_NAME).stat().st_mtime
+        except OSError:
+            return False
+        return age < self.heartbeat_timeout
+
+    def wait_alive(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.is_alive():
+                return True
+            time.sleep(0.1)
+        return self.is_alive()
+
+    def send(self, command: str, args: Optional[Dict[str, str]] = None, timeout: float = 5.0,
+             run_timeout: Optional[float] = 5.0,
+             cancel: Optional[threading.Event] = None) -> ChannelResponse:
+        """
+        Send one command and wait for its response.
+
+        `timeout` bounds the wait for the listener to take the request; if it
+        does not, the request is withdrawn and ChannelNotPickedUp is raised.
+        Once taken, `run_timeout` (None: no limit) bounds the wait for the
+        response and running out raises ChannelTimeout; the command may still
+        complete. Setting `cancel` stops waiting with a ChannelError.
+        """
+        self._ensure_dirs()
+        req_id = uuid.uuid4().hex
+        req_path = self.inbox / f"{req_id}.req"
+        ack_path = self.outbox / f"{req_id}.ack"
+        res_path = self.outbox / f"{req_id}.res"
+
+        t0 = time.perf_counter()
+        notifier = make_dir_notifier(self.outbox)
+        taken = False
+        try:
+            write_atomic(req_path, format_request(command, args))
+            deadline = time.monotonic() + timeout
+            while not res_path.exists():
+                if not taken and ack_path.exists():
+                    taken = True
+                    deadline = None if run_timeout is None else time.monotonic() + run_timeout
+                if cancel is not None and cancel.is_set():
+                    req_path.unlink(missing_ok=True)
+                    raise ChannelError(f"Stopped waiting for REAPER to run '{command}'")
+                remaining = 0.25 if deadline is None else deadline - time.monotonic()
+                if remaining > 0:
+                    notifier.wait(min(remaining, 0.25))
+                elif taken:
+                    raise ChannelTimeout(f"REAPER did not finish '{command}' within {run_timeout:.1f}s")
+                else:
+                    try:
+                        # Withdraw the request so a late listener doesn't run it
+                        req_path.unlink()
+                    except FileNotFoundError:
+                        # Taken just now, or by a listener that sends no ack: it runs
+                        taken = True
+                        deadline = None if run_timeout is None else time.monotonic() + run_timeout
+                        continue
+                    raise ChannelNotPickedUp(f"REAPER did not pick up '{command}' within {timeout:.1f}s")
+        finally:
+            notifier.close()
+            ack_path.unlink(missing_ok=True)
+
+        try:
+            resp = parse_response(res_path.read_text(encoding="utf-8"))
+        finally:
+            res_path.unlink(missing_ok=True)
+        resp.seconds = time.perf_counter() - t0
+        return resp
+
+    def ping(self, timeout: float = 2.0) -> bool:
+        try:
+            return self.send("ping", timeout=timeout).ok
+        except ChannelError:
+            return False
+
+    def run_script(self, lua_path: Path | str, timeout: float = 5.0,
+                   cancel: Optional[threading.Event] = None) -> ChannelResponse:
+        """
+        Run a ReaScript inside REAPER. Returns once the script's main chunk
+        ran, however long that takes; only pick-up is bounded by `timeout`.
+        """
+        return self.send("run_script", {"path": str(lua_path)}, timeout=timeout,
+                         run_timeout=None, cancel=cancel)
+
+    def get_render_format(self, timeout: float = 5.0) -> Optional[str]:
+        resp = self.send("get_render_format", timeout=timeout)
+        return resp.values.get("render_format") if resp.ok else None
+
+    def pending_requests(self) -> List[Path]:
+        return sorted(self.inbox.glob("*.req")) if self.inbox.exists() else []
+
+
+_channels: Dict[Path, ReaperChannel] = {}
+_channels_lock = threading.Lock()
+
+def get_reaper_channel(directory: Optional[Path] = None) -> ReaperChannel:
+    """Channel in `directory` (default location localdata_dir/channel if None)."""
+    directory = Path(directory or channel_dir)
+    with _channels_lock:
+        channel = _channels.get(directory)
+        if channel is None:
+            channel = _channels[directory] = ReaperChannel(directory)
+        return channel
@@ -0,0 +1,127 @@
+# utils/render_cache.py
+from __future__ import annotations
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from core.models import SelectedObj
+from utils.wav_info import WavFormatError, parse_wav
+
+HASH_PREFIX = "b3:"  # bump if the digest algorithm changes
+_READ_CHUNK = 1 << 20
+
+
+def pcm_digest(path: Path) -> Optional[str]:
+    """
+    blake2b over the sample format (format tag, channels, rate, bits) and
+    the audio samples, fed from an mmap in 1 MiB slices. Other header and
+    metadata differences (BWF, LIST chunks) don't change the digest; the
+    same bytes at another rate or bit depth do. Falls back to the whole
+    file for non-WAV input.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return HASH_PREFIX + h.hexdigest()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                try:
+                    info = parse_wav(mm, size)
+                    h.update(struct.pack("<HHIH", info.format_tag, info.channels, info.sample_rate, info.bits))
+                    start, end = info.data_offset, info.data_offset + info.data_size
+                except WavFormatError:
+                    start, end = 0, size
+                view = memoryview(mm)
+                try:
+                    for pos in range(start, end, _READ_CHUNK):
+                        h.update(view[pos:min(pos + _READ_CHUNK, end)])
+                finally:
+                    view.release()
+    except OSError:
+        return None
+    return HASH_PREFIX + h.hexdigest()
+
+
+def _file_identity(path: Optional[str]) -> Optional[list]:
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [path, st.st_size, st.st_mtime_ns]
+
+
+class RenderHashIndex:
+    """
+    Persistent { object GUID: PCM digest of the audio Wwise currently uses }.
+
+    An entry also remembers which file it was computed from (path, size,
+    mtime); if the object's source file changed since, the source is
+    re-hashed once. A render whose digest matches needs no import.
+    """
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, dict] = {}
+        self._pending: Dict[str, str] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self._entries = {k: v for k, v in data.items() if isinstance(v, dict)}
+
+    def save(self) -> None:
+        with self._lock:
+            payload = json.dumps(self._entries, ensure_ascii=False)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(payload, encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def _current_digest(self, obj: SelectedObj) -> Optional[str]:
+        identity = _file_identity(obj.source_path)
+        with self._lock:
+            if identity is None:
+                # Wwise's source is missing (or unknown): the render must be
+                # imported, whatever was recorded for it
+                self._entries.pop(obj.id, None)
+                return None
+            entry = self._entries.get(obj.id)
+        if entry and entry.get("source") == identity:
+            return entry.get("hash")
+        digest = pcm_digest(Path(obj.source_path))
+        if digest:
+            with self._lock:
+                self._entries[obj.id] = {"hash": digest, "source": identity}
+        return digest
+
+    def needs_import(self, obj: SelectedObj, wav: Path) -> bool:
+        """False when `wav` is bit-identical to what Wwise already references."""
+        rendered = pcm_digest(wav)
+        if rendered is None:
+            return True
+        if rendered == self._current_digest(obj):
+            return False
+        with self._lock:
+            self._pending[obj.id] = rendered
+        return True
+
+    def commit(self, guids: Iterable[str]) -> None:
+        """Record the rendered digests of successfully imported objects."""
+        with self._lock:
+            for guid in guids:
+                digest = self._pending.pop(guid, None)
+                if digest:
+                    # Source identity is unknown until Wwise reports the new path
+                    self._entries[guid] = {"hash": digest, "source": None}
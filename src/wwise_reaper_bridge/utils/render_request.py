@@ -0,0 +1,57 @@
+# utils/render_request.py
+from __future__ import annotations
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from utils.reaper_channel import write_atomic
+
+# Read by assets/wrb_export_tracks.lua before rendering:
+#   dir|<path>      render into this folder (created if missing)
+#   keep|1          don't clear the render folder (existing renders are reused)
+#   format|<b64>    RENDER_FORMAT to use instead of the one in config.json
+#   track|<name>    render only these root tracks (repeatable)
+# No file means: clear the default render folder and render every root track.
+
+
+@dataclass(frozen=True)
+class RenderRequest:
+    tracks: Optional[List[str]] = None
+    keep_existing: bool = False
+    render_dir: Optional[str] = None
+    render_format: Optional[str] = None
+
+    def format(self) -> str:
+        lines = [f"dir|{self.render_dir}"] if self.render_dir else []
+        lines.append(f"keep|{1 if self.keep_existing else 0}")
+        if self.render_format:
+            lines.append(f"format|{self.render_format}")
+        lines.extend(f"track|{name}" for name in self.tracks or [])
+        return "\n".join(lines) + "\n"
+
+
+def parse_render_request(text: str) -> RenderRequest:
+    tracks: List[str] = []
+    keep = False
+    render_dir = None
+    render_format = None
+    for line in text.splitlines():
+        kind, _, value = line.partition("|")
+        if kind == "dir" and value:
+            render_dir = value
+        elif kind == "format" and value:
+            render_format = value
+        elif kind == "keep":
+            keep = value.strip() == "1"
+        elif kind == "track" and value:
+            tracks.append(value)
+    return RenderRequest(tracks or None, keep, render_dir, render_format)
+
+
+def write_render_request(path: Path, request: Optional[RenderRequest]) -> None:
+    """Write `request`, or remove the file for a full render."""
+    if request is None:
+        Path(path).unlink(missing_ok=True)
+        return
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(Path(path), request.format())
@@ -0,0 +1,296 @@
+# utils/render_watch.py
+from __future__ import annotations
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Literal, Optional
+
+from utils.instrumentation import get_logger
+
+log = get_logger("render_watch")
+
+# Written by wrb_export_tracks.lua into the render folder
+PROGRESS_LOG_NAME = "progress.log"
+SUCCESS_FLAG_NAME = "success.flag"
+
+EventKind = Literal["total", "rendered", "done"]
+
+@dataclass(frozen=True)
+class RenderEvent:
+    kind: EventKind
+    name: str = ""
+    count: int = 0
+
+
+def parse_progress_line(line: str) -> RenderEvent | None:
+    """
+    progress.log lines:
+      total|<n>        number of tracks the script is about to render
+      rendered|<name>  <name>.wav has been written and closed
+    """
+    kind, _, value = line.strip().partition("|")
+    if kind == "total":
+        try:
+            return RenderEvent("total", count=int(value))
+        except ValueError:
+            return None
+    if kind == "rendered" and value:
+        return RenderEvent("rendered", name=value)
+    return None
+
+
+class _PollNotifier:
+    """Fallback: no OS notifications, just wake up periodically."""
+    def __init__(self, directory: Path):
+        self._stop = threading.Event()
+
+    def wait(self, timeout: float) -> None:
+        self._stop.wait(timeout)
+
+    def close(self) -> None:
+        self._stop.set()
+
+
+class _InotifyNotifier:
+    """Linux inotify through libc, no extra dependency."""
+    IN_MODIFY = 0x002
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+
+    def __init__(self, directory: Path):
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        if libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), mask) < 0:
+            os.close(self._fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+
+    def wait(self, timeout: float) -> None:
+        import select
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if ready:
+            try:
+                os.read(self._fd, 64 * 1024)  # drain; we rescan instead of decoding events
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+
+
+class _WindowsNotifier:
+    """Windows ReadDirectoryChangesW (overlapped) through pywin32."""
+    def __init__(self, directory: Path):
+        import pywintypes
+        import win32con
+        import win32event
+        import win32file
+
+        self._win32file = win32file
+        self._win32event = win32event
+        self._handle = win32file.CreateFile(
+            str(directory),
+            0x0001,  # FILE_LIST_DIRECTORY
+            win32con.FILE_SHARE_READ | win32con.FILE_SHARE_WRITE | win32con.FILE_SHARE_DELETE,
+            None,
+            win32con.OPEN_EXISTING,
+            win32con.FILE_FLAG_BACKUP_SEMANTICS | win32con.FILE_FLAG_OVERLAPPED,
+            None,
+        )
+        self._filter = (win32con.FILE_NOTIFY_CHANGE_FILE_NAME
+                        | win32con.FILE_NOTIFY_CHANGE_SIZE
+                        | win32con.FILE_NOTIFY_CHANGE_LAST_WRITE)
+        self._overlapped = pywintypes.OVERLAPPED()
+        self._overlapped.hEvent = win32event.CreateEvent(None, True, False, None)
+        self._buffer = win32file.AllocateReadBuffer(16 * 1024)
+        self._pending = False
+
+    def wait(self, timeout: float) -> None:
+        if not self._pending:
+            self._win32file.ReadDirectoryChangesW(
+                self._handle, self._buffer, False, self._filter, self._overlapped)
+            self._pending = True
+        rc = self._win32event.WaitForSingleObject(self._overlapped.hEvent, int(timeout * 1000))
+        if rc == self._win32event.WAIT_OBJECT_0:
+            self._win32file.GetOverlappedResult(self._handle, self._overlapped, True)
+            self._win32event.ResetEvent(self._overlapped.hEvent)
+            self._pending = False
+
+    def close(self) -> None:
+        try:
+            if self._pending:
+                self._win32file.CancelIo(self._handle)
+            self._handle.Close()
+        except Exception:
+            pass
+
+
+def make_dir_notifier(directory: Path):
+    """Best available change notifier for `directory`: .wait(timeout) / .close()."""
+    backends = []
+    if sys.platform == "win32":
+        backends.append(_WindowsNotifier)
+    elif sys.platform.startswith("linux"):
+        backends.append(_InotifyNotifier)
+    for backend in backends:
+        try:
+            return backend(directory)
+        except Exception as e:
+            log.info("%s unavailable (%s), falling back to polling", backend.__name__, e)
+    return _PollNotifier(directory)
+
+
+class RenderWatcher:
+    """
+    Follows the REAPER render script through the render folder.
+
+    The script appends to progress.log after every rendered track and drops
+    success.flag at the end. The watcher reacts to directory change
+    notifications (ReadDirectoryChangesW / inotify, polling as a fallback),
+    reads only the new part of progress.log and forwards RenderEvents to
+    `on_event` from its own thread. `wait()` returns as soon as success.flag
+    appears, or as soon as the watcher thread fails (`error` says why).
+    """
+    def __init__(self,
+                 render_dir: Path,
+                 on_event: Optional[Callable[[RenderEvent], None]] = None,
+                 rescan_interval: float = 0.5):
+        self.render_dir = Path(render_dir)
+        self.on_event = on_event
+        self.rescan_interval = rescan_interval
+
+        self.total = 0
+        self.rendered: List[str] = []
+        # Why the watcher thread died, if it did
+        self.error: Optional[BaseException] = None
+
+        self._offset = 0
+        self._partial = b""  # bytes: a read may end inside a UTF-8 character
+        self._done = threading.Event()
+        # Set on success.flag or on failure: what wait() blocks on
+        self._finished = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._notifier = None
+
+    @property
+    def progress_log(self) -> Path:
+        return self.render_dir / PROGRESS_LOG_NAME
+
+    @property
+    def success_flag(self) -> Path:
+        return self.render_dir / SUCCESS_FLAG_NAME
+
+    def start(self) -> "RenderWatcher":
+        self.render_dir.mkdir(parents=True, exist_ok=True)
+        self._notifier = make_dir_notifier(self.render_dir)
+        self._thread = threading.Thread(target=self._run, name="RenderWatcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        # The thread wakes up within rescan_interval; close the OS handle after it left wait()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.rescan_interval + 2.0)
+        if self._notifier is not None:
+            self._notifier.close()
+
+    def __enter__(self) -> "RenderWatcher":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    def wait(self, timeout: Optional[float] = None, cancel: Optional[threading.Event] = None) -> bool:
+        """
+        Block until success.flag is seen. Returns False on timeout, when
+        `cancel` is set or when the watcher thread failed (see `error`).
+        """
+        if cancel is None:
+            self._finished.wait(timeout)
+            return self._done.is_set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._finished.is_set():
+            if cancel.is_set():
+                return False
+            remaining = 0.1 if deadline is None else min(0.1, deadline - time.monotonic())
+            if remaining <= 0:
+                return False
+            self._finished.wait(remaining)
+        return self._done.is_set()
+
+    def _run(self) -> None:
+        try:
+            self._scan()
+            while not self._stopped.is_set() and not self._done.is_set():
+                self._notifier.wait(self.rescan_interval)
+                if self._stopped.is_set():
+                    break
+                self._scan()
+        except Exception as e:
+            # Never leave waiters hanging on a dead watcher thread
+            log.warning("render watcher stopped: %s", e)
+            self.error = e
+            self._finished.set()
+
+    def _emit(self, event: RenderEvent) -> None:
+        if event.kind == "total":
+            self.total = event.count
+        elif event.kind == "rendered":
+            self.rendered.append(event.name)
+        if self.on_event is not None:
+            try:
+                self.on_event(event)
+            except Exception as e:
+                log.warning("render event handler failed: %s", e)
+
+    def _read_progress(self) -> None:
+        try:
+            size = self.progress_log.stat().st_size
+        except OSError:
+            return
+        if size < self._offset:
+            # The script cleaned the folder and restarted the log
+            self._offset, self._partial = 0, b""
+        if size == self._offset:
+            return
+        with self.progress_log.open("rb") as f:
+            f.seek(self._offset)
+            chunk = f.read(size - self._offset)
+        self._offset += len(chunk)
+
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()  # incomplete last line, if any
+        for line in lines:
+            event = parse_progress_line(line.decode("utf-8", errors="replace"))
+            if event is not None:
+                self._emit(event)
+
+    def _scan(self) -> None:
+        self._read_progress()
+        if self.success_flag.exists():
+            # Pick up lines written just before the flag
+            self._read_progress()
+            self._emit(RenderEvent("done", count=len(self.rendered)))
+            self._done.set()
+            self._finished.set()
+
@@ -0,0 +1,215 @@
+# utils/render_workspace.py
+from __future__ import annotations
+import os
+import shutil
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from core.models import Settings
+from utils.app_paths import APP_NAME, profile_slug, temp_render_dir
+from utils.instrumentation import get_logger, log_event
+
+log = get_logger("render_workspace")
+
+RUN_PREFIX = "run-"
+TRASH_PREFIX = "trash-"
+LAST_USED_NAME = ".last_used"
+# Runs used more recently than this are never evicted (REAPER may still write there)
+MIN_EVICT_AGE = 60.0
+
+# Run folders in use by this process, never cleaned up
+_active: set[Path] = set()
+_active_lock = threading.Lock()
+# One cleanup at a time per root
+_cleanup_locks: dict[Path, threading.Lock] = {}
+
+
+def ram_render_root() -> Optional[Path]:
+    """A RAM-backed folder the OS provides without setup (Linux /dev/shm), else None."""
+    shm = Path("/dev/shm")
+    if sys.platform.startswith("linux") and shm.is_dir() and os.access(shm, os.W_OK):
+        return shm / APP_NAME / "renders"
+    return None
+
+
+def resolve_render_root(settings: Settings, default_root: Optional[Path] = None) -> Path:
+    """
+    Where render runs go: a RAM-backed folder if requested and available,
+    else `render_root` (e.g. a fast disk or a RAM disk on Windows), else
+    `default_root` (a connection profile's own folder) or the default
+    folder in local app data. A connection profile renders into its own
+    subfolder of any root it shares with the others.
+    """
+    profile = settings.get_profile(settings.active_profile)
+    shared = Path("profiles") / profile_slug(profile.name) if profile else Path()
+    if settings.render_to_ram:
+        ram = ram_render_root()
+        if ram is not None:
+            return ram / shared
+        log.warning("No RAM-backed folder on this system; point render_root at a RAM disk instead")
+    if profile and profile.render_root:
+        return Path(profile.render_root).expanduser()
+    if settings.render_root:
+        return Path(settings.render_root).expanduser() / shared
+    return default_root or temp_render_dir
+
+
+def _dir_size(path: Path) -> int:
+    total = 0
+    try:
+        with os.scandir(path) as it:
+            for e in it:
+                try:
+                    total += e.stat().st_size if e.is_file(follow_symlinks=False) else _dir_size(Path(e.path))
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return total
+
+
+class RenderWorkspace:
+    """
+    Render runs under one root folder, one subfolder per sync.
+
+    A new run gets a fresh, empty folder at once; older runs are removed on
+    a background thread, least recently used first, once there are more
+    than `keep_runs` of them or they take more than `quota_bytes` together.
+    Runs in use by this process (and any passed as `protect`) are left
+    alone. A run is renamed away before it is deleted, so nothing sees a
+    half-deleted folder, and on Windows a folder with open files can't be
+    renamed and is simply retried next time.
+    """
+    def __init__(self, root: Path, quota_bytes: int = 0, keep_runs: int = 5):
+        self.root = Path(root)
+        self.quota_bytes = quota_bytes
+        self.keep_runs = max(1, keep_runs)
+
+    @classmethod
+    def from_settings(cls, settings: Settings, default_root: Optional[Path] = None) -> "RenderWorkspace":
+        return cls(resolve_render_root(settings, default_root),
+                   quota_bytes=max(0, settings.render_quota_mb) * 1024 * 1024,
+                   keep_runs=settings.render_keep_runs)
+
+    @staticmethod
+    def last_used(run: Path) -> float:
+        try:
+            return (run / LAST_USED_NAME).stat().st_mtime
+        except OSError:
+            try:
+                return run.stat().st_mtime
+            except OSError:
+                return 0.0
+
+    @staticmethod
+    def touch(run: Path) -> None:
+        try:
+            (run / LAST_USED_NAME).touch()
+        except OSError:
+            pass
+
+    def runs(self) -> List[Path]:
+        """Run folders, least recently used first."""
+        try:
+            found = [p for p in self.root.iterdir() if p.is_dir() and p.name.startswith(RUN_PREFIX)]
+        except OSError:
+            return []
+        return sorted(found, key=self.last_used)
+
+    def latest_run(self) -> Optional[Path]:
+        runs = self.runs()
+        return runs[-1] if runs else None
+
+    def _acquire(self, run: Path) -> Path:
+        with _active_lock:
+            _active.add(run.resolve())
+        self.touch(run)
+        return run
+
+    def new_run(self, protect: Iterable[Path] = ()) -> Path:
+        """Create an empty run folder and start cleaning up old ones in the background."""
+        name = f"{RUN_PREFIX}{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        run = self.root / name
+        run.mkdir(parents=True, exist_ok=False)
+        self._acquire(run)
+        self.cleanup_async(protect)
+        return run
+
+    def reuse_run(self, run: Path, protect: Iterable[Path] = ()) -> Path:
+        """Continue in an existing run folder (resumed sync)."""
+        run.mkdir(parents=True, exist_ok=True)
+        self._acquire(run)
+        self.cleanup_async(protect)
+        return run
+
+    def release(self, run: Path) -> None:
+        with _active_lock:
+            _active.discard(run.resolve())
+        self.touch(run)
+
+    def cleanup_async(self, protect: Iterable[Path] = ()) -> threading.Thread:
+        t = threading.Thread(target=self.cleanup, args=(list(protect),),
+                             name="RenderCleanup", daemon=True)
+        t.start()
+        return t
+
+    def _evict(self, run: Path) -> bool:
+        trash = run.with_name(f"{TRASH_PREFIX}{run.name}")
+        try:
+            os.replace(run, trash)
+        except OSError:
+            return False  # in use (Windows) or gone
+        shutil.rmtree(trash, ignore_errors=True)
+        return True
+
+    def cleanup(self, protect: Iterable[Path] = ()) -> Tuple[int, int]:
+        """Evict old runs; returns (runs removed, bytes freed)."""
+        with _active_lock:
+            lock = _cleanup_locks.setdefault(self.root.resolve(), threading.Lock())
+        if not lock.acquire(blocking=False):
+            return 0, 0  # another cleanup is already on it
+        try:
+            with _active_lock:
+                keep = set(_active) | {Path(p).resolve() for p in protect}
+            removed = freed = 0
+            # Leftovers: interrupted deletions, and renders of the old flat layout
+            # (only in the default folder; a user-chosen root may hold other files)
+            legacy = self.root == temp_render_dir
+            try:
+                for p in self.root.iterdir():
+                    if legacy and p.is_file() and p.suffix.lower() in (".wav", ".log", ".flag"):
+                        p.unlink(missing_ok=True)
+                    elif p.is_dir() and p.name.startswith(TRASH_PREFIX):
+                        shutil.rmtree(p, ignore_errors=True)
+            except OSError:
+                pass
+
+            runs = self.runs()
+            now = time.time()
+            evictable = [r for r in runs
+                         if r.resolve() not in keep and now - self.last_used(r) >= MIN_EVICT_AGE]
+            if not evictable:
+                return 0, 0  # skip the size scan, nothing could be removed anyway
+            sizes = {r: _dir_size(r) for r in runs} if self.quota_bytes else {}
+            total = sum(sizes.values())
+            count = len(runs)
+            for run in evictable:  # LRU first
+                over_count = count > self.keep_runs
+                over_quota = bool(self.quota_bytes) and total > self.quota_bytes
+                if not (over_count or over_quota):
+                    break
+                size = sizes.get(run) or _dir_size(run)
+                if self._evict(run):
+                    removed += 1
+                    freed += size
+                    count -= 1
+                    total -= sizes.get(run, 0)
+            if removed:
+                log_event(log, f"removed {removed} old render run(s)", removed=removed, freed_bytes=freed)
+            return removed, freed
+        finally:
+            lock.release()
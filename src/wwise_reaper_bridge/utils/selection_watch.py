@@ -0,0 +1,183 @@
+# utils/selection_watch.py
+from __future__ import annotations
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from core.models import SelectedObj
+from utils.app_paths import last_selected_txt_path
+from utils.instrumentation import get_logger, log_event, span
+from utils.manifest_store import SelectionManifest
+from utils.wwise_waapi import WaapiConnectionPool, ensure_waapi_client, get_selected_sfx, get_waapi_pool
+
+log = get_logger("selection_watch")
+
+# Events after which the selected Sounds or their source paths may differ
+WATCH_TOPICS = (
+    "ak.wwise.ui.selectionChanged",
+    "ak.wwise.core.object.nameChanged",      # object paths / render names
+    "ak.wwise.core.object.childAdded",       # selected containers gained Sounds
+    "ak.wwise.core.object.childRemoved",
+    "ak.wwise.core.object.postDeleted",
+    "ak.wwise.core.audio.imported",          # new original sources
+    "ak.wwise.core.project.loaded",
+)
+# Wait this long after the last event before re-querying (selection drags
+# and multi-object edits arrive as bursts)
+DEFAULT_DEBOUNCE = 0.2
+# While Wwise is unreachable, try to connect this often
+RECONNECT_INTERVAL = 5.0
+
+
+class SelectionWatcher:
+    """
+    Keeps the Wwise selection (expanded to Sounds, with source paths and
+    render names) up to date in the background.
+
+    The pool's connection carries subscriptions to `WATCH_TOPICS`; every
+    event bumps a generation counter and (re)arms a debounce timer, which
+    then queries the selection. `get_selected_sfx` also records the
+    selection manifest, so by the time "Open in REAPER" is pressed both the
+    selection and REAPER's manifest are current.
+
+    `snapshot()` only returns a selection that reflects every event seen so
+    far; while a refresh is pending it waits briefly, and otherwise returns
+    None so the caller queries as before.
+    """
+    def __init__(self, pool: Optional[WaapiConnectionPool] = None, debounce: float = DEFAULT_DEBOUNCE,
+                 manifest: Optional[SelectionManifest] = None, txt_path: Optional[Path] = None):
+        self.pool = pool
+        self.debounce = debounce
+        # Where refreshed selections are recorded (default: the shared manifest)
+        self.manifest = manifest
+        self.txt_path = txt_path
+        self._cond = threading.Condition()
+        self._listener_ids: List[int] = []
+        self._timer: Optional[threading.Timer] = None
+        self._running = False
+        self._event_gen = 0         # bumped by every event
+        self._fresh_gen = -1        # generation the cached selection reflects
+        self._selection: Optional[List[SelectedObj]] = None
+        self.refreshes = 0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def _pool(self) -> WaapiConnectionPool:
+        return self.pool or get_waapi_pool()
+
+    def start(self) -> None:
+        """Subscribe and prefetch; connecting happens on a background thread."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            pool = self._pool()
+            self._listener_ids = [pool.add_listener(topic, self._on_event) for topic in WATCH_TOPICS]
+        self._schedule(0.0, self._connect)
+        log_event(log, "selection watch started", topics=len(WATCH_TOPICS))
+
+    def stop(self) -> None:
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            ids, self._listener_ids = self._listener_ids, []
+            self._fresh_gen = -1
+            self._cond.notify_all()
+        pool = self._pool()
+        for lid in ids:
+            pool.remove_listener(lid)
+
+    def _schedule(self, delay: float, func) -> None:
+        with self._cond:
+            if not self._running:
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(delay, func)
+            self._timer.name = "SelectionWatch"
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _connect(self) -> None:
+        # Acquiring subscribes the listeners, which in turn queues a refresh
+        try:
+            with ensure_waapi_client(self._pool()):
+                pass
+        except Exception as e:
+            log.debug("Selection watch not connected (%s); retrying in %gs", e, RECONNECT_INTERVAL)
+            self._schedule(RECONNECT_INTERVAL, self._connect)
+
+    def _on_event(self, *args, **kwargs) -> None:
+        """WAAPI event callback (waapi-client's thread): only mark stale and debounce."""
+        with self._cond:
+            self._event_gen += 1
+        self._schedule(self.debounce, self._refresh)
+
+    def _refresh(self) -> None:
+        with self._cond:
+            gen = self._event_gen
+        with span("selection.prefetch") as fields:
+            selection = get_selected_sfx(self._pool(), self.manifest, self.txt_path)
+            fields["items"] = len(selection) if selection is not None else None
+        if selection is None:
+            self._schedule(RECONNECT_INTERVAL, self._connect)
+            return
+        with self._cond:
+            # Events that arrived during the query have their own refresh queued
+            if gen == self._event_gen and self._running:
+                self._selection = selection
+                self._fresh_gen = gen
+                self.refreshes += 1
+                self._cond.notify_all()
+
+    def snapshot(self, wait: float = 1.0) -> Optional[List[SelectedObj]]:
+        """
+        The current selection if the cache is up to date (waiting up to `wait`
+        seconds for a pending refresh), else None.
+        """
+        if not self._pool().watching():
+            # Events may be missed until a client subscribes again
+            with self._cond:
+                self._fresh_gen = -1
+            return None
+        deadline = time.monotonic() + wait
+        with self._cond:
+            while self._running:
+                if self._fresh_gen == self._event_gen:
+                    return list(self._selection or [])
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+        return None
+
+
+_watchers: Dict[Tuple[int, Path], SelectionWatcher] = {}
+_watchers_lock = threading.Lock()
+
+def get_selection_watcher(pool: Optional[WaapiConnectionPool] = None,
+                          manifest: Optional[SelectionManifest] = None,
+                          txt_path: Optional[Path] = None) -> SelectionWatcher:
+    """
+    Process-wide watcher on `pool` (default: the shared pool) recording to
+    `manifest` / `txt_path`; one per pool and manifest, not started until
+    `start()`.
+    """
+    pool = pool or get_waapi_pool()
+    key = (id(pool), Path(txt_path or last_selected_txt_path))
+    with _watchers_lock:
+        watcher = _watchers.get(key)
+        if watcher is None:
+            watcher = _watchers[key] = SelectionWatcher(pool, manifest=manifest, txt_path=txt_path)
+        return watcher
+
+def all_selection_watchers() -> List[SelectionWatcher]:
+    with _watchers_lock:
+        return list(_watchers.values())
@@ -2,10 +2,19 @@
 from __future__ import annotations
 import json
 from pathlib import Path
-from dataclasses import asdict
-from core.models import Settings, SelectedObj
-from typing import List
-DEFAULT_REAPER_PATH = r"C:\Program Files\REAPER (x64)\reaper.exe"
+from dataclasses import asdict, replace
+from core.models import ConnectionProfile, Settings
+from core.render_format import RenderFormatError, validate_render_format
+from typing import Optional
+from utils.app_paths import profile_slug
+from utils.instrumentation import get_logger
+
+log = get_logger("settings")
+
+
+class ProfileError(ValueError):
+    pass
+
 
 def load_settings(path: str) -> Settings:
     path = Path(path)
@@ -16,49 +25,55 @@ def load_settings(path: str) -> Settings:
     with open(path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
-    return Settings(**data)
+    data["profiles"] = [ConnectionProfile(**p) for p in data.get("profiles", [])]
+    settings = Settings(**data)
+    _warn_invalid_render_formats(settings, path)
+    return settings
 
-def save_settings(path: str, settings: Settings):
-    path = Path(path)
-
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(asdict(settings), f, indent=4, ensure_ascii=False)
+def _warn_invalid_render_formats(settings: Settings, path: Path) -> None:
+    # Settings still load: the format is rejected when it is edited or used
+    formats = [("render format", settings.reaper_render_format)]
+    formats += [(f"profile '{p.name}' render format", p.reaper_render_format)
+                for p in settings.profiles if p.reaper_render_format]
+    for what, value in formats:
+        try:
+            validate_render_format(value)
+        except RenderFormatError as e:
+            log.warning("%s: %s is invalid: %s", path.name, what, e)
 
-def write_selected(jsonlpath: Path, objs: List[SelectedObj]) -> None:
-    jsonlpath.parent.mkdir(parents=True, exist_ok=True)
-    with jsonlpath.open("w", encoding="utf-8") as f:
-        for o in objs:
-            f.write(json.dumps(o.__dict__, ensure_ascii=False) + "\n")
+def validate_profiles(settings: Settings) -> None:
+    """Profile names must be unique (also as folder names)."""
+    slugs = {}
+    for p in settings.profiles:
+        slug = profile_slug(p.name)
+        if not slug:
+            raise ProfileError("profile name must not be empty")
+        if slug in slugs:
+            raise ProfileError(f"profiles '{slugs[slug]}' and '{p.name}' would share a data folder")
+        slugs[slug] = p.name
+    if settings.active_profile and settings.get_profile(settings.active_profile) is None:
+        raise ProfileError(f"active profile '{settings.active_profile}' is not defined")
 
-def write_selection_manifest(out: List["SelectedObj"], txt_path: Path, jsonl_path: Path) -> None:
+def apply_profile(settings: Settings, name: Optional[str] = None) -> Settings:
     """
-    Writes both files in SAME order.
-    Only call this if out is non-empty.
+    The settings with profile `name` (default: the active one) filled in
+    over the top-level values. "" means no profile. Raises ProfileError for
+    an unknown name.
     """
-    txt_path.parent.mkdir(parents=True, exist_ok=True)
-    jsonl_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with txt_path.open("w", encoding="utf-8") as ft, jsonl_path.open("w", encoding="utf-8") as fj:
-        for o in out:
-            # txt: wwise_path|sourcepath(optional)
-            ft.write(f"{o.path}|{o.source_path or ''}\n")
-
-            # jsonl: full record
-            fj.write(json.dumps(o.__dict__, ensure_ascii=False) + "\n")
+    name = settings.active_profile if name is None else name
+    if not name:
+        return replace(settings, active_profile="")
+    profile = settings.get_profile(name)
+    if profile is None:
+        raise ProfileError(f"no connection profile named '{name}'")
+    overrides = {k: v for k, v in asdict(profile).items() if k != "name" and v}
+    return replace(settings, active_profile=name, **overrides)
 
+def save_settings(path: str, settings: Settings):
+    """Raises ProfileError if the profiles are inconsistent."""
+    validate_profiles(settings)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
 
-def read_selected(path: Path) -> List[SelectedObj]:
-    if not path.exists():
-        return []
-    out: List[SelectedObj] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            d = json.loads(line)
-            out.append(SelectedObj(**d))
-        except Exception:
-            # Ignore malformed lines
-            pass
-    return out
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(asdict(settings), f, indent=4, ensure_ascii=False)
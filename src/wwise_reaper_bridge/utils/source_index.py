@@ -0,0 +1,241 @@
+# utils/source_index.py
+from __future__ import annotations
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.models import SelectedObj
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sounds (
+    id     TEXT PRIMARY KEY,
+    path   TEXT NOT NULL,
+    source TEXT
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sounds_by_source ON sounds (source);
+CREATE TABLE IF NOT EXISTS files (
+    path          TEXT PRIMARY KEY,
+    size          INTEGER,
+    mtime_ns      INTEGER,
+    missing_since REAL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS dirs (
+    path     TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS audits (
+    started REAL NOT NULL,
+    sounds  INTEGER NOT NULL,
+    files   INTEGER NOT NULL,
+    missing INTEGER NOT NULL,
+    changed INTEGER NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class FileState:
+    """An original file as last seen on disk; size/mtime are None while it is missing."""
+    size: Optional[int]
+    mtime_ns: Optional[int]
+    missing_since: Optional[float] = None
+
+    @property
+    def missing(self) -> bool:
+        return self.size is None
+
+
+class SourceIndex:
+    """
+    Every Sound's original file as of the last audit, in a single SQLite
+    file: Sound GUID -> object path and source path, source path -> size,
+    mtime and since when it is missing. Updates only write rows that
+    changed, so a re-audit of an unchanged project writes next to nothing.
+    """
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def save_sounds(self, sounds: Iterable[SelectedObj]) -> int:
+        """Make the Sound table equal to `sounds`. Returns the number of rows written or removed."""
+        with self._lock, self._conn:
+            existing = {r[0]: (r[1], r[2]) for r in self._conn.execute("SELECT id, path, source FROM sounds")}
+            upserts, keep = [], set()
+            for o in sounds:
+                keep.add(o.id)
+                if existing.get(o.id) != (o.path, o.source_path):
+                    upserts.append((o.id, o.path, o.source_path))
+            removed = [(guid,) for guid in existing if guid not in keep]
+            if removed:
+                self._conn.executemany("DELETE FROM sounds WHERE id = ?", removed)
+            if upserts:
+                self._conn.executemany(
+                    "INSERT INTO sounds (id, path, source) VALUES (?, ?, ?) "
+                    "ON CONFLICT (id) DO UPDATE SET path = excluded.path, source = excluded.source",
+                    upserts)
+            return len(upserts) + len(removed)
+
+    def files(self) -> Dict[str, FileState]:
+        with self._lock:
+            return {r[0]: FileState(r[1], r[2], r[3])
+                    for r in self._conn.execute("SELECT path, size, mtime_ns, missing_since FROM files")}
+
+    def save_files(self, states: Dict[str, FileState], existing: Optional[Dict[str, FileState]] = None) -> int:
+        """
+        Make the file table equal to `states`. `existing` is the current
+        table if the caller already read it. Returns the number of rows
+        written or removed.
+        """
+        if existing is None:
+            existing = self.files()
+        with self._lock, self._conn:
+            upserts = [(p, s.size, s.mtime_ns, s.missing_since)
+                       for p, s in states.items() if existing.get(p) != s]
+            removed = [(p,) for p in existing if p not in states]
+            if removed:
+                self._conn.executemany("DELETE FROM files WHERE path = ?", removed)
+            if upserts:
+                self._conn.executemany(
+                    "INSERT INTO files (path, size, mtime_ns, missing_since) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (path) DO UPDATE SET size = excluded.size, "
+                    "mtime_ns = excluded.mtime_ns, missing_since = excluded.missing_since",
+                    upserts)
+            return len(upserts) + len(removed)
+
+    def dirs(self) -> Dict[str, int]:
+        """Folder -> mtime_ns when its files were last listed."""
+        with self._lock:
+            return {r[0]: r[1] for r in self._conn.execute("SELECT path, mtime_ns FROM dirs")}
+
+    def save_dirs(self, dirs: Dict[str, int]) -> int:
+        """Make the folder table equal to `dirs`. Returns the number of rows written or removed."""
+        existing = self.dirs()
+        with self._lock, self._conn:
+            upserts = [(p, m) for p, m in dirs.items() if existing.get(p) != m]
+            removed = [(p,) for p in existing if p not in dirs]
+            if removed:
+                self._conn.executemany("DELETE FROM dirs WHERE path = ?", removed)
+            if upserts:
+                self._conn.executemany(
+                    "INSERT INTO dirs (path, mtime_ns) VALUES (?, ?) "
+                    "ON CONFLICT (path) DO UPDATE SET mtime_ns = excluded.mtime_ns",
+                    upserts)
+            return len(upserts) + len(removed)
+
+    def record_audit(self, started: float, sounds: int, files: int, missing: int, changed: int) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("INSERT INTO audits (started, sounds, files, missing, changed) VALUES (?, ?, ?, ?, ?)",
+                               (started, sounds, files, missing, changed))
+
+    def last_audit(self) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(started) FROM audits").fetchone()
+        return row[0] if row else None
+
+
+def _scan_dir(directory: str, wanted: Dict[str, List[str]],
+              unchanged_since: Optional[int] = None) -> Tuple[Optional[int], Optional[Dict]]:
+    """
+    (folder mtime_ns, {path: (size, mtime_ns) or None}) for the wanted files
+    of one folder. The listing is None if the folder's mtime is still
+    `unchanged_since`; the mtime is None if the folder is gone.
+    """
+    try:
+        # Before listing: a change during the listing then shows up next time
+        dir_mtime = os.stat(directory or ".").st_mtime_ns
+    except OSError:
+        dir_mtime = None
+    if dir_mtime is not None and dir_mtime == unchanged_since:
+        return dir_mtime, None
+    found: Dict[str, Tuple[int, int]] = {}
+    try:
+        with os.scandir(directory or ".") as it:
+            for e in it:
+                key = os.path.normcase(e.name)
+                if key not in wanted:
+                    continue
+                try:
+                    if e.is_file():
+                        st = e.stat()
+                        found[key] = (st.st_size, st.st_mtime_ns)
+                except OSError:
+                    pass
+    except OSError:
+        pass  # folder gone or unreadable: all its files count as missing
+    return dir_mtime, {p: found.get(key) for key, paths in wanted.items() for p in paths}
+
+
+def stat_sources(paths: Iterable[str], workers: int = 16,
+                 progress: Optional[Callable[[int, int], None]] = None,
+                 dir_mtimes: Optional[Dict[str, int]] = None) -> Dict[str, Optional[Tuple[int, int]]]:
+    """
+    (size, mtime_ns) of every path, None if missing. Files are grouped by
+    folder and each folder is listed once on a thread pool: on Windows and
+    network shares a listing returns the sizes and times of all its files
+    in one round trip, instead of one per file.
+
+    `dir_mtimes` (folder -> mtime_ns of an earlier listing) makes the scan
+    incremental: folders whose mtime hasn't moved since are not listed and
+    their paths are left out of the result. It is updated in place with
+    the folders' current mtimes.
+    """
+    by_dir: Dict[str, Dict[str, List[str]]] = {}
+    for p in paths:
+        directory, name = os.path.split(p)
+        by_dir.setdefault(directory, {}).setdefault(os.path.normcase(name), []).append(p)
+    out: Dict[str, Optional[Tuple[int, int]]] = {}
+    if not by_dir:
+        return out
+    known = dir_mtimes if dir_mtimes is not None else {}
+
+    def scan(item):
+        directory, wanted = item
+        return directory, _scan_dir(directory, wanted, known.get(directory))
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(by_dir))),
+                            thread_name_prefix="SourceStat") as ex:
+        for done, (directory, (dir_mtime, result)) in enumerate(ex.map(scan, by_dir.items()), 1):
+            if result is not None:
+                out.update(result)
+            if dir_mtimes is not None:
+                if dir_mtime is None:
+                    dir_mtimes.pop(directory, None)
+                else:
+                    dir_mtimes[directory] = dir_mtime
+            if progress is not None:
+                progress(done, len(by_dir))
+    return out
+
+
+def find_files(roots: Iterable[Path], names: Iterable[str], workers: int = 4) -> Dict[str, List[Path]]:
+    """Files under `roots` with one of the given names (compared as the OS does), by normalized name."""
+    wanted = {os.path.normcase(n) for n in names}
+    found: Dict[str, List[Path]] = {}
+    lock = threading.Lock()
+
+    def walk(root: Path) -> None:
+        for dirpath, _, filenames in os.walk(root):
+            for fn in filenames:
+                key = os.path.normcase(fn)
+                if key in wanted:
+                    with lock:
+                        found.setdefault(key, []).append(Path(dirpath) / fn)
+
+    roots = [Path(r) for r in roots]
+    if wanted and roots:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(roots))), thread_name_prefix="SourceSearch") as ex:
+            list(ex.map(walk, roots))
+    return found
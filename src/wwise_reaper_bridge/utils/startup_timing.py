@@ -0,0 +1,108 @@
+# utils/startup_timing.py
+# Start-up timing: named phases since launch and, on request, a per-module
+# import breakdown like `python -X importtime` (which the frozen exe can't be
+# started with). Imported first by main.py, so stdlib basics only.
+from __future__ import annotations
+import builtins
+import os
+import sys
+import threading
+import time
+
+# WRB_STARTUP_REPORT=1 (or --startup-report) records every import and writes the report
+STARTUP_ENV = "WRB_STARTUP_REPORT"
+STARTUP_FLAG = "--startup-report"
+
+_t0 = time.perf_counter()
+_phases: list[tuple[str, float]] = []
+# module -> [self seconds, cumulative seconds, nesting depth]
+_imports: dict[str, list[float]] = {}
+_local = threading.local()
+_original_import = None
+
+
+def requested(argv: list[str] | None = None) -> bool:
+    return (os.environ.get(STARTUP_ENV, "") not in ("", "0")
+            or STARTUP_FLAG in (sys.argv if argv is None else argv))
+
+
+def elapsed() -> float:
+    return time.perf_counter() - _t0
+
+
+def mark(phase: str) -> float:
+    """Record that `phase` finished now; returns seconds since start."""
+    t = elapsed()
+    _phases.append((phase, t))
+    return t
+
+
+def phases() -> dict[str, float]:
+    return {name: round(t, 4) for name, t in _phases}
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    if level == 0 and name in sys.modules and not fromlist:
+        return _original_import(name, globals, locals, fromlist, level)
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    before = len(sys.modules)
+    stack.append(0.0)
+    t0 = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        total = time.perf_counter() - t0
+        children = stack.pop()
+        if stack:
+            stack[-1] += total
+        if len(sys.modules) > before:  # something was actually loaded
+            if level:
+                package = (globals or {}).get("__package__") or ""
+                name = f"{package.rsplit('.', level - 1)[0]}.{name}".rstrip(".")
+            entry = _imports.setdefault(name, [0.0, 0.0, len(stack)])
+            entry[0] += total - children
+            entry[1] += total
+
+
+def install() -> None:
+    """Start recording imports (idempotent)."""
+    global _original_import
+    if _original_import is None:
+        _original_import = builtins.__import__
+        builtins.__import__ = _timed_import
+
+
+def uninstall() -> None:
+    global _original_import
+    if _original_import is not None:
+        builtins.__import__ = _original_import
+        _original_import = None
+
+
+def report(top: int = 25) -> str:
+    """Phases, then the slowest imports by cumulative time (self time alongside)."""
+    lines = [f"startup: {elapsed():.3f}s since launch"]
+    for name, t in _phases:
+        lines.append(f"  {t:8.3f}s  {name}")
+    if _imports:
+        total_self = sum(e[0] for e in _imports.values())
+        lines.append(f"imports: {len(_imports)} modules, {total_self:.3f}s "
+                     f"(slowest {min(top, len(_imports))} by cumulative time)")
+        lines.append(f"  {'self ms':>8} | {'cumul ms':>8} | module")
+        ranked = sorted(_imports.items(), key=lambda kv: kv[1][1], reverse=True)[:top]
+        for name, (self_s, cum_s, depth) in ranked:
+            lines.append(f"  {self_s * 1000:8.1f} | {cum_s * 1000:8.1f} | {'  ' * int(depth)}{name}")
+    return "\n".join(lines)
+
+
+def write_report(path: str | os.PathLike, top: int = 25) -> str | None:
+    from pathlib import Path
+    path = Path(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(report(top) + "\n", encoding="utf-8")
+        return str(path)
+    except OSError:
+        return None
@@ -0,0 +1,171 @@
+# utils/sync_journal.py
+from __future__ import annotations
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Literal, Optional
+
+from core.models import ImportOutcome, SelectedObj
+from core.render_names import render_key
+from utils.instrumentation import get_logger
+
+log = get_logger("sync_journal")
+
+# Per-object progress of a render-sync, in order
+ObjState = Literal["queued", "rendered", "validated", "imported", "skipped", "failed"]
+DONE_STATES = ("imported", "skipped")
+RENDERED_STATES = ("rendered", "validated")
+
+
+@dataclass
+class JournalRun:
+    """State of one sync as read back from the journal."""
+    run_id: str
+    started: float
+    objects: Dict[str, str]                      # object id -> render key
+    render_dir: Optional[str] = None
+    states: Dict[str, dict] = field(default_factory=dict)
+
+    def state(self, obj_id: str) -> ObjState:
+        return self.states.get(obj_id, {}).get("state", "queued")
+
+    def matches(self, objs: List[SelectedObj]) -> bool:
+        return self.objects == {o.id: render_key(o) for o in objs}
+
+    def done_ids(self) -> set[str]:
+        return {i for i in self.objects if self.state(i) in DONE_STATES}
+
+    def reusable_render(self, obj_id: str, wav: Path) -> bool:
+        """Rendered in this run and the file is still the one that was rendered."""
+        entry = self.states.get(obj_id, {})
+        if entry.get("state") not in RENDERED_STATES:
+            return False
+        try:
+            st = wav.stat()
+        except OSError:
+            return False
+        return [st.st_size, st.st_mtime_ns] == entry.get("file")
+
+    def counts(self) -> Dict[str, int]:
+        out: Dict[str, int] = {}
+        for i in self.objects:
+            s = self.state(i)
+            out[s] = out.get(s, 0) + 1
+        return out
+
+
+class SyncJournal:
+    """
+    Append-only JSONL journal of the running render-sync.
+
+    The first line describes the run (object ids and render keys); every
+    further line records an object's new state. Lines are flushed as they
+    are written and fsynced after imports, so a crash of REAPER, Wwise or
+    the bridge loses at most the state changes in flight. A completed run
+    deletes the journal; one left behind is an interrupted sync that
+    `load()` reads back for resuming.
+    """
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._f = None
+        self._keys: Dict[str, List[str]] = {}
+        self.run_id: Optional[str] = None
+
+    def load(self) -> Optional[JournalRun]:
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return None
+        run: Optional[JournalRun] = None
+        for lineno, line in enumerate(lines, 1):
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                # A torn last line is expected after a crash
+                if lineno != len(lines):
+                    log.warning("%s:%d ignored (not JSON)", self.path.name, lineno)
+                continue
+            if "run" in rec:
+                run = JournalRun(rec["run"], rec.get("started", 0.0), dict(rec.get("objects", {})),
+                                 rec.get("render_dir"))
+            elif run is not None and rec.get("id") in run.objects:
+                run.states[rec["id"]] = rec
+        return run
+
+    def _open(self, run_id: str, objs: List[SelectedObj]) -> None:
+        self.run_id = run_id
+        self._keys = {}
+        for o in objs:
+            self._keys.setdefault(render_key(o), []).append(o.id)
+        self._f = open(self.path, "a", encoding="utf-8")
+
+    def begin(self, objs: List[SelectedObj], render_dir: Optional[Path] = None) -> str:
+        """Start a new run rendering to `render_dir`, replacing any previous journal."""
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        header = {"run": uuid.uuid4().hex, "started": time.time(),
+                  "render_dir": str(render_dir) if render_dir else None,
+                  "objects": {o.id: render_key(o) for o in objs}}
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps(header, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self._open(header["run"], objs)
+        return header["run"]
+
+    def resume(self, run: JournalRun, objs: List[SelectedObj]) -> str:
+        """Keep appending to an interrupted run."""
+        self.close()
+        self._open(run.run_id, objs)
+        return run.run_id
+
+    def _write(self, records: Iterable[dict], sync: bool = False) -> None:
+        with self._lock:
+            if self._f is None:
+                return
+            data = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+            if not data:
+                return
+            try:
+                self._f.write(data)
+                self._f.flush()
+                if sync:
+                    os.fsync(self._f.fileno())
+            except OSError as e:
+                log.warning("Could not write %s: %s", self.path.name, e)
+
+    def mark(self, obj_ids: Iterable[str], state: ObjState, **fields) -> None:
+        self._write({"id": i, "state": state, **fields} for i in obj_ids)
+
+    def mark_rendered(self, key: str, wav: Path, state: ObjState = "rendered") -> None:
+        """Objects rendered to `wav` (by render key); the file identity lets a resume reuse it."""
+        try:
+            st = wav.stat()
+        except OSError:
+            return
+        self.mark(self._keys.get(key, []), state, file=[st.st_size, st.st_mtime_ns])
+
+    def record_outcomes(self, outcomes: Iterable[ImportOutcome]) -> None:
+        self._write(({"id": o.object_id, "state": o.status, "reason": o.reason}
+                     for o in outcomes if o.object_id), sync=True)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._f is not None:
+                self._f.close()
+                self._f = None
+
+    def complete(self) -> None:
+        """The run finished: nothing to resume."""
+        self.close()
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError as e:
+            log.warning("Could not remove %s: %s", self.path.name, e)
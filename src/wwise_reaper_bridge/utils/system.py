@@ -2,35 +2,52 @@
 from __future__ import annotations
 import os
 import subprocess
+import sys
 from pathlib import Path
+from typing import Optional
+
+from utils.process_probe import find_reaper, get_process_probe
+from utils.instrumentation import get_logger
+
+log = get_logger("system")
 
 def file_exists(p: str) -> bool:
     return Path(p).exists()
 
 def open_in_editor(path: Path) -> None:
-    os.startfile(str(path))  # noqa: S606
+    if sys.platform == "win32":
+        os.startfile(str(path))  # noqa: S606
+    else:
+        subprocess.Popen(["open" if sys.platform == "darwin" else "xdg-open", str(path)])
 
 def launch_reaper_new_tab(reaper_exe: str, script_on_start = "") -> None:
     cmd_args = [reaper_exe, "-new"]
     if script_on_start:
         cmd_args.append(script_on_start)
     subprocess.Popen(cmd_args)
+    get_process_probe().invalidate()
 
 def launch_reaper_and_run_lua(reaper_exe_path: str, lua_path: str = "") -> None:
-    print(reaper_exe_path, lua_path)
+    log.debug("launching %s %s", reaper_exe_path, lua_path)
     cmd_args = [reaper_exe_path]
     if lua_path:
         cmd_args.append(lua_path)
     subprocess.Popen(cmd_args)
+    get_process_probe().invalidate()
+
+def is_reaper_running(reaper_path: Optional[str] = None) -> bool:
+    """
+    Checks if REAPER is in the running process list (cached for a couple of seconds).
+    With `reaper_path`, only a REAPER started from that executable counts.
+    """
+    return find_reaper(reaper_path) is not None
 
-def is_reaper_running() -> bool:
+def is_reaper_responsive(reaper_path: Optional[str] = None) -> bool:
     """
-    Checks if reaper.exe is in the running process list (Windows).
+    REAPER (from `reaper_path`, if given) is running and not hung. Unknown
+    responsiveness counts as responsive.
     """
-    try:
-        # tasklist returns a list of processes. We check if reaper.exe is inside.
-        output = subprocess.check_output("tasklist", shell=True).decode()
-        return "reaper.exe" in output.lower()
-    except Exception:
-        # Fallback: assume not running or permission error
-        return False
\ No newline at end of file
+    proc = find_reaper(reaper_path)
+    if proc is None:
+        return False
+    return get_process_probe().is_responsive(proc.pid) is not False
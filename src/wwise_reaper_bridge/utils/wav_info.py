@@ -0,0 +1,158 @@
+# utils/wav_info.py
+from __future__ import annotations
+import mmap
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from core.render_format import RenderFormatError, decode_render_format
+
+# wrb_export_tracks.lua forces RENDER_SRATE to this
+RENDER_SAMPLE_RATE = 48000
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+class WavFormatError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class WavInfo:
+    format_tag: int
+    channels: int
+    sample_rate: int
+    bits: int
+    block_align: int
+    data_offset: int
+    data_size: int
+    file_size: int
+
+    @property
+    def frames(self) -> int:
+        return self.data_size // self.block_align if self.block_align else 0
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.sample_rate if self.sample_rate else 0.0
+
+
+@dataclass(frozen=True)
+class ExpectedFormat:
+    sample_rate: Optional[int] = RENDER_SAMPLE_RATE
+    bits: Optional[int] = None
+    channels: Optional[int] = None
+
+    def mismatch(self, info: WavInfo) -> str:
+        """Human-readable difference, or "" if `info` matches."""
+        diffs = []
+        if self.sample_rate and info.sample_rate != self.sample_rate:
+            diffs.append(f"{info.sample_rate} Hz, expected {self.sample_rate}")
+        if self.bits and info.bits != self.bits:
+            diffs.append(f"{info.bits}-bit, expected {self.bits}")
+        if self.channels and info.channels != self.channels:
+            diffs.append(f"{info.channels} ch, expected {self.channels}")
+        return "; ".join(diffs)
+
+
+def expected_from_render_format(render_format: str) -> ExpectedFormat:
+    """
+    Expected WAV parameters for a REAPER RENDER_FORMAT string. Only a WAV
+    format pins the bit depth; otherwise just the sample rate is checked.
+    """
+    try:
+        fmt = decode_render_format(render_format)
+    except RenderFormatError:
+        return ExpectedFormat()
+    return ExpectedFormat(bits=fmt.bits if fmt.container == "wav" else None)
+
+
+def parse_wav(buf, file_size: int) -> WavInfo:
+    """Parse RIFF/RF64 headers from a buffer (bytes or mmap). Sample data is not touched."""
+    if file_size < 12:
+        raise WavFormatError("truncated header")
+    riff, riff_size, wave = struct.unpack_from("<4sI4s", buf, 0)
+    if riff not in (b"RIFF", b"RF64") or wave != b"WAVE":
+        raise WavFormatError("not a RIFF/WAVE file")
+
+    fmt = None
+    ds64_data_size = None
+    pos = 12
+    while pos + 8 <= file_size:
+        cid, size = struct.unpack_from("<4sI", buf, pos)
+        body = pos + 8
+        if cid == b"ds64" and size >= 16:
+            riff_size, ds64_data_size = struct.unpack_from("<QQ", buf, body)
+        elif cid == b"fmt ":
+            if size < 16 or body + 16 > file_size:
+                raise WavFormatError("truncated fmt chunk")
+            tag, channels, rate, _, align, bits = struct.unpack_from("<HHIIHH", buf, body)
+            if tag == WAVE_FORMAT_EXTENSIBLE and size >= 40 and body + 26 <= file_size:
+                (tag,) = struct.unpack_from("<H", buf, body + 24)  # sub-format GUID prefix
+            fmt = (tag, channels, rate, bits, align)
+        elif cid == b"data":
+            if fmt is None:
+                raise WavFormatError("data chunk before fmt chunk")
+            if size == 0xFFFFFFFF and ds64_data_size is not None:
+                size = ds64_data_size
+            tag, channels, rate, bits, align = fmt
+            if riff == b"RIFF" and riff_size + 8 > file_size:
+                raise WavFormatError("incomplete (RIFF size exceeds file size)")
+            if body + size > file_size:
+                raise WavFormatError(f"incomplete ({file_size - body} of {size} data bytes)")
+            if size == 0:
+                raise WavFormatError("no audio data")
+            if align == 0 or size % align:
+                raise WavFormatError("data size is not a whole number of frames")
+            return WavInfo(tag, channels, rate, bits, align, body, size, file_size)
+        pos = body + size + (size & 1)
+    raise WavFormatError("no data chunk" if fmt else "no fmt chunk")
+
+
+def read_wav_info(path: Path) -> WavInfo:
+    """Header info of a WAV file via mmap. Raises WavFormatError / OSError."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            raise WavFormatError("empty file")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return parse_wav(mm, size)
+
+
+@dataclass(frozen=True)
+class WavCheck:
+    path: Path
+    info: Optional[WavInfo]
+    reason: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.info is not None and not self.reason
+
+
+def check_wav(path: Path, expected: Optional[ExpectedFormat] = None) -> WavCheck:
+    """Complete and (if `expected` is given) in the expected format."""
+    try:
+        info = read_wav_info(path)
+    except (OSError, WavFormatError) as e:
+        return WavCheck(Path(path), None, str(e) or type(e).__name__)
+    if info.format_tag not in (WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT):
+        return WavCheck(Path(path), info, f"unsupported format tag 0x{info.format_tag:04x}")
+    diff = expected.mismatch(info) if expected is not None else ""
+    return WavCheck(Path(path), info, diff)
+
+
+def check_wavs(paths: Iterable[Path],
+               expected: Optional[ExpectedFormat] = None,
+               max_workers: int = 8) -> Dict[Path, WavCheck]:
+    """check_wav over many files; header reads overlap on a thread pool."""
+    paths = list(paths)
+    if len(paths) <= 1 or max_workers <= 1:
+        return {p: check_wav(p, expected) for p in paths}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths)), thread_name_prefix="WavCheck") as ex:
+        return dict(zip(paths, ex.map(lambda p: check_wav(p, expected), paths)))
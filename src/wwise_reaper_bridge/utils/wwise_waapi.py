@@ -1,37 +1,534 @@
 # utils/wwise_waapi.py
 from __future__ import annotations
-import json
-from typing import List, Iterator, Optional, Any
+import asyncio
+import atexit
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Iterator, Optional, Any, Tuple
 from contextlib import contextmanager
+from dataclasses import dataclass
+from concurrent.futures import InvalidStateError, ThreadPoolExecutor
+from pathlib import Path
 
-from waapi import WaapiClient, CannotConnectToWaapiException
+from waapi import WaapiClient, CannotConnectToWaapiException, WaapiRequestFailed
 
-from core.models import SelectedObj
-from utils.app_paths import last_selected_txt_path, last_selected_jsonl_path
+from core.models import SelectedObj, ImportOutcome, ImportReport, ImportStatus
+from core.render_names import assign_render_names
+from utils.app_paths import last_selected_txt_path
+from utils.manifest_store import SelectionManifest, get_selection_manifest, record_selection
+from utils.instrumentation import get_logger, span
+
+log = get_logger("waapi")
+
+class WaapiLatencyStats:
+    """
+    Running counters for WAAPI connection setup vs. call time.
+    Updated from whichever thread uses the pool, so guarded by a lock.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.connects = 0
+            self.connect_failures = 0
+            self.connect_seconds = 0.0
+            self.calls = 0
+            self.call_seconds = 0.0
+
+    def add_connect(self, seconds: float, ok: bool = True) -> None:
+        with self._lock:
+            if ok:
+                self.connects += 1
+            else:
+                self.connect_failures += 1
+            self.connect_seconds += seconds
+
+    def add_call(self, seconds: float) -> None:
+        with self._lock:
+            self.calls += 1
+            self.call_seconds += seconds
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "connects": self.connects,
+                "connect_failures": self.connect_failures,
+                "connect_seconds": round(self.connect_seconds, 4),
+                "calls": self.calls,
+                "call_seconds": round(self.call_seconds, 4),
+            }
+
+    def summary(self) -> str:
+        d = self.as_dict()
+        return (f"WAAPI: {d['connects']} connect(s) {d['connect_seconds']:.3f}s, "
+                f"{d['calls']} call(s) {d['call_seconds']:.3f}s")
+
+
+@dataclass(frozen=True)
+class WaapiCapabilities:
+    """What the connected Wwise session supports, resolved once per session."""
+    version_year: int
+    source_key: str
+    project_guid: Optional[str] = None
+    project_name: Optional[str] = None
+
+    @property
+    def return_keys(self) -> List[str]:
+        return ["id", "name", "path", "type", self.source_key]
+
+
+def source_key_for_year(ww_year: int) -> str:
+    return "originalFilePath" if ww_year > 2021 else "sound:originalWavFilePath"
+
+def _probe_capabilities(client) -> WaapiCapabilities:
+    info = client.call("ak.wwise.core.getInfo")
+    ww_year = 0
+    if isinstance(info, dict):
+        ww_year = info.get("version", {}).get("year", 0)
+
+    project = client.call(
+        "ak.wwise.core.object.get",
+        {"from": {"ofType": ["Project"]}},
+        options={"return": ["id", "name"]},
+    )
+    projects = (project or {}).get("return", [])
+    proj = projects[0] if projects else {}
+    return WaapiCapabilities(
+        version_year=ww_year,
+        source_key=source_key_for_year(ww_year),
+        project_guid=proj.get("id"),
+        project_name=proj.get("name"),
+    )
+
+
+class _LoopGuard:
+    """
+    Works around waapi-client's connection thread
+    (`ak_autobahn._WampClientThread.run`), which stores its event loop as
+    txaio's process-wide default (`txaio.config.loop`). Until that is
+    cleared again, autobahn on the other connections' threads creates its
+    futures on the new connection's loop, where nothing resolves them, and
+    their calls hang. So connecting waits until clients borrowed on other
+    threads are returned, holds new borrows back, and clears the default
+    once the connection is up: each connection's thread then uses its own
+    loop. Clients are only borrowed through the guard in
+    `ensure_waapi_client`; the pool connects under it.
+    """
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._borrowed = 0
+        self._connecting = False
+        self._local = threading.local()
+
+    @contextmanager
+    def borrow(self) -> Iterator[None]:
+        held = getattr(self._local, "held", 0)
+        with self._cond:
+            # A thread already borrowing can't be racing a connect (it would wait for us)
+            while self._connecting and not held:
+                self._cond.wait()
+            self._borrowed += 1
+        self._local.held = held + 1
+        try:
+            yield
+        finally:
+            self._local.held = held
+            with self._cond:
+                self._borrowed -= 1
+                if not self._borrowed:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def connect(self) -> Iterator[None]:
+        # This thread's own borrows make no requests while it connects
+        held = getattr(self._local, "held", 0)
+        with self._cond:
+            self._borrowed -= held
+            while self._connecting or self._borrowed:
+                self._cond.wait()
+            self._connecting = True
+        try:
+            yield
+        finally:
+            _clear_txaio_loop()
+            with self._cond:
+                self._connecting = False
+                self._borrowed += held
+                self._cond.notify_all()
+
+
+def _clear_txaio_loop() -> None:
+    try:
+        import txaio
+        txaio.use_asyncio()  # what waapi-client uses; makes txaio.config the asyncio one
+        txaio.config.loop = None
+    except Exception as e:
+        log.debug("Could not reset txaio's event loop: %s", e)
+
+_loop_guard = _LoopGuard()
+
+def _new_waapi_client(url: Optional[str]):
+    # waapi-client adopts the calling thread's event loop if it is running,
+    # i.e. that of another client this thread talked to; start from none
+    asyncio.set_event_loop(None)
+    # Raise WaapiRequestFailed instead of returning None, so failures carry a reason
+    client = WaapiClient(url, allow_exception=True)
+    _resolve_caller_once(client)
+    return client
+
+def _resolve_caller_once(client: Any) -> None:
+    """
+    waapi-client's connection thread, as it exits, resolves the future of
+    the request in flight (`AutobahnClientDecoupler.unblock_caller`), even
+    when that request, the STOP sent by `disconnect()`, already completed
+    it; the second `set_result` raises InvalidStateError on that thread.
+    Only resolve a future that is still pending.
+    """
+    decoupler = getattr(client, "_decoupler", None)
+    if decoupler is None:
+        return
+
+    def unblock_caller():
+        future = decoupler._future
+        if future is not None and not future.done():
+            try:
+                future.set_result(None)
+            except InvalidStateError:
+                pass
+    decoupler.unblock_caller = unblock_caller
+
+
+class _PooledClient:
+    """
+    Thin wrapper around a WaapiClient that times calls and tracks usage.
+    Exposes the subset of the WaapiClient API used by the bridge.
+    """
+    def __init__(self, client: Any, stats: WaapiLatencyStats, pool: Optional["WaapiConnectionPool"] = None):
+        self._client = client
+        self._stats = stats
+        self.pool = pool
+        self.last_used = time.monotonic()
+        self.last_checked = self.last_used
+        # Pool listener id -> subscription handler on this client
+        self.listeners: Dict[int, Any] = {}
+
+    def call(self, uri: str, *args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            with span(f"waapi:{uri}", level=logging.DEBUG):
+                return self._client.call(uri, *args, **kwargs)
+        finally:
+            self._stats.add_call(time.perf_counter() - t0)
+
+    def subscribe(self, uri: str, callback=None, *args, **kwargs):
+        return self._client.subscribe(uri, callback, *args, **kwargs)
+
+    def unsubscribe(self, handler) -> bool:
+        return self._client.unsubscribe(handler)
+
+    def is_connected(self) -> bool:
+        return bool(self._client.is_connected())
+
+    def disconnect(self) -> None:
+        try:
+            self._client.disconnect()
+        except Exception:
+            pass
+
+
+class WaapiConnectionPool:
+    """
+    Long-lived, lazily connected WAAPI clients shared by all bridge operations.
+
+    - Nothing connects until the first `acquire()`.
+    - A WaapiClient serializes its requests, so each client is handed to
+      one thread at a time; up to `max_connections` clients are opened.
+    - Clients that dropped (Wwise closed/restarted) are discarded and a new
+      one is connected on the next acquire.
+    - Clients idle longer than `health_check_interval` are pinged before reuse,
+      and clients idle longer than `idle_timeout` are disconnected.
+    - Listeners (`add_listener`) are subscribed on every client; while there
+      are any, one client is kept connected past `idle_timeout` so events
+      keep arriving. Subscriptions share the pooled connections rather
+      than opening one of their own.
+    """
+    def __init__(self,
+                 url: Optional[str] = None,
+                 max_connections: int = 1,
+                 idle_timeout: float = 300.0,
+                 health_check_interval: float = 30.0):
+        self.url = url
+        self.max_connections = max(1, max_connections)
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.stats = WaapiLatencyStats()
+
+        self._cond = threading.Condition()
+        self._idle: List[_PooledClient] = []
+        self._open = 0
+        self._idle_timer: Optional[threading.Timer] = None
+
+        # Session capability cache; dropped whenever the connection set or
+        # the loaded project changes.
+        self._caps: Optional[WaapiCapabilities] = None
+        self._caps_lock = threading.Lock()
+
+        self._listeners: Dict[int, Tuple[str, Callable]] = {}
+        self._listener_ids = 0
+
+    def invalidate_capabilities(self, *args, **kwargs) -> None:
+        """Drop cached capabilities. Signature accepts WAAPI event payloads."""
+        with self._caps_lock:
+            self._caps = None
+
+    def capabilities(self, client: Any) -> WaapiCapabilities:
+        """Return cached capabilities, probing through `client` on a miss."""
+        with self._caps_lock:
+            if self._caps is not None:
+                return self._caps
+        caps = _probe_capabilities(client)
+        with self._caps_lock:
+            self._caps = caps
+        return caps
+
+    def _watch_project(self, pc: _PooledClient) -> None:
+        for topic in ("ak.wwise.core.project.loaded", "ak.wwise.core.project.preClosed"):
+            try:
+                pc.subscribe(topic, self.invalidate_capabilities)
+            except Exception:
+                pass
+
+    def add_listener(self, topic: str, callback: Callable) -> int:
+        """
+        Subscribe `callback` to `topic` on every client (on their next acquire).
+        The callback runs on waapi-client's thread. It is also called without
+        arguments whenever a newly connected client subscribes, since events
+        may have been missed while disconnected. Returns an id for
+        `remove_listener`.
+        """
+        with self._cond:
+            self._listener_ids += 1
+            self._listeners[self._listener_ids] = (topic, callback)
+            return self._listener_ids
+
+    def remove_listener(self, listener_id: int) -> None:
+        with self._cond:
+            self._listeners.pop(listener_id, None)
+            idle = list(self._idle)
+        # Clients in use drop it on their next acquire
+        for pc in idle:
+            self._sync_listeners(pc)
+
+    def _sync_listeners(self, pc: _PooledClient) -> None:
+        """Bring the client's subscriptions in line with the listener set."""
+        with self._cond:
+            wanted = dict(self._listeners)
+        for lid in [lid for lid in pc.listeners if lid not in wanted]:
+            try:
+                pc.unsubscribe(pc.listeners.pop(lid))
+            except Exception:
+                pass
+        added = []
+        for lid, (topic, callback) in wanted.items():
+            if lid in pc.listeners:
+                continue
+            try:
+                handler = pc.subscribe(topic, callback)
+            except Exception as e:
+                log.debug("Could not subscribe to %s: %s", topic, e)
+                continue
+            if handler is not None:
+                pc.listeners[lid] = handler
+                added.append(callback)
+        for callback in dict.fromkeys(added):
+            callback()
+
+    def watching(self) -> bool:
+        """True if a connected client carries every listener (events are being received)."""
+        with self._cond:
+            wanted = set(self._listeners)
+            return any(pc.is_connected() and wanted <= set(pc.listeners) for pc in self._idle) \
+                or self._open > len(self._idle)
+
+    def _connect(self) -> _PooledClient:
+        if WaapiClient is None:
+            raise ImportError("WaapiClient not available. Install/import the WAAPI client library first.")
+        with _loop_guard.connect():
+            t0 = time.perf_counter()
+            try:
+                with span("waapi.connect", url=self.url):
+                    client = _new_waapi_client(self.url)
+            except Exception:
+                self.stats.add_connect(time.perf_counter() - t0, ok=False)
+                raise
+            self.stats.add_connect(time.perf_counter() - t0)
+            self.invalidate_capabilities()
+            pc = _PooledClient(client, self.stats, self)
+            self._watch_project(pc)
+        return pc
+
+    def ensure_capacity(self, n: int) -> None:
+        """Allow at least `n` concurrent connections."""
+        with self._cond:
+            if n > self.max_connections:
+                self.max_connections = n
+                self._cond.notify_all()
+
+    def _is_healthy(self, pc: _PooledClient) -> bool:
+        if not pc.is_connected():
+            return False
+        now = time.monotonic()
+        if now - pc.last_checked < self.health_check_interval:
+            return True
+        try:
+            ok = pc.call("ak.wwise.core.getInfo") is not None
+        except Exception:
+            ok = False
+        pc.last_checked = now
+        return ok
+
+    def _take(self) -> _PooledClient | None:
+        """Pop an idle client, or reserve a slot for a new one (returns None)."""
+        with self._cond:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._open < self.max_connections:
+                    self._open += 1
+                    return None
+                self._cond.wait()
+
+    def _release_slot(self) -> None:
+        with self._cond:
+            self._open -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def acquire(self) -> Iterator[_PooledClient]:
+        """
+        Yield a connected client for exclusive use by the calling thread.
+        Raises CannotConnectToWaapiException if Wwise is not reachable.
+        """
+        pc = self._take()
+        while pc is not None and not self._is_healthy(pc):
+            pc.disconnect()
+            self.invalidate_capabilities()
+            self._release_slot()
+            pc = self._take()
+        if pc is None:
+            try:
+                pc = self._connect()
+            except Exception:
+                self._release_slot()
+                raise
+
+        if pc.listeners.keys() != self._listeners.keys():
+            self._sync_listeners(pc)
+        try:
+            yield pc
+        finally:
+            pc.last_used = time.monotonic()
+            if pc.is_connected():
+                with self._cond:
+                    self._idle.append(pc)
+                    self._cond.notify()
+                self._schedule_idle_check()
+            else:
+                pc.disconnect()
+                self.invalidate_capabilities()
+                self._release_slot()
+
+    def _schedule_idle_check(self) -> None:
+        if self.idle_timeout <= 0:
+            return
+        with self._cond:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+            self._idle_timer = threading.Timer(self.idle_timeout, self.close_idle)
+            self._idle_timer.daemon = True
+            self._idle_timer.start()
+
+    def close_idle(self, max_idle: Optional[float] = None) -> int:
+        """Disconnect clients unused for longer than `max_idle` (default: idle_timeout)."""
+        limit = self.idle_timeout if max_idle is None else max_idle
+        now = time.monotonic()
+        with self._cond:
+            stale = [pc for pc in self._idle if now - pc.last_used >= limit]
+            if stale and max_idle is None and self._listeners and len(stale) == len(self._idle):
+                # Keep one connection for the listeners
+                stale.remove(max(stale, key=lambda pc: pc.last_used))
+            self._idle = [pc for pc in self._idle if pc not in stale]
+            self._open -= len(stale)
+            self._cond.notify_all()
+        for pc in stale:
+            pc.disconnect()
+        return len(stale)
+
+    def close(self) -> None:
+        """Disconnect all idle clients. Clients in use are closed when released."""
+        with self._cond:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+        self.close_idle(max_idle=0)
+
+
+_pools: Dict[Optional[str], WaapiConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+def get_waapi_pool(url: Optional[str] = None) -> WaapiConnectionPool:
+    """Return the process-wide pool for `url` (None: Wwise's default), creating it on first use."""
+    url = url or None
+    with _pools_lock:
+        pool = _pools.get(url)
+        if pool is None:
+            pool = _pools[url] = WaapiConnectionPool(url)
+            # Fallback only: waapi-client's connection threads are not daemons and
+            # atexit runs after they are joined, so entry points call
+            # close_waapi_pools() before returning
+            atexit.register(pool.close)
+        return pool
+
+def close_waapi_pools() -> None:
+    """Disconnect every pool's clients; call before the process exits."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close()
 
 @contextmanager
 def ensure_waapi_client(client: Optional[Any] = None) -> Iterator[Any]:
     """
     Yield a WAAPI client.
-    - If `client` is provided, yield it.
-    - Otherwise create a temporary WaapiClient and close it on exit.
+    - If `client` is a connection pool, borrow a client from it.
+    - If another `client` is provided, yield it.
+    - Otherwise borrow a client from the shared connection pool.
     """
-    if client is not None:
+    if client is not None and not isinstance(client, WaapiConnectionPool):
         yield client
         return
 
-    if WaapiClient is None:
-        raise ImportError("WaapiClient not available. Install/import the WAAPI client library first.")
-
-    with WaapiClient() as c:
+    with _loop_guard.borrow(), (client or get_waapi_pool()).acquire() as c:
         yield c
 
-def get_selected(filter_types = [], ww_client = None) -> List[dict] | None:
+def _pool_of(client: Any) -> WaapiConnectionPool:
+    """The pool a client came from (capabilities are cached per pool)."""
+    return getattr(client, "pool", None) or get_waapi_pool()
+
+def get_capabilities(ww_client = None) -> WaapiCapabilities:
+    """Session capabilities (Wwise version, source key, project), cached on the client's pool."""
+    with ensure_waapi_client(ww_client) as client:
+        return _pool_of(client).capabilities(client)
+
+def get_selected(filter_types = [], ww_client = None, return_keys: Optional[List[str]] = None) -> List[dict] | None:
     try:
         with ensure_waapi_client(ww_client) as client:
             selected = client.call(
                 "ak.wwise.ui.getSelectedObjects",
-                options={"return": ["id", "name", "path", "type"]},
+                options={"return": return_keys or ["id", "name", "path", "type"]},
             )
             objs = selected.get("objects", [])
             if filter_types:
@@ -40,69 +537,254 @@ def get_selected(filter_types = [], ww_client = None) -> List[dict] | None:
     except CannotConnectToWaapiException:
         return None
 
-def get_selected_sfx(ww_client = None) -> List[SelectedObj] | None:
+def _source_from(item: dict) -> Optional[str]:
+    return item.get("sound:originalWavFilePath") or item.get("originalFilePath")
+
+def _to_selected(items: List[dict]) -> List[SelectedObj]:
+    return [
+        SelectedObj(
+            id=o["id"],
+            name=o["name"],
+            path=o["path"],
+            type=o["type"],
+            source_path=_source_from(o))
+        for o in items
+    ]
+
+def _expand_to_sounds(client, items: List[dict], keys: List[str], batch_size: int = 500) -> List[dict]:
+    """
+    The Sounds among `items`, plus all descendant Sounds of every other item
+    (containers, Actor-Mixers, Work Units, folders). The non-Sound items are
+    expanded together by one WAQL query per `batch_size` GUIDs. Duplicates
+    (a Sound selected along with its parent) are dropped.
+    """
+    containers = [o["id"] for o in items if o.get("type") != "Sound" and o.get("id")]
+    found: List[dict] = []
+    for i in range(0, len(containers), batch_size):
+        ids = ", ".join(f'"{guid}"' for guid in containers[i:i + batch_size])
+        with span("waapi.expand", containers=len(containers[i:i + batch_size])):
+            result = client.call(
+                "ak.wwise.core.object.get",
+                {"waql": f'$ {ids} select descendants where type = "Sound"'},
+                options={"return": keys},
+            )
+        found.extend(result.get("return", []))
+
+    out: List[dict] = []
+    seen = set()
+    for o in [o for o in items if o.get("type") == "Sound"] + found:
+        if o.get("type") == "Sound" and o["id"] not in seen:
+            seen.add(o["id"])
+            out.append(o)
+    return out
+
+def get_sfx_by_paths(paths: List[str], ww_client = None, batch_size: int = 500) -> List[SelectedObj]:
+    """Sounds at (or, for containers, below) the given Wwise paths, `batch_size` paths per query."""
+    items: List[dict] = []
+    with ensure_waapi_client(ww_client) as client:
+        keys = _pool_of(client).capabilities(client).return_keys
+        for i in range(0, len(paths), batch_size):
+            result = client.call(
+                "ak.wwise.core.object.get",
+                {"from": {"path": paths[i:i + batch_size]}},
+                options={"return": keys},
+            )
+            items.extend(result.get("return", []))
+        items = _expand_to_sounds(client, items, keys, batch_size)
+    return assign_render_names(_to_selected(items))
+
+def get_sfx_by_query(waql: str, ww_client = None) -> List[SelectedObj]:
+    """Sounds matched by a WAQL query, e.g. '$ "\\Actor-Mixer Hierarchy\\Foo" select descendants'.
+    Matched containers contribute their descendant Sounds."""
+    with ensure_waapi_client(ww_client) as client:
+        keys = _pool_of(client).capabilities(client).return_keys
+        result = client.call("ak.wwise.core.object.get", {"waql": waql}, options={"return": keys})
+        items = _expand_to_sounds(client, result.get("return", []), keys)
+    return assign_render_names(_to_selected(items))
+
+def iter_sounds(ww_client = None, page_size: int = 2000) -> Iterator[List[SelectedObj]]:
+    """
+    Every Sound in the project with its original source path, one page of
+    up to `page_size` per `ak.wwise.core.object.get` call (WAQL skip/take;
+    Wwise 2021 and older return everything in one call). A Sound moved
+    between pages while paging may be reported twice or not at all.
+    """
+    page_size = max(1, page_size)
+    with ensure_waapi_client(ww_client) as client:
+        caps = _pool_of(client).capabilities(client)
+        if caps.version_year and caps.version_year < 2022:
+            result = client.call("ak.wwise.core.object.get", {"from": {"ofType": ["Sound"]}},
+                                 options={"return": caps.return_keys})
+            yield _to_selected(result.get("return", []))
+            return
+        skip = 0
+        while True:
+            with span("waapi.page", skip=skip, level=logging.DEBUG):
+                result = client.call(
+                    "ak.wwise.core.object.get",
+                    {"waql": f"$ from type Sound skip {skip} take {page_size}"},
+                    options={"return": caps.return_keys},
+                )
+            items = result.get("return", [])
+            if items:
+                yield _to_selected(items)
+            if len(items) < page_size:
+                return
+            skip += page_size
+
+def get_selected_sfx(ww_client = None,
+                     manifest: Optional[SelectionManifest] = None,
+                     txt_path: Optional[Path] = None) -> List[SelectedObj] | None:
+    """
+    Selected Sounds with their original source paths. Selected containers
+    and Work Units are expanded to their descendant Sounds in the same pass,
+    and every Sound gets a collision-free render name. The selection is
+    recorded in `manifest` / `txt_path` (default: the shared ones).
+    """
     try:
         with ensure_waapi_client(ww_client) as client:
-            selected = client.call(
-                "ak.wwise.ui.getSelectedObjects",
-                options={"return": ["id", "name", "path", "type"]},
-            )
-            objs = selected.get("objects", [])
-            # SoundSFX only
-            sounds = get_selected(["Sound"], client)
+            caps = _pool_of(client).capabilities(client)
+            selected = get_selected([], client, return_keys=caps.return_keys)
+            if not selected:
+                return []
+            sounds = _expand_to_sounds(client, selected, caps.return_keys)
             if not sounds:
                 return []
-            ids = [o["id"] for o in sounds]
-            source_map = get_original_sources_by_prop(ids, ww_client=client)
-            out = []
-
-            with last_selected_jsonl_path.open("w", encoding="utf-8") as fj,\
-                last_selected_txt_path.open("w", encoding="utf-8") as ft:
-                for o in sounds:
-                    selected_obj = SelectedObj(
-                        id=o["id"],
-                        name=o["name"],
-                        path=o["path"],
-                        type=o["type"],
-                        source_path=source_map.get(o["id"]))
-                    out.append(selected_obj)
-                    fj.write(json.dumps(selected_obj.__dict__, ensure_ascii = False)+ "\n")
-                    ft.write(f"{selected_obj.path}|{selected_obj.source_path or ''}\n")
-            return out
+            out = assign_render_names(_to_selected(sounds))
+        record_selection(manifest or get_selection_manifest(), out, txt_path or last_selected_txt_path)
+        return out
     except CannotConnectToWaapiException:
         return None
 
 
-def import_audio_to_wwise(import_tasks: List[dict], ww_client = None) -> int:
+def _import_outcomes(tasks: List[dict], status: ImportStatus, reason: str = "",
+                     seconds: float = 0.0) -> List[ImportOutcome]:
+    return [ImportOutcome(object_path=t["objectPath"],
+                          audio_file=t["audioFile"],
+                          status=status,
+                          reason=reason,
+                          seconds=seconds,
+                          object_id=t.get("objectId"))
+            for t in tasks]
+
+def _import_chunk(tasks: List[dict], ww_client = None) -> List[ImportOutcome]:
+    """One ak.wwise.core.audio.import call; raises if the call itself fails."""
+    import_payload = {
+        "importOperation": "useExisting",
+        "imports": [
+            {
+                "objectPath": task["objectPath"],
+                "audioFile": task["audioFile"],
+                "objectType": "Sound",
+                "importLanguage": "SFX"
+            }
+            for task in tasks
+        ]
+    }
+    t0 = time.perf_counter()
+    with ensure_waapi_client(ww_client) as client:
+        result = client.call("ak.wwise.core.audio.import", import_payload,
+                             options={"return": ["id", "path"]})
+    if not isinstance(result, dict):
+        raise RuntimeError("ak.wwise.core.audio.import returned no result")
+    return _match_import_result(tasks, result, time.perf_counter() - t0)
+
+def _match_import_result(tasks: List[dict], result: dict, seconds: float) -> List[ImportOutcome]:
+    """
+    Per-task outcomes of one import call. Wwise skips items it can't import
+    and only reports them in the log, so a task counts as imported only if
+    its object is among the returned objects.
+    """
+    paths = {o["path"].lower() for o in result.get("objects", []) if o.get("path")}
+    ids = {o["id"] for o in result.get("objects", []) if o.get("id")}
+    messages = [str(e.get("message", "")) for e in result.get("log", []) if isinstance(e, dict)]
+    out: List[ImportOutcome] = []
+    for task in tasks:
+        if task["objectPath"].lower() in paths or task.get("objectId") in ids:
+            out.extend(_import_outcomes([task], "imported", seconds=seconds))
+            continue
+        name = Path(task["audioFile"]).name
+        reason = next((m for m in messages if task["objectPath"] in m or name in m),
+                      "not imported (no object in Wwise's result)")
+        out.extend(_import_outcomes([task], "failed", reason, seconds=seconds))
+    return out
+
+def _import_with_retry(tasks: List[dict], retries: int, ww_client = None) -> List[ImportOutcome]:
+    """
+    Import a chunk, retrying it `retries` times. If it still fails, the
+    chunk is split into single items so one bad file only fails itself.
+    """
+    reason = ""
+    for _ in range(retries + 1):
+        try:
+            return _import_chunk(tasks, ww_client)
+        except CannotConnectToWaapiException as e:
+            return _import_outcomes(tasks, "failed", f"Cannot connect to WAAPI: {e}")
+        except Exception as e:
+            reason = str(e) or type(e).__name__
+
+    if len(tasks) == 1:
+        return _import_outcomes(tasks, "failed", reason)
+
+    out: List[ImportOutcome] = []
+    for task in tasks:
+        t0 = time.perf_counter()
+        try:
+            out.extend(_import_chunk([task], ww_client))
+        except Exception as e:
+            out.extend(_import_outcomes([task], "failed", str(e) or type(e).__name__,
+                                        seconds=time.perf_counter() - t0))
+    return out
+
+def import_audio_to_wwise(import_tasks: List[dict],
+                          ww_client = None,
+                          batch_size: int = 100,
+                          max_workers: int = 1,
+                          retries: int = 1) -> ImportReport:
     """
     import_tasks: list of dicts:
-    [ { "objectPath": "...", "audioFile": "..." } ]
+    [ { "objectPath": "...", "audioFile": "...", "objectId": "..." (optional) } ]
+
+    Sends the tasks in batches of `batch_size`, with up to `max_workers`
+    batches in flight (each on its own connection of `ww_client` if that is
+    a pool, else of the shared pool). Failed batches are retried, then
+    isolated per item. Returns a per-object ImportReport.
     """
+    report = ImportReport()
     if not import_tasks:
-        return 0
-    imports = [
-        {
-            "objectPath": task["objectPath"],
-            "audioFile": task["audioFile"],
-            "objectType": "Sound",
-            "importLanguage": "SFX"
-        }
-        for task in import_tasks
-    ]
-    import_payload = {
-        "importOperation": "useExisting",
-        "imports": imports
-    }
-    try:
-        with ensure_waapi_client(ww_client) as client:
-            result = client.call("ak.wwise.core.audio.import", import_payload)
-            print(f"import audio results:\n{result}")
-            return len(result.get("objects", [])) if isinstance(result, dict) else 0
+        return report
+    with span("waapi.import", tasks=len(import_tasks)) as fields:
+        _run_imports(import_tasks, report, ww_client, batch_size, max_workers, retries)
+        fields.update(imported=report.imported, failed=report.failed)
 
-    except CannotConnectToWaapiException:
-        return 0
-    except Exception:
-        return 0
+    for o in report.failures():
+        log.warning("import failed for %s: %s", o.object_path, o.reason)
+    return report
+
+def _run_imports(import_tasks: List[dict], report: ImportReport, ww_client,
+                 batch_size: int, max_workers: int, retries: int) -> None:
+
+    missing = [t for t in import_tasks if not Path(t["audioFile"]).is_file()]
+    if missing:
+        report.outcomes.extend(_import_outcomes(missing, "failed", "audio file not found"))
+        import_tasks = [t for t in import_tasks if t not in missing]
+
+    batch_size = max(1, batch_size)
+    chunks = [import_tasks[i:i + batch_size] for i in range(0, len(import_tasks), batch_size)]
+    # A caller-provided client can't be shared between threads; a pool can
+    pool = ww_client if isinstance(ww_client, WaapiConnectionPool) else None
+    shared = ww_client is not None and pool is None
+    workers = 1 if shared else max(1, min(max_workers, len(chunks)))
+
+    if workers == 1:
+        for chunk in chunks:
+            report.outcomes.extend(_import_with_retry(chunk, retries, ww_client))
+    else:
+        pool = pool or get_waapi_pool()
+        pool.ensure_capacity(workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="WwiseImport") as ex:
+            for outcomes in ex.map(lambda c: _import_with_retry(c, retries, pool), chunks):
+                report.outcomes.extend(outcomes)
 
 def get_original_sources_by_prop(props: list[str],
                                  propname: str = "id",
@@ -114,11 +796,7 @@ def get_original_sources_by_prop(props: list[str],
     if not props:
         return {}
     with ensure_waapi_client(ww_client) as client:
-        info = client.call("ak.wwise.core.getInfo")
-        ww_year = 0
-        if isinstance(info, dict):
-            ww_year = info.get("version", {}).get("year", 0)
-        srcfile_key = "originalFilePath" if ww_year > 2021 else "sound:originalWavFilePath"
+        srcfile_key = _pool_of(client).capabilities(client).source_key
         result = client.call(
             "ak.wwise.core.object.get",
             {"from": {propname: props}},
@@ -127,9 +805,8 @@ def get_original_sources_by_prop(props: list[str],
 
         out = {}
         for item in result.get("return", []):
-            wav = item.get("sound:originalWavFilePath") or item.get("originalFilePath")
+            wav = _source_from(item)
             if wav:
                 out[item[propname]] = wav
 
         return out
-
@@ -0,0 +1,55 @@
+# tests/conftest.py
+# The bridge imports its modules as top-level packages (core, utils, ...), the
+# way main.py and the frozen build run it; benchmarks/ holds the fake Wwise
+# and REAPER the tests drive it with. Data folders go to a throw-away place
+# before utils.app_paths computes them.
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src" / "wwise_reaper_bridge"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+_sandbox = Path(tempfile.mkdtemp(prefix="wrb-tests-"))
+os.environ["WRB_CONFIG_DIR"] = str(_sandbox / "config")
+os.environ["WRB_DATA_DIR"] = str(_sandbox / "data")
+
+
+@pytest.fixture
+def fake_wwise(request):
+    """A FakeWwise served over WAAPI and a connection pool on it (closed before the server stops)."""
+    from fake_waapi import FakeWaapiServer, FakeWwise
+    from utils.wwise_waapi import WaapiConnectionPool
+
+    wwise = FakeWwise(**getattr(request, "param", {"count": 40}))
+    with FakeWaapiServer(wwise) as server:
+        pool = WaapiConnectionPool(server.url)
+        try:
+            yield wwise, pool
+        finally:
+            pool.close()
+
+
+def run_with_timeout(fn, timeout: float = 20.0):
+    """fn() on a daemon thread; fails the test instead of hanging it."""
+    box = {}
+
+    def run():
+        try:
+            box["value"] = fn()
+        except BaseException as e:
+            box["error"] = e
+
+    t = threading.Thread(target=run, daemon=True)
+    t.start()
+    t.join(timeout)
+    if t.is_alive():
+        pytest.fail(f"did not finish within {timeout}s")
+    if "error" in box:
+        raise box["error"]
+    return box["value"]
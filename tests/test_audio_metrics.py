@@ -0,0 +1,67 @@
+import array
+import math
+import wave
+
+import pytest
+
+from utils import audio_metrics
+
+pytestmark = pytest.mark.skipif(not audio_metrics.available(), reason="NumPy is not installed")
+
+
+def _sine(path, amplitude, seconds, channels=1, freq=997.0, rate=48000):
+    frames = int(seconds * rate)
+    samples = array.array("h")
+    for i in range(frames):
+        v = int(round(amplitude * 32767 * math.sin(2 * math.pi * freq * i / rate)))
+        v = max(-32768, min(32767, v))
+        samples.extend([v] * channels)
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(samples.tobytes())
+
+
+def test_sine_loudness(tmp_path):
+    # BS.1770: a full-scale 997 Hz sine in one channel measures -3.01 LKFS
+    _sine(tmp_path / "a.wav", 0.5, 3.0)
+    m = audio_metrics.analyze_wav(tmp_path / "a.wav")
+    assert m.lufs == pytest.approx(-3.01 - 6.02, abs=0.1)
+    assert m.peak_dbfs == pytest.approx(-6.02, abs=0.05)
+    assert m.rms_dbfs == pytest.approx(-9.03, abs=0.05)
+    assert m.duration == pytest.approx(3.0)
+    assert m.clipped_samples == 0
+
+
+def test_reference_tone(tmp_path):
+    # 1 kHz at -20 dBFS in both channels of a stereo file reads -20 LUFS
+    _sine(tmp_path / "a.wav", 10 ** (-20 / 20), 5.0, channels=2, freq=1000.0)
+    assert audio_metrics.analyze_wav(tmp_path / "a.wav").lufs == pytest.approx(-20.0, abs=0.1)
+
+
+def test_stereo_adds_channels(tmp_path):
+    _sine(tmp_path / "a.wav", 0.5, 3.0, channels=2)
+    assert audio_metrics.analyze_wav(tmp_path / "a.wav").lufs == pytest.approx(-9.03 + 3.01, abs=0.1)
+
+
+def test_short_file_is_one_block(tmp_path):
+    _sine(tmp_path / "a.wav", 0.5, 0.2)
+    assert audio_metrics.analyze_wav(tmp_path / "a.wav").lufs == pytest.approx(-9.03, abs=0.2)
+
+
+def test_silence_and_clipping(tmp_path):
+    _sine(tmp_path / "silent.wav", 0.0, 1.0)
+    silent = audio_metrics.analyze_wav(tmp_path / "silent.wav")
+    assert silent.lufs == audio_metrics.SILENCE_DB
+    assert silent.peak_dbfs == audio_metrics.SILENCE_DB
+    _sine(tmp_path / "loud.wav", 1.5, 1.0)  # overdriven
+    assert audio_metrics.analyze_wav(tmp_path / "loud.wav").clipped_samples > 0
+
+
+def test_analyze_many_reports_errors(tmp_path):
+    _sine(tmp_path / "a.wav", 0.5, 0.5)
+    (tmp_path / "bad.wav").write_bytes(b"RIFF")
+    out = audio_metrics.analyze_many([tmp_path / "a.wav", tmp_path / "bad.wav"])
+    assert isinstance(out[tmp_path / "a.wav"], audio_metrics.AudioMetrics)
+    assert out[tmp_path / "bad.wav"].startswith("WavFormatError")
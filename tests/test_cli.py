@@ -0,0 +1,57 @@
+import pytest
+from waapi import WaapiRequestFailed
+
+import cli
+from core.models import Result
+from utils.reaper_channel import ChannelNotPickedUp
+
+
+@pytest.mark.parametrize("error, message", [
+    (WaapiRequestFailed("ak.wwise.core.audio.import:\n  object not found"),
+     "[error] WAAPI request failed: ak.wwise.core.audio.import: object not found"),
+    (ChannelNotPickedUp("REAPER did not pick up 'run_script' within 5.0s"),
+     "[error] REAPER command channel: REAPER did not pick up 'run_script' within 5.0s"),
+])
+def test_failures_exit_with_one_line(monkeypatch, capsys, error, message):
+    def fail(args, ui, config):
+        raise error
+    monkeypatch.setattr(cli, "_run", fail)
+    assert cli.main(["--quiet", "check-format"]) == 2
+    out = capsys.readouterr().out
+    assert out.startswith(message + " (")
+    assert out.count("\n") == 1
+
+
+@pytest.mark.parametrize("level, code", [("info", 0), ("warn", 1), ("error", 2)])
+def test_exit_codes(monkeypatch, capsys, level, code):
+    monkeypatch.setattr(cli, "_run", lambda args, ui, config: Result(level, "done"))
+    assert cli.main(["--json", "check-format"]) == code
+    assert '"level": "%s"' % level in capsys.readouterr().out
+
+
+def test_cprofile_flag_turns_profiling_on(monkeypatch):
+    monkeypatch.setenv(cli.PROFILE_ENV, "")  # restored afterwards
+    monkeypatch.setattr(cli, "_run", lambda args, ui, config: Result("info", "done"))
+    cli.main(["--quiet", "--cprofile", "check-format"])
+    assert cli.os.environ[cli.PROFILE_ENV] == "1"
+
+
+def test_selection_keeps_recorded_render_names(monkeypatch, tmp_path):
+    from core.models import SelectedObj
+    from utils import wwise_waapi
+    from utils.manifest_store import SelectionManifest
+
+    def sound(n, name, render_name=None):
+        return SelectedObj(id=f"{{0000000{n}-0000-0000-0000-000000000000}}", name=name,
+                           path=f"\\A\\{name}{n}", type="Sound", render_name=render_name)
+    recorded = [sound(1, "Hit", render_name="Hit_Recorded")]
+    manifest = SelectionManifest(tmp_path / "selection.db")
+    manifest.save(recorded)
+    resolved = [sound(1, "Hit"), sound(2, "Hit_Recorded")]
+    monkeypatch.setattr(wwise_waapi, "get_sfx_by_paths", lambda paths, pool: resolved)
+
+    args = cli.build_parser().parse_args(["render-sync", "--path", "\\A"])
+    objs = cli.resolve_selection(args, manifest=manifest)
+    assert objs[0].render_name == "Hit_Recorded"
+    assert objs[1].render_name == "Hit_Recorded_00000002"
+    manifest.close()
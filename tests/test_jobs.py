@@ -0,0 +1,39 @@
+import threading
+
+from core.models import Result
+from ui.jobs import JobRunner, ThreadSafeUIApi
+
+
+class _ClosedRoot:
+    """Tk root whose window is gone: after() callbacks never run."""
+    def after(self, ms, fn):
+        pass
+
+
+class _UI:
+    def __init__(self):
+        self.asked = []
+
+    def ask_yes_no(self, title, msg):
+        self.asked.append(title)
+        return True
+
+
+def test_dialog_gets_default_answer_after_shutdown():
+    runner = JobRunner(_ClosedRoot())
+    ui = _UI()
+    job_ui = ThreadSafeUIApi(runner, ui)
+    asking, answers = threading.Event(), []
+
+    def job(cancel, progress):
+        asking.set()
+        answers.append(job_ui.ask_yes_no("Resume", "Resume the interrupted sync?"))
+        return Result("info", "done")
+
+    runner.submit("Sync", job, on_done=lambda job, result: None)
+    assert asking.wait(5)
+    runner.shutdown()
+    runner._executor.shutdown(wait=True)  # returns only if the worker got unstuck
+    assert answers == [False]
+    runner._drain()  # a late drain doesn't show the abandoned dialog
+    assert ui.asked == []
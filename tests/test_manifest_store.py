@@ -0,0 +1,55 @@
+import os
+
+from core.models import SelectedObj
+from utils.manifest_store import (SelectionManifest, export_selection, load_selection,
+                                  record_selection, write_selected)
+
+def _objs(n):
+    return [SelectedObj(id=f"{{{i}}}", name=f"s{i}", path=f"\\Actor-Mixer Hierarchy\\s{i}", type="Sound",
+                        source_path=f"C:\\src\\s{i}.wav") for i in range(n)]
+
+
+def test_save_writes_only_changes(tmp_path):
+    manifest = SelectionManifest(tmp_path / "selection.sqlite")
+    objs = _objs(5)
+    assert manifest.save(objs) == 5
+    assert manifest.save(objs) == 0
+    renamed = SelectedObj(**{**vars(objs[1]), "render_name": "s1_2"})
+    assert manifest.save([objs[0], renamed, *objs[2:4]]) == 2  # one changed, one removed
+    assert [o.id for o in manifest.load()] == ["{0}", "{1}", "{2}", "{3}"]
+    assert manifest.get_by_id("{1}").render_name == "s1_2"
+    assert manifest.get_by_path(objs[2].path) == objs[2]
+    assert manifest.get_by_id("{4}") is None
+
+
+def test_histories_are_separate(tmp_path):
+    manifest = SelectionManifest(tmp_path / "selection.sqlite")
+    manifest.save(_objs(2))
+    manifest.save(_objs(3), history="big")
+    assert set(manifest.histories()) == {"last", "big"}
+    assert len(manifest.load()) == 2
+    manifest.delete("big")
+    assert manifest.load("big") == []
+    assert manifest.histories() == ["last"]
+
+
+def test_reaper_manifest_rewritten_only_on_change(tmp_path):
+    manifest = SelectionManifest(tmp_path / "selection.sqlite")
+    txt = tmp_path / "manifest.txt"
+    record_selection(manifest, _objs(2), txt)
+    assert txt.read_text(encoding="utf-8").splitlines()[0] == "\\Actor-Mixer Hierarchy\\s0|C:\\src\\s0.wav|"
+    os.utime(txt, (0, 0))
+    record_selection(manifest, _objs(2), txt)
+    assert txt.stat().st_mtime == 0
+
+
+def test_edited_export_wins(tmp_path):
+    manifest = SelectionManifest(tmp_path / "selection.sqlite")
+    jsonl = tmp_path / "last_selected.jsonl"
+    manifest.save(_objs(3))
+    export_selection(manifest, jsonl)
+    assert load_selection(manifest, jsonl) == _objs(3)
+
+    write_selected(jsonl, _objs(1))  # user edit, newer than the manifest
+    assert load_selection(manifest, jsonl) == _objs(1)
+    assert manifest.load() == _objs(1)
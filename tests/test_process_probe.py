@@ -0,0 +1,69 @@
+import os
+import sys
+
+import pytest
+
+from utils import process_probe, system
+from utils.process_probe import ProcessInfo, ProcessProbe
+
+
+class _Backend:
+    def __init__(self, procs):
+        self.procs = procs  # pid -> (name, exe path or None)
+
+    def processes(self):
+        return [ProcessInfo(pid, name) for pid, (name, _) in self.procs.items()]
+
+    def is_responsive(self, pid):
+        return True
+
+    def exe_path(self, pid):
+        return self.procs[pid][1]
+
+
+@pytest.fixture
+def reapers(tmp_path, monkeypatch):
+    """Two REAPER installs, one per connection profile."""
+    exes = []
+    for name in ("a", "b"):
+        exe = tmp_path / name / "reaper"
+        exe.parent.mkdir()
+        exe.write_bytes(b"")
+        exes.append(str(exe))
+    probe = ProcessProbe()
+    monkeypatch.setattr(process_probe, "_probe", probe)
+    return exes, probe
+
+
+def test_only_the_profiles_reaper_counts(reapers):
+    (a, b), probe = reapers
+    probe.set_backend(_Backend({10: ("python", sys.executable), 11: ("reaper", a)}))
+    assert system.is_reaper_running(a)
+    assert not system.is_reaper_running(b)
+    assert system.is_reaper_running()  # any REAPER
+    assert not system.is_reaper_responsive(b)
+
+
+def test_unreadable_path_counts_as_a_match(reapers):
+    (a, b), probe = reapers
+    probe.set_backend(_Backend({11: ("REAPER.exe", None)}))
+    assert system.is_reaper_running(b)
+
+
+def test_missing_configured_exe_matches_any_reaper(reapers, tmp_path):
+    (a, _), probe = reapers
+    probe.set_backend(_Backend({11: ("reaper", a)}))
+    assert system.is_reaper_running(str(tmp_path / "elsewhere" / "reaper"))
+
+
+def test_app_bundle_contains_the_executable(tmp_path):
+    bundle = tmp_path / "REAPER.app"
+    assert process_probe._same_exe(str(bundle / "Contents" / "MacOS" / "REAPER"), str(bundle))
+    assert not process_probe._same_exe(str(tmp_path / "REAPER.app2" / "REAPER"), str(bundle))
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc only on Linux")
+def test_procfs_reads_exe_path():
+    backend = process_probe.ProcfsBackend()
+    assert os.path.realpath(backend.exe_path(os.getpid())) == os.path.realpath(sys.executable)
+    assert backend.exe_path(-1) is None
@@ -0,0 +1,80 @@
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from core import bridge_logic
+from core.models import Settings
+from fake_reaper import FakeReaper
+from utils.reaper_channel import ChannelNotPickedUp, ReaperChannel
+
+
+def _slow(seconds, ok=True, error=""):
+    def handler(args):
+        time.sleep(seconds)
+        return ok, None, error
+    return handler
+
+
+def test_round_trip(tmp_path):
+    channel = ReaperChannel(tmp_path)
+    with FakeReaper(tmp_path):
+        assert channel.ping()
+        assert channel.get_render_format() == "ZXZhdxgAAQ=="
+    assert not list(channel.outbox.iterdir())
+
+
+def test_request_nobody_takes_is_withdrawn(tmp_path):
+    channel = ReaperChannel(tmp_path)
+    with pytest.raises(ChannelNotPickedUp):
+        channel.run_script("x.lua", timeout=0.2)
+    assert channel.pending_requests() == []
+
+
+@pytest.mark.parametrize("ack", [True, False])
+def test_script_taken_runs_past_the_timeout(tmp_path, ack):
+    # Without an ack (older listener) the request vanishing from the inbox counts as taken
+    channel = ReaperChannel(tmp_path)
+    with FakeReaper(tmp_path, scripts={"slow.lua": _slow(0.6)}, ack=ack) as reaper:
+        resp = channel.run_script("slow.lua", timeout=0.2)
+    assert resp.ok
+    assert len(reaper.handled) == 1
+
+
+def _session(tmp_path):
+    return SimpleNamespace(settings=Settings(use_command_channel=True, reaper_path="reaper"),
+                           channel=ReaperChannel(tmp_path), script=lambda p: p)
+
+
+@pytest.fixture
+def launches(monkeypatch):
+    launched = []
+    monkeypatch.setattr(bridge_logic, "is_reaper_running", lambda reaper_path=None: True)
+    monkeypatch.setattr(bridge_logic, "launch_reaper_and_run_lua", lambda exe, script: launched.append(script))
+    return launched
+
+
+def test_slow_script_is_not_launched_again(tmp_path, launches):
+    with FakeReaper(tmp_path, scripts={"render.lua": _slow(6.0)}) as reaper:
+        assert bridge_logic._run_in_reaper(_session(tmp_path), Path("render.lua")) is None
+    assert launches == []
+    assert len(reaper.handled) == 1
+
+
+def test_failed_script_is_an_error_not_a_relaunch(tmp_path, launches):
+    with FakeReaper(tmp_path, scripts={"render.lua": _slow(0, ok=False, error="boom")}):
+        error = bridge_logic._run_in_reaper(_session(tmp_path), Path("render.lua"))
+    assert "boom" in error
+    assert launches == []
+
+
+def test_listener_not_answering_falls_back_to_launch(tmp_path, launches, monkeypatch):
+    session = _session(tmp_path)
+    # Heartbeat fresh, but nothing serves the inbox (REAPER busy in a modal dialog)
+    monkeypatch.setattr(session.channel, "is_alive", lambda: True)
+    monkeypatch.setattr(session.channel, "run_script",
+                        lambda script, cancel=None: ReaperChannel.run_script(session.channel, script, 0.2, cancel))
+    assert bridge_logic._run_in_reaper(session, Path("render.lua")) is None
+    assert launches == [Path("render.lua")]
+    assert session.channel.pending_requests() == []
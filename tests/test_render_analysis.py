@@ -0,0 +1,12 @@
+from core import render_analysis
+from core.models import Settings
+from utils import audio_metrics
+
+
+def test_no_analyzer_unless_enabled():
+    assert render_analysis.make_analyzer(Settings(analyze_renders=False)) is None
+
+
+def test_no_analyzer_without_numpy(monkeypatch):
+    monkeypatch.setattr(audio_metrics, "available", lambda: False)
+    assert render_analysis.make_analyzer(Settings(analyze_renders=True, block_outliers=True)) is None
@@ -0,0 +1,77 @@
+import struct
+
+from core.models import SelectedObj
+from fake_reaper import write_wav
+from utils.render_cache import RenderHashIndex, pcm_digest
+
+
+def _with_list_chunk(src, dst):
+    """Same samples as `src` with a LIST chunk before the data (as BWF/metadata writers add)."""
+    raw = src.read_bytes()
+    data = raw.index(b"data")
+    chunk = b"LIST" + struct.pack("<I", 4) + b"INFO"
+    body = raw[8:data] + chunk + raw[data:]
+    dst.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+
+
+def test_digest_covers_samples_only(tmp_path):
+    a, b, c = tmp_path / "a.wav", tmp_path / "b.wav", tmp_path / "c.wav"
+    write_wav(a, 0.01, seed=1)
+    _with_list_chunk(a, b)
+    write_wav(c, 0.01, seed=2)
+    assert pcm_digest(a) == pcm_digest(b)
+    assert pcm_digest(a) != pcm_digest(c)
+    assert pcm_digest(tmp_path / "gone.wav") is None
+
+
+def test_unchanged_render_needs_no_import(tmp_path):
+    source, render = tmp_path / "source.wav", tmp_path / "render.wav"
+    write_wav(source, 0.01, seed=1)
+    write_wav(render, 0.01, seed=1)
+    obj = SelectedObj(id="{1}", name="s", path="\\s", type="Sound", source_path=str(source))
+    index = RenderHashIndex(tmp_path / "hashes.json")
+    assert not index.needs_import(obj, render)
+
+    write_wav(render, 0.01, seed=2)
+    assert index.needs_import(obj, render)
+    index.commit([obj.id])
+    index.save()
+
+    # Wwise copied the render into its Originals; that's what it has now, across restarts
+    reloaded = RenderHashIndex(tmp_path / "hashes.json")
+    imported = tmp_path / "imported.wav"
+    imported.write_bytes(render.read_bytes())
+    moved = SelectedObj(id=obj.id, name="s", path="\\s", type="Sound", source_path=str(imported))
+    assert not reloaded.needs_import(moved, render)
+
+
+def test_missing_source_is_imported(tmp_path):
+    source, render = tmp_path / "source.wav", tmp_path / "render.wav"
+    write_wav(source, 0.01, seed=1)
+    write_wav(render, 0.01, seed=1)
+    obj = SelectedObj(id="{1}", name="s", path="\\s", type="Sound", source_path=str(source))
+    index = RenderHashIndex(tmp_path / "hashes.json")
+    assert not index.needs_import(obj, render)
+    source.unlink()
+    assert index.needs_import(obj, render)
+    assert obj.id not in index._entries
+
+
+def test_digest_covers_the_sample_format(tmp_path):
+    a, b = tmp_path / "a.wav", tmp_path / "b.wav"
+    write_wav(a, 0.01, sample_rate=48000, seed=1)
+    raw = bytearray(a.read_bytes())
+    struct.pack_into("<I", raw, 24, 44100)  # same samples, declared at another rate
+    b.write_bytes(bytes(raw))
+    assert pcm_digest(a) != pcm_digest(b)
+
+
+def test_uncommitted_render_is_forgotten(tmp_path):
+    source, render = tmp_path / "source.wav", tmp_path / "render.wav"
+    write_wav(source, 0.01, seed=1)
+    write_wav(render, 0.01, seed=2)
+    obj = SelectedObj(id="{1}", name="s", path="\\s", type="Sound", source_path=str(source))
+    index = RenderHashIndex(tmp_path / "hashes.json")
+    assert index.needs_import(obj, render)
+    index.commit([])  # import failed
+    assert index.needs_import(obj, render)
@@ -0,0 +1,65 @@
+import base64
+import logging
+
+import pytest
+
+from core.models import Settings
+from core.render_format import (RenderFormat, RenderFormatError, decode_render_format,
+                                encode_render_format, validate_render_format)
+from utils.settings_store import load_settings, save_settings
+
+
+def test_decode_wav_24():
+    fmt = decode_render_format("ZXZhdxgAAQ==")
+    assert (fmt.container, fmt.bits, fmt.options) == ("wav", 24, b"\x00\x01")
+    assert fmt.describe() == "WAV 24-bit"
+
+
+@pytest.mark.parametrize("fmt", [
+    RenderFormat("wav", 16, b"\x00\x01"),
+    RenderFormat("aiff", 24),
+    RenderFormat("flac", None, b"\x18\x00\x00\x00\x05"),
+    RenderFormat("ogg"),
+])
+def test_round_trip(fmt):
+    assert decode_render_format(encode_render_format(fmt)) == fmt
+
+
+@pytest.mark.parametrize("value, message", [
+    ("not base64!", "not valid base64"),
+    (base64.b64encode(b"eva").decode(), "too short"),
+    (base64.b64encode(b"xxxx").decode(), "unknown output format"),
+    (base64.b64encode(b"evaw").decode(), "without bit depth"),
+])
+def test_decode_errors(value, message):
+    with pytest.raises(RenderFormatError, match=message):
+        decode_render_format(value)
+
+
+def test_encode_errors():
+    with pytest.raises(RenderFormatError):
+        encode_render_format(RenderFormat("mp4"))
+    with pytest.raises(RenderFormatError):
+        encode_render_format(RenderFormat("wav"))
+
+
+def test_validate_wants_wav():
+    assert validate_render_format(encode_render_format(RenderFormat("wav", 32))).bits == 32
+    with pytest.raises(RenderFormatError, match="Wwise imports WAV"):
+        validate_render_format(encode_render_format(RenderFormat("flac")))
+    with pytest.raises(RenderFormatError, match="bit depth 12"):
+        validate_render_format(encode_render_format(RenderFormat("wav", 12)))
+
+
+def test_diff():
+    assert RenderFormat("wav", 24).diff(RenderFormat("wav", 16)) == ["16-bit, expected 24-bit"]
+    assert RenderFormat("wav", 24).diff(RenderFormat("wav", 24)) == []
+
+
+def test_bad_format_is_saved_and_loaded_with_a_warning(tmp_path, caplog):
+    config = tmp_path / "config.json"
+    flac = encode_render_format(RenderFormat("flac"))
+    save_settings(config, Settings(reaper_render_format=flac))
+    with caplog.at_level(logging.WARNING):
+        assert load_settings(config).reaper_render_format == flac
+    assert "Wwise imports WAV" in caplog.text
@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+
+from utils import render_watch
+from utils.render_watch import RenderEvent, RenderWatcher, parse_progress_line
+
+
+class _BrokenNotifier:
+    def __init__(self, directory):
+        pass
+
+    def wait(self, timeout):
+        raise OSError("notification handle closed")
+
+    def close(self):
+        pass
+
+
+def test_parse_progress_line():
+    assert parse_progress_line("total|3\n") == RenderEvent("total", count=3)
+    assert parse_progress_line("rendered|Foo_01") == RenderEvent("rendered", name="Foo_01")
+    assert parse_progress_line("total|x") is None
+    assert parse_progress_line("rendered|") is None
+    assert parse_progress_line("garbage") is None
+
+
+def test_events_and_done(tmp_path):
+    events = []
+    with RenderWatcher(tmp_path, on_event=events.append, rescan_interval=0.05) as watcher:
+        with (tmp_path / "progress.log").open("w") as f:
+            f.write("total|2\nrendered|a\nrend")
+            f.flush()
+            time.sleep(0.2)
+            f.write("ered|b\n")
+        (tmp_path / "success.flag").write_text("ok")
+        assert watcher.wait(5)
+    assert watcher.rendered == ["a", "b"]
+    assert watcher.total == 2
+    assert events[-1] == RenderEvent("done", count=2)
+    assert not watcher.failed
+
+
+def test_name_split_inside_a_utf8_character(tmp_path):
+    line = "rendered|Épée_01\n".encode("utf-8")
+    cut = line.index("É".encode("utf-8")) + 1  # between the two bytes of É
+    with RenderWatcher(tmp_path, rescan_interval=0.05) as watcher:
+        with (tmp_path / "progress.log").open("wb") as f:
+            f.write(line[:cut])
+            f.flush()
+            time.sleep(0.2)
+            f.write(line[cut:])
+        (tmp_path / "success.flag").write_text("ok")
+        assert watcher.wait(5)
+    assert watcher.rendered == ["Épée_01"]
+
+
+@pytest.mark.parametrize("with_cancel", [False, True])
+def test_wait_returns_when_the_watcher_thread_dies(tmp_path, monkeypatch, with_cancel):
+    monkeypatch.setattr(render_watch, "make_dir_notifier", _BrokenNotifier)
+    cancel = threading.Event() if with_cancel else None
+    with RenderWatcher(tmp_path, rescan_interval=0.05) as watcher:
+        t0 = time.monotonic()
+        assert watcher.wait(None, cancel=cancel) is False
+        assert time.monotonic() - t0 < 5
+    assert watcher.failed
+    assert isinstance(watcher.error, OSError)
+    assert not watcher.done
+
+
+def test_wait_times_out_and_cancels(tmp_path):
+    with RenderWatcher(tmp_path, rescan_interval=0.05) as watcher:
+        assert watcher.wait(0.1) is False
+        cancel = threading.Event()
+        cancel.set()
+        assert watcher.wait(None, cancel=cancel) is False
+    assert not watcher.failed
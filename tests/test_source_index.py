@@ -0,0 +1,125 @@
+import os
+
+import pytest
+
+from core.models import ImportReport, SelectedObj
+from core.source_audit import SourceAudit, relink_missing, scan_sources
+from utils.source_index import FileState, SourceIndex, find_files, stat_sources
+
+
+def _sounds(n):
+    return [SelectedObj(id=f"{{{i}}}", name=f"s{i}", path=f"\\s{i}", type="Sound", source_path=f"/src/s{i}.wav")
+            for i in range(n)]
+
+
+def test_save_sounds_writes_only_differences(tmp_path):
+    index = SourceIndex(tmp_path / "index.sqlite")
+    sounds = _sounds(4)
+    assert index.save_sounds(sounds) == 4
+    assert index.save_sounds(sounds) == 0
+    moved = SelectedObj(**{**vars(sounds[0]), "path": "\\moved\\s0"})
+    assert index.save_sounds([moved, *sounds[1:3]]) == 2  # one moved, one deleted
+
+
+def test_save_files_writes_only_differences(tmp_path):
+    index = SourceIndex(tmp_path / "index.sqlite")
+    states = {"/a.wav": FileState(10, 1), "/b.wav": FileState(None, None, 5.0)}
+    assert index.save_files(states) == 2
+    assert index.files() == states
+    assert index.files()["/b.wav"].missing
+    assert index.save_files(dict(states)) == 0
+    assert index.save_files({"/a.wav": FileState(11, 2)}) == 2
+
+
+def test_stat_sources(tmp_path):
+    (tmp_path / "d1").mkdir()
+    (tmp_path / "d1" / "a.wav").write_bytes(b"abc")
+    paths = [str(tmp_path / "d1" / "a.wav"), str(tmp_path / "d1" / "b.wav"), str(tmp_path / "gone" / "c.wav")]
+    progress = []
+    seen = stat_sources(paths, workers=4, progress=lambda done, total: progress.append((done, total)))
+    assert seen[paths[0]][0] == 3
+    assert seen[paths[1]] is None and seen[paths[2]] is None
+    assert progress[-1] == (2, 2)  # one listing per folder
+
+
+def test_find_files(tmp_path):
+    for rel in ("x/a.wav", "y/a.wav", "y/z/b.wav"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_bytes(b"")
+    found = find_files([tmp_path / "x", tmp_path / "y"], ["a.wav", "b.wav", "c.wav"])
+    assert len(found[os.path.normcase("a.wav")]) == 2
+    assert found[os.path.normcase("b.wav")] == [tmp_path / "y" / "z" / "b.wav"]
+    assert os.path.normcase("c.wav") not in found
+
+
+@pytest.mark.parametrize("fake_wwise", [{"count": 12}], indirect=True)
+def test_scan_reports_changes_since_last_audit(tmp_path, fake_wwise):
+    wwise, pool = fake_wwise
+    sources = tmp_path / "originals"
+    sources.mkdir()
+    for i, o in enumerate(wwise.objects):
+        o["originalFilePath"] = str(sources / f"{i}.wav")
+    wwise.objects[11]["originalFilePath"] = wwise.objects[10]["originalFilePath"]
+    for i in range(9):
+        (sources / f"{i}.wav").write_bytes(b"x" * i)
+    index = SourceIndex(tmp_path / "index.sqlite")
+
+    first = scan_sources(pool, index, page_size=5, workers=2)
+    assert (first.sounds, first.files) == (12, 11)
+    assert sorted(first.missing) == [str(sources / "10.wav"), str(sources / "9.wav")]
+    assert len(first.missing[str(sources / "10.wav")]) == 2
+    assert list(first.duplicates) == [str(sources / "10.wav")]
+    assert first.previous is None
+
+    (sources / "0.wav").write_bytes(b"changed")
+    (sources / "9.wav").write_bytes(b"back")
+    calls = wwise.calls["ak.wwise.core.object.get"]
+    second = scan_sources(pool, index, page_size=5, workers=2)
+    assert wwise.calls["ak.wwise.core.object.get"] - calls == 3  # 5 + 5 + 2 Sounds
+    assert second.previous is not None
+    assert second.changed == [str(sources / "0.wav")]
+    assert second.recovered == [str(sources / "9.wav")]
+    assert list(second.missing) == [str(sources / "10.wav")]
+    assert second.newly_missing == []
+
+
+@pytest.mark.parametrize("fake_wwise", [{"count": 4}], indirect=True)
+def test_rescan_skips_unchanged_folders(tmp_path, fake_wwise):
+    wwise, pool = fake_wwise
+    for i, o in enumerate(wwise.objects):
+        (tmp_path / f"d{i % 2}").mkdir(exist_ok=True)
+        o["originalFilePath"] = str(tmp_path / f"d{i % 2}" / f"{i}.wav")
+        if i != 3:
+            (tmp_path / f"d{i % 2}" / f"{i}.wav").write_bytes(b"x")
+    index = SourceIndex(tmp_path / "index.sqlite")
+    scan_sources(pool, index, workers=2)
+
+    # Rewritten in place: the folder's mtime stays, so only a full scan sees it
+    (tmp_path / "d0" / "0.wav").write_bytes(b"longer")
+    assert scan_sources(pool, index, workers=2).changed == []
+    assert scan_sources(pool, index, workers=2, full=True).changed == [str(tmp_path / "d0" / "0.wav")]
+
+    # A file appearing changes its folder's mtime
+    (tmp_path / "d1" / "3.wav").write_bytes(b"x")
+    again = scan_sources(pool, index, workers=2)
+    assert again.recovered == [str(tmp_path / "d1" / "3.wav")]
+    assert again.missing == {}
+
+
+def test_relink_only_one_to_one(tmp_path):
+    (tmp_path / "found").mkdir()
+    for name in ("a.wav", "b.wav"):
+        (tmp_path / "found" / name).write_bytes(b"")
+    audit = SourceAudit()
+    for i, source in enumerate(["/old/x/a.wav", "/old/y/a.wav", "/old/b.wav"]):
+        audit.missing[source] = [SelectedObj(id=f"{{{i}}}", name=f"s{i}", path=f"\\s{i}", type="Sound",
+                                             source_path=source)]
+    imported = []
+
+    def import_fn(tasks):
+        imported.extend(tasks)
+        return ImportReport()
+    relink_missing(audit, [tmp_path / "found"], import_fn)
+    # Two missing sources named a.wav, one candidate: can't tell which it belongs to
+    assert sorted(audit.ambiguous) == ["/old/x/a.wav", "/old/y/a.wav"]
+    assert [t["objectPath"] for t in imported] == ["\\s2"]
@@ -0,0 +1,67 @@
+from core.models import ImportOutcome, SelectedObj
+from fake_reaper import write_wav
+from utils.sync_journal import SyncJournal
+
+
+def _objs(n=3):
+    return [SelectedObj(id=f"{{{i}}}", name=f"s{i}", path=f"\\Actor-Mixer Hierarchy\\s{i}", type="Sound")
+            for i in range(n)]
+
+
+def test_resume_after_interruption(tmp_path):
+    objs = _objs()
+    render_dir = tmp_path / "render"
+    render_dir.mkdir()
+    journal = SyncJournal(tmp_path / "journal.jsonl")
+    run_id = journal.begin(objs, render_dir)
+    for o in objs[:2]:
+        write_wav(render_dir / f"{o.name}.wav", 0.01)
+        journal.mark_rendered(o.name, render_dir / f"{o.name}.wav")
+    journal.record_outcomes([ImportOutcome(objs[0].path, "", "imported", object_id=objs[0].id)])
+    journal.close()  # interrupted: no complete()
+
+    run = SyncJournal(journal.path).load()
+    assert run.run_id == run_id
+    assert run.render_dir == str(render_dir)
+    assert run.matches(objs)
+    assert not run.matches(objs[:2])
+    assert run.done_ids() == {objs[0].id}
+    assert run.counts() == {"imported": 1, "rendered": 1, "queued": 1}
+    assert run.reusable_render(objs[1].id, render_dir / "s1.wav")
+    assert not run.reusable_render(objs[2].id, render_dir / "s2.wav")
+
+    # A render that changed since it was recorded is rendered again
+    write_wav(render_dir / "s1.wav", 0.02)
+    assert not run.reusable_render(objs[1].id, render_dir / "s1.wav")
+
+    resumed = SyncJournal(journal.path)
+    assert resumed.resume(run, objs) == run_id
+    resumed.record_outcomes([ImportOutcome(objs[1].path, "", "imported", object_id=objs[1].id)])
+    resumed.close()
+    assert SyncJournal(journal.path).load().done_ids() == {objs[0].id, objs[1].id}
+
+
+def test_torn_last_line_and_completion(tmp_path):
+    objs = _objs(2)
+    journal = SyncJournal(tmp_path / "journal.jsonl")
+    journal.begin(objs)
+    journal.mark([objs[0].id], "skipped")
+    journal.close()
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"id": "{1}", "sta')
+    assert SyncJournal(journal.path).load().done_ids() == {objs[0].id}
+
+    journal.complete()
+    assert not journal.path.exists()
+    assert journal.load() is None
+
+
+def test_begin_replaces_previous_run(tmp_path):
+    journal = SyncJournal(tmp_path / "journal.jsonl")
+    journal.begin(_objs(2))
+    journal.mark(["{0}"], "imported")
+    second = journal.begin(_objs(1))
+    journal.close()
+    run = journal.load()
+    assert run.run_id == second
+    assert run.done_ids() == set()
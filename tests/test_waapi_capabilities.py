@@ -0,0 +1,11 @@
+def test_capabilities_are_cached(fake_wwise):
+    wwise, pool = fake_wwise
+    with pool.acquire() as pc:
+        calls = wwise.calls.get("ak.wwise.core.getInfo", 0)
+        caps = pool.capabilities(pc)
+        assert pool.capabilities(pc) is caps
+        assert wwise.calls["ak.wwise.core.getInfo"] == calls + 1
+        assert caps.version_year == wwise.version_year
+        pool.invalidate_capabilities()
+        pool.capabilities(pc)
+        assert wwise.calls["ak.wwise.core.getInfo"] == calls + 2
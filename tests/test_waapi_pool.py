@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+
+from conftest import run_with_timeout
+from utils.wwise_waapi import WaapiConnectionPool
+
+pytest.importorskip("waapi")
+from waapi import CannotConnectToWaapiException  # noqa: E402
+
+
+def test_idle_client_is_reused(fake_wwise):
+    _, pool = fake_wwise
+    with pool.acquire() as first:
+        first.call("ak.wwise.core.getInfo")
+    with pool.acquire() as second:
+        second.call("ak.wwise.core.getInfo")
+    assert second is first
+    assert pool.stats.connects == 1
+
+
+def test_waits_for_a_free_connection(fake_wwise):
+    _, pool = fake_wwise
+    pool.max_connections = 2
+    held, release = threading.Barrier(3), threading.Event()
+    clients = []
+
+    def hold():
+        with pool.acquire() as pc:
+            clients.append(pc)
+            held.wait()
+            release.wait()
+
+    holders = [threading.Thread(target=hold) for _ in range(2)]
+    for t in holders:
+        t.start()
+    held.wait()
+    third = []
+
+    def wait():
+        with pool.acquire() as pc:
+            third.append(pc)
+
+    waiter = threading.Thread(target=wait)
+    waiter.start()
+    waiter.join(0.3)
+    assert waiter.is_alive()  # both connections are taken
+    release.set()
+    waiter.join(5)
+    assert third[0] in clients
+    for t in holders:
+        t.join()
+    assert clients[0] is not clients[1]
+    assert pool.stats.connects == 2
+
+
+def test_unhealthy_client_is_replaced(fake_wwise):
+    _, pool = fake_wwise
+    pool.health_check_interval = 0
+    with pool.acquire() as first:
+        pass
+
+    def dead(*args, **kwargs):
+        raise RuntimeError("connection reset")
+    first.call = dead
+    with pool.acquire() as second:
+        assert second.call("ak.wwise.core.getInfo")
+    assert second is not first
+    assert not first.is_connected()
+    assert pool._open == 1
+
+
+def test_dropped_client_is_not_put_back(fake_wwise):
+    _, pool = fake_wwise
+    with pool.acquire() as first:
+        first._client.disconnect()
+    assert pool._idle == [] and pool._open == 0
+    with pool.acquire() as second:
+        assert second.is_connected()
+    assert second is not first
+
+
+def test_close_idle(fake_wwise):
+    _, pool = fake_wwise
+    with pool.acquire():
+        pass
+    assert pool.close_idle(max_idle=3600) == 0
+    assert pool.close_idle(max_idle=0) == 1
+    assert pool._open == 0
+    with pool.acquire() as pc:
+        assert pc.is_connected()
+    assert pool.stats.connects == 2
+
+
+def test_unreachable_wwise_frees_the_slot():
+    pool = WaapiConnectionPool("ws://127.0.0.1:9/waapi")
+
+    def acquire():
+        with pytest.raises(CannotConnectToWaapiException):
+            with pool.acquire():
+                pass
+    run_with_timeout(acquire)
+    assert pool._open == 0
+    assert pool.stats.connect_failures == 1
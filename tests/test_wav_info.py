@@ -0,0 +1,63 @@
+import struct
+
+import pytest
+
+from fake_reaper import write_wav
+from utils.wav_info import (ExpectedFormat, WavFormatError, check_wav, check_wavs,
+                            expected_from_render_format, parse_wav, read_wav_info)
+
+
+def _wav_bytes(data=b"\0" * 12, channels=1, rate=48000, bits=16, extra_chunk=b"", riff=b"RIFF"):
+    align = channels * bits // 8
+    fmt = struct.pack("<HHIIHH", 1, channels, rate, rate * align, align, bits)
+    body = (b"WAVE" + extra_chunk + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+            + b"data" + struct.pack("<I", len(data)) + data)
+    return riff + struct.pack("<I", len(body)) + body
+
+
+def test_parse_header(tmp_path):
+    path = tmp_path / "a.wav"
+    write_wav(path, 0.5, sample_rate=44100, bits=24, channels=2)
+    info = read_wav_info(path)
+    assert (info.sample_rate, info.bits, info.channels, info.block_align) == (44100, 24, 2, 6)
+    assert info.frames == 22050
+    assert info.duration == pytest.approx(0.5)
+
+
+def test_skips_other_chunks():
+    # An odd-sized chunk is padded to an even length
+    buf = _wav_bytes(extra_chunk=b"LIST" + struct.pack("<I", 3) + b"abc\0")
+    info = parse_wav(buf, len(buf))
+    assert info.data_size == 12
+    assert buf[info.data_offset:info.data_offset + 12] == b"\0" * 12
+
+
+@pytest.mark.parametrize("buf, message", [
+    (b"RIFF", "truncated header"),
+    (b"RIFX" + b"\0" * 8, "not a RIFF/WAVE"),
+    (_wav_bytes()[:-4], "RIFF size exceeds"),
+    (_wav_bytes(data=b""), "no audio data"),
+    (_wav_bytes(data=b"\0" * 3), "whole number of frames"),
+    (b"RIFF" + struct.pack("<I", 4) + b"WAVE", "no fmt chunk"),
+])
+def test_parse_errors(buf, message):
+    with pytest.raises(WavFormatError, match=message):
+        parse_wav(buf, len(buf))
+
+
+def test_check_wav(tmp_path):
+    good = tmp_path / "good.wav"
+    write_wav(good, 0.01, bits=24)
+    truncated = tmp_path / "truncated.wav"
+    truncated.write_bytes(good.read_bytes()[:-10])
+    empty = tmp_path / "empty.wav"
+    empty.write_bytes(b"")
+    expected = expected_from_render_format("ZXZhdxgAAQ==")  # WAV 24-bit
+    assert expected == ExpectedFormat(bits=24)
+
+    checks = check_wavs([good, truncated, empty, tmp_path / "gone.wav"], expected)
+    assert checks[good].ok
+    assert "incomplete" in checks[truncated].reason
+    assert checks[empty].reason == "empty file"
+    assert not checks[tmp_path / "gone.wav"].ok
+    assert check_wav(good, ExpectedFormat(bits=16)).reason == "24-bit, expected 16"
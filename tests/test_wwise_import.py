@@ -0,0 +1,64 @@
+import wave
+
+import pytest
+
+from conftest import run_with_timeout
+from utils.wwise_waapi import import_audio_to_wwise
+
+
+def _tasks(wwise, tmp_path, count):
+    tasks = []
+    for o in wwise.objects[:count]:
+        path = tmp_path / f"{o['name']}.wav"
+        with wave.open(str(path), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(48000)
+            f.writeframes(b"\0\0" * 16)
+        tasks.append({"objectPath": o["path"], "audioFile": str(path), "objectId": o["id"]})
+    return tasks
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_batched_import(fake_wwise, tmp_path, workers):
+    wwise, pool = fake_wwise
+    tasks = _tasks(wwise, tmp_path, 40)
+    report = run_with_timeout(lambda: import_audio_to_wwise(tasks, pool, batch_size=5, max_workers=workers))
+    assert report.imported == 40 and report.failed == 0
+    assert wwise.calls["ak.wwise.core.audio.import"] == 8
+    assert {o.object_id for o in report.outcomes} == {t["objectId"] for t in tasks}
+
+
+def test_concurrent_import_uses_several_connections(fake_wwise, tmp_path):
+    wwise, pool = fake_wwise
+    tasks = _tasks(wwise, tmp_path, 40)
+    report = run_with_timeout(lambda: import_audio_to_wwise(tasks, pool, batch_size=5, max_workers=4))
+    assert report.imported == 40
+    assert pool.stats.as_dict()["connects"] > 1
+    # The pool stays usable afterwards
+    report = run_with_timeout(lambda: import_audio_to_wwise(tasks[:5], pool, batch_size=5, max_workers=4))
+    assert report.imported == 5
+
+
+def test_bad_item_only_fails_itself(fake_wwise, tmp_path):
+    wwise, pool = fake_wwise
+    tasks = _tasks(wwise, tmp_path, 6)
+    tasks[2] = dict(tasks[2], objectPath="\\Actor-Mixer Hierarchy\\Nope")
+    tasks[4] = dict(tasks[4], audioFile=str(tmp_path / "missing.wav"))
+    report = run_with_timeout(lambda: import_audio_to_wwise(tasks, pool, batch_size=3, retries=1))
+    failed = {o.object_path: o.reason for o in report.failures()}
+    assert report.imported == 4
+    assert set(failed) == {tasks[2]["objectPath"], tasks[4]["objectPath"]}
+    assert failed[tasks[4]["objectPath"]] == "audio file not found"
+
+
+def test_item_wwise_skips_is_failed_with_the_log_reason(fake_wwise, tmp_path):
+    wwise, pool = fake_wwise
+    tasks = _tasks(wwise, tmp_path, 4)
+    wwise.reject_imports = {tasks[1]["objectPath"]}
+    report = run_with_timeout(lambda: import_audio_to_wwise(tasks, pool, batch_size=4))
+    assert report.imported == 3
+    assert wwise.calls["ak.wwise.core.audio.import"] == 1  # not retried: the call itself succeeded
+    [failure] = report.failures()
+    assert failure.object_path == tasks[1]["objectPath"]
+    assert "unsupported format" in failure.reason